@@ -37,6 +37,11 @@ from configvalidator.tools.basics import remove_data, add_data, load_validator
 from configvalidator.tools.exceptions import ConfigValidatorException, ParserException, ValidatorException, InitException, LoadException, ConfigParserException
 from configvalidator.tools.configValidator import ConfigValidator
 from configvalidator.tools.result import AttributeDict
+from configvalidator.tools.batch import parse_many
+from configvalidator.tools.resultcache import ResultCache
+from configvalidator.tools.ini import IniReader, MmapIniReader
+from configvalidator.tools.profile import ParseProfiler
+from configvalidator.tools.stats import ParseStats
 
 from configvalidator.validators import load as _load_validators
 from configvalidator.features.sections import load as _load_feature_sections
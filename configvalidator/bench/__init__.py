@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+Benchmarks for the configvalidator module.
+
+Every module in this package can be executed on its own, e.g.::
+
+    python -m configvalidator.bench.plan
+"""
+
+import timeit
+import logging
+from configvalidator import ConfigValidator
+
+
+logger = logging.getLogger(__name__)
+
+
+class DictConfigParser(object):
+
+    """minimal in memory implementation of the ConfigParser interface"""
+
+    def __init__(self, data_dict=None):
+        self._data = {} if data_dict is None else data_dict
+
+    def has_option(self, section, option):
+        return section in self._data and option in self._data[section]
+
+    def get(self, section, option):
+        return self._data[section][option]
+
+    def options(self, section):
+        return list(self._data[section].keys())
+
+    def read(self, filenames):
+        return []
+
+
+def measure(name, fn, number=None, repeat=3, **info):
+    """time a function call
+
+    Args:
+        name: the benchmark name
+        fn: function without arguments
+        number: calls per repetition. If None the number is estimated, so that one repetition takes ~0.2 seconds.
+        repeat: number of repetitions, the best one is reported
+        info: additional values for the result record
+
+    Returns:
+        dict with the name, the best time per call in seconds and the info values
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange() if hasattr(timer, "autorange") else (10, None)
+    times = timer.repeat(repeat=repeat, number=number)
+    record = dict(name=name, seconds=min(times) / number, number=number, repeat=repeat)
+    record.update(info)
+    return record
+
+
+def gen_schema(options, sections=10, validator=None, value=None):
+    """generate a config dict and matching ini data
+
+    Args:
+        options: total number of options
+        sections: number of sections the options are distributed to
+        validator: validator configuration for every option. Default is an int validator with min/max.
+        value: function which returns the ini value for the option index. Default are numbers from 0 to 99.
+
+    Returns:
+        tuple of config dict and ini data dict
+    """
+    if validator is None:
+        validator = {"type": "int", "min": 0, "max": 100}
+    if value is None:
+        value = lambda idx: str(idx % 100)
+    sections = max(1, min(sections, options))
+    config_dict = {}
+    data = {}
+    for idx in range(options):
+        section = "section_{idx}".format(idx=idx % sections)
+        option = "option_{idx}".format(idx=idx)
+        config_dict.setdefault(section, {})[option] = {"validator": validator}
+        data.setdefault(section, {})[option] = value(idx)
+    return config_dict, data
+
+
+def gen_validator(data):
+    return ConfigValidator(DictConfigParser(data))
+
+
+def print_report(records, out=None):
+    """print benchmark records as a table"""
+    import sys
+    out = sys.stdout if out is None else out
+    width = max([len(r["name"]) for r in records] + [4])
+    for record in records:
+        out.write("{name:<{width}} {us:>14.2f} us\n".format(name=record["name"], width=width, us=record["seconds"] * 1e6))
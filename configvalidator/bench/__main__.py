@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+benchmark suite: every registered validator and *ConfigValidator.parse* for
+synthetic schemas, dependency graphs, raw_section_input sections, sub_ini trees
+and the ip validators for generated firewall addresses::
+
+    python -m configvalidator.bench --json current.json
+    python -m configvalidator.bench --compare baseline.json --threshold 0.2
+
+With *--compare* every benchmark that is slower than in the baseline by more
+than the threshold is reported and the exit code is 1.
+"""
+
+import sys
+import json
+import platform
+import argparse
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+from configvalidator.bench import dependencies, features, ip, validators
+
+
+def run(quick=False):
+    """run all benchmarks and return the records"""
+    records = validators.benchmarks()
+    sizes = (10, 1000) if quick else (10, 1000, 100000)
+    for size in sizes:
+        config_dict, data = gen_schema(size)
+        cv = gen_validator(data)
+        schema_plan = ConfigValidator.compile(config_dict)
+        records.append(measure("parse/{size}".format(size=size), lambda: cv.parse(schema_plan), options=size))
+    records.extend(dict(r, name="depends/" + r["name"]) for r in dependencies.benchmarks(sizes=(100, 1000) if quick else (100, 1000, 10000)))
+    records.extend(features.benchmarks(sizes=(10, 1000)))
+    records.extend(ip.benchmarks(count=1000 if quick else 10000))
+    return records
+
+
+def compare(records, baseline, threshold=0.2):
+    """compare records with the records of a baseline
+
+    Args:
+        records: the current records
+        baseline: the records of the baseline
+        threshold: allowed slowdown, 0.2 is 20 %
+
+    Returns:
+        list of (name, baseline seconds, seconds, ratio) for every regression
+    """
+    base = dict((r["name"], r["seconds"]) for r in baseline if "seconds" in r)
+    res = []
+    for record in records:
+        if "seconds" not in record or not base.get(record["name"]):
+            continue
+        ratio = record["seconds"] / base[record["name"]]
+        if ratio > 1 + threshold:
+            res.append((record["name"], base[record["name"]], record["seconds"], ratio))
+    return res
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m configvalidator.bench", description="configvalidator benchmark suite")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON file of an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown against the baseline (default 0.2 = 20%%)")
+    parser.add_argument("--quick", action="store_true", help="skip the largest schemas")
+    args = parser.parse_args(argv)
+    records = run(quick=args.quick)
+    result = dict(python=platform.python_version(), implementation=platform.python_implementation(), records=records)
+    if args.json == "-":
+        json.dump(result, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        print_report([r for r in records if "seconds" in r])
+        if args.json is not None:
+            with open(args.json, "w") as f:
+                json.dump(result, f, indent=2, sort_keys=True)
+    if args.compare is None:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(records, baseline["records"], threshold=args.threshold)
+    out = sys.stderr if args.json == "-" else sys.stdout
+    for name, base_seconds, seconds, ratio in regressions:
+        out.write("REGRESSION {name}: {base:.2f} us -> {current:.2f} us ({ratio:.2f}x)\n".format(
+            name=name, base=base_seconds * 1e6, current=seconds * 1e6, ratio=ratio))
+    if not regressions:
+        out.write("no regressions against {path}\n".format(path=args.compare))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
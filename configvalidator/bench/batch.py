@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+*parse_many* over generated ini files with different numbers of workers::
+
+    python -m configvalidator.bench.batch
+"""
+
+import os
+import shutil
+import tempfile
+import multiprocessing
+from configvalidator import parse_many
+from configvalidator.bench import gen_schema, measure, print_report
+
+
+def write_files(directory, data, count):
+    lines = []
+    for section, options in sorted(data.items()):
+        lines.append("[{section}]".format(section=section))
+        for option, value in sorted(options.items()):
+            lines.append("{option} = {value}".format(option=option, value=value))
+    content = "\n".join(lines) + "\n"
+    sources = []
+    for idx in range(count):
+        path = os.path.join(directory, "host_{idx}.ini".format(idx=idx))
+        with open(path, "w") as f:
+            f.write(content)
+        sources.append(path)
+    return sources
+
+
+def benchmarks(files=2000, options=100, workers=None):
+    if workers is None:
+        workers = sorted(set([1, 2, multiprocessing.cpu_count()]))
+    config_dict, data = gen_schema(options)
+    directory = tempfile.mkdtemp()
+    try:
+        sources = write_files(directory, data, files)
+        records = []
+        for count in workers:
+            records.append(measure("parse_many/workers={count}/{files}".format(count=count, files=files),
+                                   lambda: sum(1 for _ in parse_many(config_dict, sources, workers=count)),
+                                   number=1, files=files, workers=count))
+        return records
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    serial = records[0]["seconds"]
+    for record in records:
+        print("{name:<32} speedup {factor:.2f}x".format(name=record["name"], factor=serial / record["seconds"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+parse schemas with dependencies (a long chain and a fan-out)::
+
+    python -m configvalidator.bench.dependencies
+"""
+
+from configvalidator.tools.compat import OrderedDict
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_validator, measure, print_report
+
+
+def _dep_option(option):
+    return {"validator": {"type": "int", "min": ("section", option)}, "depends": ["min"]}
+
+
+def gen_chain(size):
+    """every option depends on the previous one, the first one depends on the last option"""
+    options = OrderedDict()
+    options["option_0"] = _dep_option("root")
+    for idx in range(1, size):
+        options["option_{idx}".format(idx=idx)] = _dep_option("option_{idx}".format(idx=idx - 1))
+    options["root"] = "int"
+    return {"section": options}, {"section": dict((key, "1") for key in options)}
+
+
+def gen_fan_out(size):
+    """all options depend on the last option"""
+    options = OrderedDict()
+    for idx in range(size):
+        options["option_{idx}".format(idx=idx)] = _dep_option("root")
+    options["root"] = "int"
+    return {"section": options}, {"section": dict((key, "1") for key in options)}
+
+
+def benchmarks(sizes=(100, 1000, 10000)):
+    records = []
+    for shape, gen in [("chain", gen_chain), ("fan-out", gen_fan_out)]:
+        for size in sizes:
+            config_dict, data = gen(size)
+            cv = gen_validator(data)
+            plan = ConfigValidator.compile(config_dict)
+            records.append(measure("{shape}/{size}".format(shape=shape, size=size), lambda: cv.parse(plan), options=size))
+    return records
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    for record in records:
+        print("{name:<16} {us:>8.2f} us per option".format(name=record["name"], us=record["seconds"] * 1e6 / record["options"]))
+
+
+if __name__ == "__main__":
+    main()
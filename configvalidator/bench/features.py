@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+parse schemas with raw_section_input sections and sub_ini trees::
+
+    python -m configvalidator.bench.features
+"""
+
+import os
+import shutil
+import tempfile
+from six.moves import configparser
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_validator, measure, print_report
+
+
+def gen_raw_section(size):
+    """one raw_section_input section with *size* int options"""
+    config_dict = {"section": {"__feature__": "raw_section_input", "validator": {"type": "int", "min": 0, "max": 100}}}
+    data = {"section": dict(("option_{idx}".format(idx=idx), str(idx % 100)) for idx in range(size))}
+    return config_dict, data
+
+
+def gen_sub_ini(directory, depth, width):
+    """ini files as a tree: every file has *width* int options and *width* sub_ini options, up to *depth* levels
+
+    Returns:
+        tuple of config dict and the path of the root file
+    """
+    def write(level, path):
+        cp = configparser.RawConfigParser()
+        cp.add_section("section")
+        config = {}
+        for idx in range(width):
+            option = "option_{idx}".format(idx=idx)
+            cp.set("section", option, str(idx))
+            config[option] = "int"
+        if level < depth:
+            for idx in range(width):
+                option = "sub_{idx}".format(idx=idx)
+                sub_path = "{path}.{idx}".format(path=path, idx=idx)
+                cp.set("section", option, sub_path)
+                config[option] = {"feature": "sub_ini", "config": write(level + 1, sub_path)}
+        with open(path, "w") as f:
+            cp.write(f)
+        return {"section": config}
+    path = os.path.join(directory, "root.ini")
+    return write(1, path), path
+
+
+def benchmarks(sizes=(10, 1000), depth=3, width=3):
+    records = []
+    for size in sizes:
+        config_dict, data = gen_raw_section(size)
+        cv = gen_validator(data)
+        plan = ConfigValidator.compile(config_dict)
+        records.append(measure("raw_section_input/{size}".format(size=size), lambda: cv.parse(plan), options=size))
+    directory = tempfile.mkdtemp()
+    try:
+        config_dict, path = gen_sub_ini(directory, depth, width)
+        cp = configparser.RawConfigParser()
+        cp.read(path)
+        cv = ConfigValidator(cp)
+        plan = ConfigValidator.compile(config_dict)
+        files = sum(width ** level for level in range(depth))
+        records.append(measure("sub_ini/{depth}x{width}".format(depth=depth, width=width), lambda: cv.parse(plan), files=files))
+    finally:
+        shutil.rmtree(directory)
+    return records
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
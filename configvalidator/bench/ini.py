@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+*IniReader* and *MmapIniReader* against *RawConfigParser*: read a generated
+ini file and get every value (or the values of one section), plus the peak
+memory of the parser::
+
+    python -m configvalidator.bench.ini
+"""
+
+import os
+import shutil
+import tempfile
+from six.moves import configparser
+from configvalidator import IniReader, MmapIniReader
+from configvalidator.bench import measure, print_report
+
+
+def gen_ini(path, options, sections=100):
+    """write an ini file with the given number of options"""
+    with open(path, "w") as f:
+        for section_idx in range(sections):
+            f.write("[section_{idx}]\n".format(idx=section_idx))
+            for idx in range(section_idx, options, sections):
+                f.write("option_{idx} = value number {idx}\n".format(idx=idx))
+
+
+def read_all(cp_class, path, sections=None):
+    cp = cp_class()
+    cp.read(path)
+    for section in cp.sections()[:sections]:
+        for option in cp.options(section):
+            cp.get(section, option)
+    if hasattr(cp, "close"):
+        cp.close()
+
+
+def peak_memory(fn):
+    """peak memory in bytes of the function call or None (needs tracemalloc)"""
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmarks(size=200000):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "input.ini")
+        gen_ini(path, size)
+        records = []
+        for sections, label in [(None, "all"), (1, "one_section")]:
+            for name, cp_class in [("RawConfigParser", configparser.RawConfigParser), ("IniReader", IniReader), ("MmapIniReader", MmapIniReader)]:
+                fn = lambda: read_all(cp_class, path, sections)
+                records.append(measure(
+                    "{name}/{label}/{size}".format(name=name, label=label, size=size),
+                    fn,
+                    number=1,
+                    options=size,
+                    file_size=os.path.getsize(path),
+                    peak_memory=peak_memory(fn)))
+        return records
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    for record in records:
+        if record["peak_memory"] is not None:
+            print("{name}: peak memory {mib:.1f} MiB".format(name=record["name"], mib=record["peak_memory"] / 2.0 ** 20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+throughput of the ip validators for addresses of generated firewall configs::
+
+    python -m configvalidator.bench.ip
+"""
+
+import random
+from configvalidator.tools.basics import DATA_VALIDATOR
+from configvalidator.bench import measure, print_report
+
+
+def gen_ipv4(rnd, invalid=0.1):
+    """one address of a firewall rule: mostly private hosts, some public ones and some typos"""
+    kind = rnd.random()
+    if kind < invalid:
+        # typical typos: leading zeros, byte overflow, missing byte
+        return rnd.choice([
+            "10.0.{0}.0{1}".format(rnd.randint(0, 255), rnd.randint(1, 9)),
+            "192.168.{0}.{1}".format(rnd.randint(0, 255), rnd.randint(256, 999)),
+            "172.16.{0}".format(rnd.randint(0, 255)),
+        ])
+    if kind < 0.5:
+        return "10.{0}.{1}.{2}".format(rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(1, 254))
+    if kind < 0.7:
+        return "192.168.{0}.{1}".format(rnd.randint(0, 255), rnd.randint(1, 254))
+    if kind < 0.8:
+        return "172.{0}.{1}.{2}".format(rnd.randint(16, 31), rnd.randint(0, 255), rnd.randint(1, 254))
+    return "{0}.{1}.{2}.{3}".format(rnd.randint(1, 223), rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(1, 254))
+
+
+def gen_ipv6(rnd, invalid=0.1):
+    """one ipv6 address of a firewall rule: ula and link local hosts, documentation prefixes, mapped ipv4 addresses and typos"""
+    kind = rnd.random()
+    if kind < invalid:
+        return rnd.choice([
+            "fd00:{0:x}::{1:x}::1".format(rnd.randint(0, 0xffff), rnd.randint(0, 0xffff)),
+            "2001:db8:{0:x}:{1:x}1".format(rnd.randint(0, 0xffff), rnd.randint(0x10000, 0xfffff)),
+            "fe80:{0:x}:{1:x}".format(rnd.randint(0, 0xffff), rnd.randint(0, 0xffff)),
+        ])
+    if kind < 0.4:
+        return "fd{0:02x}:{1:x}:{2:x}::{3:x}".format(rnd.randint(0, 255), rnd.randint(0, 0xffff), rnd.randint(0, 0xffff), rnd.randint(1, 0xffff))
+    if kind < 0.6:
+        return "fe80::{0:x}:{1:x}:{2:x}:{3:x}".format(*[rnd.randint(0, 0xffff) for _ in range(4)])
+    if kind < 0.7:
+        return "::ffff:{0}".format(gen_ipv4(rnd, invalid=0))
+    return "2001:0db8:{0:04x}:{1:04x}:{2:04x}:{3:04x}:{4:04x}:{5:04x}".format(*[rnd.randint(0, 0xffff) for _ in range(6)])
+
+
+def gen_mixed(rnd, invalid=0.1):
+    """dual stack configs: 70 % ipv4 and 30 % ipv6 addresses"""
+    if rnd.random() < 0.7:
+        return gen_ipv4(rnd, invalid)
+    return gen_ipv6(rnd, invalid)
+
+
+def gen_addresses(count, seed=42, gen=gen_ipv4):
+    rnd = random.Random(seed)
+    return [gen(rnd) for _ in range(count)]
+
+
+CORPORA = {
+    "v4": gen_ipv4,
+    "v6": gen_ipv6,
+    "mixed": gen_mixed,
+}
+
+
+# benchmark name -> (validator name, init parameter, corpus)
+VALIDATORS = {
+    "ipv4": ("ipv4", {}, "v4"),
+    "ipv4/private": ("ipv4", {"private": True}, "v4"),
+    "ipv4/cidr": ("ipv4", {"cidr": "10.0.0.0/8"}, "v4"),
+    "ipv6": ("ipv6", {}, "v6"),
+    "ipv6/private": ("ipv6", {"private": True}, "v6"),
+    "ipv6/cidr": ("ipv6", {"cidr": "2001:db8::/32"}, "v6"),
+    "ip": ("ip", {}, "v4"),
+    "ip/mixed": ("ip", {}, "mixed"),
+}
+
+
+def gen_networks(count, seed=7):
+    """ipv4 allowlist: /24 to /32 networks in 10.0.0.0/8 and public space"""
+    rnd = random.Random(seed)
+    res = []
+    for _ in range(count):
+        bits = rnd.choice([24, 28, 30, 32])
+        first = rnd.choice([10, rnd.randint(1, 223)])
+        res.append("{0}.{1}.{2}.{3}/{4}".format(first, rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(0, 255), bits))
+    return res
+
+
+def _validate_all(validator, addresses):
+    valid = 0
+    for address in addresses:
+        if validator.try_validate(address)[0]:
+            valid += 1
+    return valid
+
+
+def benchmarks(count=10000, names=None, network_count=20000):
+    """one record per validator configuration, *addresses_per_second* is the throughput"""
+    corpora = dict((corpus, gen_addresses(count, gen=gen)) for corpus, gen in CORPORA.items())
+    records = []
+    for name in sorted(VALIDATORS if names is None else names):
+        validator_name, kwargs, corpus = VALIDATORS[name]
+        validator = DATA_VALIDATOR[validator_name](**kwargs)
+        addresses = corpora[corpus]
+        record = measure("ip/{name}/{count}".format(name=name, count=count), lambda: _validate_all(validator, addresses), addresses=count, corpus=corpus)
+        record["addresses_per_second"] = count / record["seconds"]
+        records.append(record)
+    if names is None:
+        # allowlist and denylist with network_count networks
+        addresses = corpora["v4"]
+        networks = gen_networks(network_count)
+        for kwarg in ("allowed_networks", "denied_networks"):
+            validator = DATA_VALIDATOR["ipv4"](**{kwarg: networks})
+            record = measure("ip/ipv4/{kwarg}_{networks}/{count}".format(kwarg=kwarg, networks=network_count, count=count), lambda: _validate_all(validator, addresses),
+                             addresses=count, corpus="v4", networks=network_count)
+            record["addresses_per_second"] = count / record["seconds"]
+            records.append(record)
+    return records
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    for record in records:
+        print("{name}: {rate:,.0f} addresses/s".format(name=record["name"], rate=record["addresses_per_second"]))
+
+
+if __name__ == "__main__":
+    main()
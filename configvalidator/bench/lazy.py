@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+full parse against a lazy parse, which reads the options of one section::
+
+    python -m configvalidator.bench.lazy
+"""
+
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+
+
+def read_section(cv, plan, section):
+    res = cv.parse(plan, lazy=True)
+    return dict(res[section])
+
+
+def benchmarks(size=10000):
+    config_dict, data = gen_schema(size, sections=100)
+    plan = ConfigValidator.compile(config_dict)
+    cv = gen_validator(data)
+    return [
+        measure("parse/{size}".format(size=size), lambda: cv.parse(plan), options=size),
+        measure("lazy_one_section/{size}".format(size=size), lambda: read_section(cv, plan, "section_0"), options=size),
+        measure("lazy_validate_all/{size}".format(size=size), lambda: cv.parse(plan, lazy=True).validate_all(), options=size),
+    ]
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+compares *ConfigValidator.parse* with a config dict against a compiled plan::
+
+    python -m configvalidator.bench.plan
+"""
+
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+
+
+def benchmarks(sizes=(10, 100, 1000)):
+    records = []
+    for size in sizes:
+        config_dict, data = gen_schema(size)
+        cv = gen_validator(data)
+        plan = ConfigValidator.compile(config_dict)
+        records.append(measure("parse[dict]/{size}".format(size=size), lambda: cv.parse(config_dict), options=size))
+        records.append(measure("parse[plan]/{size}".format(size=size), lambda: cv.parse(plan), options=size))
+    return records
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    by_name = dict((r["name"], r["seconds"]) for r in records)
+    for name in sorted(by_name):
+        if name.startswith("parse[dict]/"):
+            size = name.split("/")[1]
+            print("speedup {size:>6} options: {factor:.2f}x".format(
+                size=size, factor=by_name[name] / by_name["parse[plan]/" + size]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+attribute access (result.section.option) on a parse result::
+
+    python -m configvalidator.bench.result_access
+"""
+
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+
+
+def benchmarks(size=1000):
+    config_dict, data = gen_schema(size)
+    res = gen_validator(data).parse(ConfigValidator.compile(config_dict))
+    # one section with size / 10 options
+    return [
+        measure("attribute/{size}".format(size=size), lambda: res.section_0.option_0, options=size),
+        measure("item/{size}".format(size=size), lambda: res["section_0"]["option_0"], options=size),
+    ]
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
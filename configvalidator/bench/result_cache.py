@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+parse of an ini file against a hit of the *ResultCache* (memory and disk)::
+
+    python -m configvalidator.bench.result_cache
+"""
+
+import os
+import shutil
+import tempfile
+from configvalidator import ConfigValidator, ResultCache
+from configvalidator.bench import gen_schema, measure, print_report
+
+
+def benchmarks(size=1000):
+    config_dict, data = gen_schema(size)
+    plan = ConfigValidator.compile(config_dict)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "host.ini")
+        with open(path, "w") as f:
+            for section, options in sorted(data.items()):
+                f.write("[{section}]\n".format(section=section))
+                for option, value in sorted(options.items()):
+                    f.write("{option} = {value}\n".format(option=option, value=value))
+        memory = ResultCache()
+        memory.parse(path, plan)
+        disk_dir = os.path.join(tmp_dir, "cache")
+        ResultCache(directory=disk_dir).parse(path, plan)
+
+        def disk_hit():
+            ResultCache(maxsize=0, directory=disk_dir).parse(path, plan)
+        return [
+            measure("parse/{size}".format(size=size), lambda: ResultCache(maxsize=0).parse(path, plan), options=size),
+            measure("memory_hit/{size}".format(size=size), lambda: memory.parse(path, plan), options=size),
+            measure("disk_hit/{size}".format(size=size), disk_hit, options=size),
+        ]
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
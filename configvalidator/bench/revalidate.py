@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+full parse against *revalidate* after one changed option::
+
+    python -m configvalidator.bench.revalidate
+"""
+
+import copy
+from configvalidator import ConfigValidator
+from configvalidator.bench import DictConfigParser, gen_schema, gen_validator, measure, print_report
+
+
+def benchmarks(size=3000):
+    config_dict, data = gen_schema(size, validator={"type": "or", "validators": ["email", {"type": "int", "max": 100}]})
+    plan = ConfigValidator.compile(config_dict)
+    cv = gen_validator(data)
+    previous = cv.parse(plan, keep_state=True)
+    new_data = copy.deepcopy(data)
+    new_data["section_0"]["option_0"] = "42"
+    new_cp = DictConfigParser(new_data)
+    new_cv = ConfigValidator(new_cp)
+    return [
+        measure("parse/{size}".format(size=size), lambda: new_cv.parse(plan), options=size),
+        measure("revalidate/{size}".format(size=size), lambda: cv.revalidate(previous, new_cp), options=size),
+    ]
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    print("speedup: {factor:.2f}x".format(factor=records[0]["seconds"] / records[1]["seconds"]))
+
+
+if __name__ == "__main__":
+    main()
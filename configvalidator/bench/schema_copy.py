@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+time and memory of *ConfigValidator.compile* with read only views against
+the former json round trip copy of the config dict::
+
+    python -m configvalidator.bench.schema_copy
+"""
+
+import json
+from configvalidator import ConfigValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+VALIDATOR = {"type": "or", "validators": [{"type": "int", "min": 0, "max": 100}, "email", {"type": "str", "max_length": 10}]}
+
+
+def json_copy_compile(config_dict):
+    return ConfigValidator.compile(json.loads(json.dumps(config_dict)))
+
+
+def peak_memory(fn):
+    """peak of the allocated memory in bytes while fn is running or None"""
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmarks(size=5000):
+    config_dict, data = gen_schema(size, validator=VALIDATOR)
+    cv = gen_validator(data)
+    records = []
+    for name, compile_fn in [("json-copy", json_copy_compile), ("view", ConfigValidator.compile)]:
+        records.append(measure("compile[{name}]/{size}".format(name=name, size=size),
+                               lambda: compile_fn(config_dict),
+                               options=size,
+                               peak_bytes=peak_memory(lambda: compile_fn(config_dict))))
+        records.append(measure("parse[{name}]/{size}".format(name=name, size=size),
+                               lambda: cv.parse(compile_fn(config_dict)),
+                               options=size,
+                               peak_bytes=peak_memory(lambda: cv.parse(compile_fn(config_dict)))))
+    return records
+
+
+def main():
+    records = benchmarks()
+    print_report(records)
+    for record in records:
+        if record["peak_bytes"] is not None:
+            print("{name:<24} peak {kib:>10.1f} KiB".format(name=record["name"], kib=record["peak_bytes"] / 1024.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+serial parse against a parse with threads for blocking validators.
+"slow_io" simulates a validator that waits 1ms (e.g. a network file system)::
+
+    python -m configvalidator.bench.threads
+"""
+
+import os
+import time
+from configvalidator import ConfigValidator
+from configvalidator.validators import FileValidator
+from configvalidator.bench import gen_schema, gen_validator, measure, print_report
+
+
+class SlowIoValidator(FileValidator):
+    name = "bench_slow_io"
+    cacheable = True
+
+    def validate(self, value):
+        time.sleep(0.001)
+        return super(SlowIoValidator, self).validate(value)
+
+
+def benchmarks(size=200, threads=(1, 4, 16)):
+    records = []
+    path = os.path.abspath(__file__)
+    for name in ["file", "bench_slow_io"]:
+        config_dict, data = gen_schema(size, validator=name, value=lambda idx: path)
+        plan = ConfigValidator.compile(config_dict)
+        cv = gen_validator(data)
+        records.append(measure("{name}/serial/{size}".format(name=name, size=size), lambda: cv.parse(plan), options=size))
+        for count in threads:
+            records.append(measure("{name}/threads={count}/{size}".format(name=name, count=count, size=size),
+                                   lambda: cv.parse(plan, threads=count), options=size))
+    return records
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+parse with and without the validator instance cache::
+
+    python -m configvalidator.bench.validator_cache
+"""
+
+from configvalidator import ConfigValidator
+from configvalidator.tools.cache import LRUCache
+from configvalidator.bench import DictConfigParser, gen_schema, measure, print_report
+
+
+VALIDATORS = [
+    ("int", {"type": "int", "max": 100}, lambda idx: str(idx % 100)),
+    ("ip", {"type": "ip", "private": False}, lambda idx: "10.0.0.{n}".format(n=idx % 256)),
+    ("or", {"type": "or", "validators": ["int", "email", {"type": "str", "max_length": 10}]}, lambda idx: str(idx)),
+]
+
+
+def benchmarks(size=500):
+    records = []
+    for name, validator, value in VALIDATORS:
+        config_dict, data = gen_schema(size, validator=validator, value=value)
+        plan = ConfigValidator.compile(config_dict)
+        uncached = ConfigValidator(DictConfigParser(data), validator_cache=None)
+        cached = ConfigValidator(DictConfigParser(data), validator_cache=LRUCache(maxsize=64))
+        records.append(measure("{name}/uncached/{size}".format(name=name, size=size), lambda: uncached.parse(plan), options=size))
+        records.append(measure("{name}/cached/{size}".format(name=name, size=size), lambda: cached.parse(plan), options=size))
+    return records
+
+
+def main():
+    print_report(benchmarks())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+micro benchmark of *validate* for every registered validator::
+
+    python -m configvalidator.bench.validators
+"""
+
+import os
+import tempfile
+from configvalidator.tools.basics import DATA_VALIDATOR
+from configvalidator.bench import measure, print_report
+
+
+# validator name -> (init parameter, valid input)
+SAMPLES = {
+    "StripQuotationMark": ({"validator_name": "int"}, "'42'"),
+    "and": ({"validators": ["int", {"type": "str", "max_length": 5}]}, "42"),
+    "base64": ({}, "SGFsbG8gV2VsdA=="),
+    "bool": ({}, "true"),
+    "default": ({}, "value"),
+    "dict": ({}, "a:1,b:2"),
+    "dir": ({}, tempfile.gettempdir()),
+    "email": ({}, "user@example.com"),
+    "empty": ({}, ""),
+    "error": ({"error_msg": "always invalid"}, "value"),
+    "file": ({}, os.path.abspath(__file__)),
+    "float": ({"min": 0, "max": 100}, "42.5"),
+    "generalizedTime": ({}, "20150101120000Z"),
+    "int": ({"min": 0, "max": 100}, "42"),
+    "ip": ({}, "192.168.0.1"),
+    "ipv4": ({}, "192.168.0.1"),
+    "ipv6": ({}, "2001:db8::1"),
+    "item": ({"values": ["a", "b", "c"]}, "b"),
+    "items": ({"values": ["a", "b", "c"]}, "a, b"),
+    "json": ({}, '{"a": [1, 2, 3]}'),
+    "list": ({}, "[a, b, c]"),
+    "netbios": ({}, "HOST01"),
+    "not-empty": ({}, "value"),
+    "one-off": ({"validators": ["int", "email"]}, "42"),
+    "or": ({"validators": ["int", "email"]}, "user@example.com"),
+    "path": ({}, tempfile.gettempdir()),
+    "port": ({}, "8080"),
+    "regex": ({"pattern": "^[a-z]+[0-9]*$"}, "value42"),
+    "str": ({"min_length": 1, "max_length": 20}, "value"),
+    "strip_dir": ({}, "'{path}'".format(path=tempfile.gettempdir())),
+    "strip_file": ({}, "'{path}'".format(path=os.path.abspath(__file__))),
+    "strip_path": ({}, "'{path}'".format(path=tempfile.gettempdir())),
+    "url": ({}, "https://example.com:8443/path?query=1"),
+}
+
+
+# benchmark name -> (validator name, init parameter, inputs): variants with several inputs
+VARIANTS = {
+    "or/mixed": ("or", {"validators": ["email", "ipv6", {"type": "int", "min": 0}]}, ["42", "7", "1000", "user@example.com"]),
+    "or/mixed/short_circuit": ("or", {"validators": ["email", "ipv6", {"type": "int", "min": 0}], "short_circuit": True}, ["42", "7", "1000", "user@example.com"]),
+}
+
+
+# validators which need an environment
+SKIPPED = {
+    "cert": "needs certificate and key files",
+    "freePort": "binds a network port",
+}
+
+
+def _validate(validator, value):
+    try:
+        return validator.validate(value)
+    except Exception as e:
+        # e.g. the error validator, the time of the error handling is measured
+        return e
+
+
+def benchmarks(names=None):
+    """one record per validator. Validators without a sample (e.g. cert or custom validators) are reported as skipped."""
+    records = []
+    for name in sorted(DATA_VALIDATOR if names is None else names):
+        if name not in SAMPLES:
+            records.append(dict(name="validator/{name}".format(name=name), skipped=SKIPPED.get(name, "no sample input")))
+            continue
+        kwargs, value = SAMPLES[name]
+        validator = DATA_VALIDATOR[name](**kwargs)
+        records.append(measure("validator/{name}".format(name=name), lambda: _validate(validator, value)))
+    if names is None:
+        for name, (validator_name, kwargs, values) in sorted(VARIANTS.items()):
+            validator = DATA_VALIDATOR[validator_name](**kwargs)
+            records.append(measure("validator/{name}".format(name=name), lambda: [_validate(validator, value) for value in values], values=len(values)))
+    return records
+
+
+def main():
+    records = benchmarks()
+    print_report([record for record in records if "seconds" in record])
+    for record in records:
+        if "skipped" in record:
+            print("{name}: skipped ({reason})".format(name=record["name"], reason=record["skipped"]))
+
+
+if __name__ == "__main__":
+    main()
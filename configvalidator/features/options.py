@@ -4,10 +4,14 @@
 :license: Apache 2.0, see LICENSE for more details.
 """
 
+import os
 import configvalidator
-from configvalidator.tools.basics import load_validator_form_dict, load_validator, OptionFeature
+from collections import namedtuple
+from configvalidator.tools.basics import load_validator_form_dict, load_validator, OptionFeature, Validator
 from configvalidator.tools.exceptions import ParserException, ValidatorException
 from configvalidator.tools.configValidator import ParseObj
+from configvalidator.tools.plan import ValidatorStep, validator_cache_key
+from configvalidator.tools.view import DictView, Mapping
 
 
 def load():
@@ -29,21 +33,25 @@ For a detailed explanation see chapter *The default option feature behavior is a
 
     def parse_option(self, parse_obj, option_dict):
         assert isinstance(parse_obj, ParseObj)
-        assert isinstance(option_dict, dict)
+        assert isinstance(option_dict, Mapping)
+        DefaultOptionFeature.compile(parse_obj.current_option, option_dict).run(parse_obj)
+
+    @classmethod
+    def compile(cls, option, option_dict):
+        if cls.parse_option != DefaultOptionFeature.parse_option:
+            # subclass with its own parse logic
+            return super(DefaultOptionFeature, cls).compile(option, option_dict)
+        assert isinstance(option_dict, Mapping)
         validator_class, validator_class_dict = load_validator_form_dict(option_dict)
-        if "depends" in option_dict:
-            dependencies = option_dict["depends"]
-        else:
-            dependencies = None
+        dependencies = None
+        if "depends" in option_dict and option_dict["depends"] is not None:
+            dependencies = tuple(option_dict["depends"])
         if "default" in option_dict:
             default = option_dict["default"]
         else:
             default = None
-        parse_obj.add_value(
-            validator_class,
-            validator_class_dict,
-            dependencies_list=dependencies,
-            default=default)
+        return ValidatorStep(option, validator_class, DictView(validator_class_dict), dependencies, default,
+                             validator_cache_key(validator_class, validator_class_dict))
 
 
 class SubIniOptionFeature(OptionFeature):
@@ -72,19 +80,77 @@ So the result for the section/option is the parse ini file, rather than the file
 
     def parse_option(self, parse_obj, option_dict):
         self.parse_obj = parse_obj
-        parse_obj.add_value(validator_class=load_validator("file"),
-                            validator_init_dict={},
-                            dependencies_list=None,
-                            default=self._default,
-                            custom_validate_fn=self._custom_validate_fn)
-
-    def _custom_validate_fn(self, section, option, validator, raw_value):
-        validator.validate(raw_value)
-        cp_class = self.parse_obj.cp.__class__
-        cp_instance = cp_class(**self.parse_obj.cp_init_args)
-        cp_instance.read(raw_value)
-        cv = configvalidator.ConfigValidator(cp=cp_instance)
-        for k, v in self.parse_obj.context_data.items():
+        SubIniStep(parse_obj.current_option, self._cv_config, self._cv_feature_key, self._default).run(parse_obj)
+
+    @classmethod
+    def compile(cls, option, option_dict):
+        if cls.parse_option != SubIniOptionFeature.parse_option:
+            # subclass with its own parse logic
+            return super(SubIniOptionFeature, cls).compile(option, option_dict)
+        feature = cls(**option_dict)
+        return SubIniStep(option, feature._cv_config, feature._cv_feature_key, feature._default)
+
+
+class SubIniValidator(Validator):
+
+    """checks the file and parses it with an own ConfigValidator
+
+    used by the sub_ini feature. The nested parse is done in *validate*, so that it
+    can run in the thread pool of a parse with threads.
+    """
+    inactive = True
+    blocking = True
+
+    def __init__(self, cp_class, cp_init_args, config, feature_key, context_data, validator_cache, stats=None, keep_state=False):
+        self._file_validator = load_validator("file")()
+        self._cp_class = cp_class
+        self._cp_init_args = cp_init_args
+        self._config = config
+        self._feature_key = feature_key
+        self._context_data = context_data
+        self._validator_cache = validator_cache
+        # ParseStats of the parent parse or None
+        self._stats = stats
+        # the sub results keep their state if the parent result does (see sub_ini_paths)
+        self._keep_state = keep_state
+
+    def validate(self, value):
+        self._file_validator.validate(value)
+        cp_instance = self._cp_class(**self._cp_init_args)
+        cp_instance.read(value)
+        cv = configvalidator.ConfigValidator(cp=cp_instance, validator_cache=self._validator_cache)
+        for k, v in self._context_data.items():
             cv.add_data(k, v)
-        data = cv.parse(config_dict=self._cv_config, feature_key=self._cv_feature_key)
-        self.parse_obj.add(section, option, data)
+        if self._stats is None:
+            return cv.parse(config_dict=self._config, feature_key=self._feature_key, keep_state=self._keep_state)
+        res, stats = cv.parse(config_dict=self._config, feature_key=self._feature_key, with_stats=True, keep_state=self._keep_state)
+        self._stats.add_sub_ini(stats, os.path.getsize(value))
+        return res
+
+
+class SubIniStep(namedtuple("SubIniStep", ["option", "config", "feature_key", "default"])):
+
+    """compiled sub_ini option"""
+
+    __slots__ = ()
+
+    def _validator_init_dict(self, parse_obj):
+        return {
+            "cp_class": parse_obj.cp.__class__,
+            "cp_init_args": parse_obj.cp_init_args,
+            "config": self.config,
+            "feature_key": self.feature_key,
+            "context_data": parse_obj.context_data,
+            "validator_cache": parse_obj.validator_cache,
+            "stats": parse_obj.stats,
+            "keep_state": parse_obj.keep_state,
+        }
+
+    def run(self, parse_obj):
+        parse_obj.add_value(validator_class=SubIniValidator,
+                            validator_init_dict=self._validator_init_dict(parse_obj),
+                            dependencies_list=None,
+                            default=self.default)
+
+    def prefetch(self, parse_obj):
+        parse_obj.prefetch(SubIniValidator, self._validator_init_dict(parse_obj), default=self.default)
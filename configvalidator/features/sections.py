@@ -6,8 +6,10 @@
 
 import logging
 from configvalidator.tools.basics import load_option_feature, SectionFeature, load_validator_form_dict
-from configvalidator.tools.exceptions import ParserException
+from configvalidator.tools.exceptions import ParserException, ErrorRecord
 from configvalidator.tools.configValidator import ParseObj
+from configvalidator.tools.plan import CompiledSectionStep
+from configvalidator.tools.view import DictView
 from six import string_types
 
 logger = logging.getLogger(__name__)
@@ -31,18 +33,25 @@ The return value that can be assessed in the result dict under the current secti
 
     def parse_section(self, parse_obj, section_dict):
         assert isinstance(parse_obj, ParseObj)
-        for option, option_config_dict in section_dict.items():
-            parse_obj.current_option = option
-            option_class_name = "default"
-            if isinstance(option_config_dict, string_types):
-                option_config_dict = {"validator": option_config_dict}
-            else:
-                if "feature" in option_config_dict:
-                    option_class_name = option_config_dict["feature"]
-                    del option_config_dict["feature"]
-            option_class = load_option_feature(option_class_name)
-            option_instance = option_class(parse_obj, **option_config_dict)
-            option_instance.parse_option(parse_obj, option_config_dict)
+        self.compile(parse_obj.current_section, section_dict).run(parse_obj)
+
+    @classmethod
+    def compile(cls, section, section_dict):
+        options = []
+        try:
+            for option, option_config_dict in section_dict.items():
+                option_class_name = "default"
+                if isinstance(option_config_dict, string_types):
+                    option_config_dict = {"validator": option_config_dict}
+                else:
+                    if "feature" in option_config_dict:
+                        option_class_name = option_config_dict["feature"]
+                    option_config_dict = DictView(option_config_dict, exclude=("feature",))
+                option_class = load_option_feature(option_class_name)
+                options.append(option_class.compile(option, option_config_dict))
+        except Exception as e:
+            return CompiledSectionStep(section, tuple(options), e)
+        return CompiledSectionStep(section, tuple(options), None)
 
 
 class RawSectionInputFeature(SectionFeature):
@@ -109,9 +118,9 @@ The return value that can be assessed in the result dict under the current secti
             self._options_ok.append(option)
         except Exception as e:
             if self._raise_error:
-                raise ParserException("{option} - {error}".format(option=option, error=e))
+                raise ParserException.from_errors([ErrorRecord("raw_option", section, option, args={"error": e})])
             else:
-                logger.debug("skip error in option [{section}]{option}: {msg}".format(section=section, option=option, msg=str(e)))
+                logger.debug("skip error in option [%s]%s: %s", section, option, e)
             self._options_nok.append(option)
         if len(self._options_ok) + len(self._options_nok) == len(self._options_all):
             # if the last option from this section is handled -> check if min
@@ -121,9 +130,8 @@ The return value that can be assessed in the result dict under the current secti
             if self._max is not None and self._max < len(self._options_ok):
                 raise ParserException("maximum vailed options reached")
 
+    # the value is stored with parse_obj.validate, so revalidate can reuse the previous value
+    _custom_validate_fn.reuse_previous = True
+
     def _custom_error_fn(self, section, option, error):
-        msg = "error validating [{section}]: {msg}".format(section=section,
-                                                           option=option,
-                                                           msg=error)
-        logger.debug(msg)
-        self._parse_obj.errors.append(msg)
+        self._parse_obj.add_error(ErrorRecord("raw_value", section, option, self._validator_class, {"error": error}))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+asyncio support (Python 3.5+). This module is only imported by *ConfigValidator.aparse*.
+"""
+
+import asyncio
+import concurrent.futures
+from configvalidator.tools.parser import ParseObj
+from configvalidator.tools.configValidator import run_plan
+
+
+class AsyncCollector(object):
+
+    """executor for *ParseObj.prefetch* which only records the jobs
+
+    The jobs are executed by *aparse* on the event loop.
+    """
+
+    supports_async = True
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, validator_class, validator_init_dict, validator_key, raw_value):
+        future = concurrent.futures.Future()
+        self.jobs.append((future, fn, validator_class, validator_init_dict, validator_key, raw_value))
+        return future
+
+
+async def aparse(cv, plan, concurrency=16, executor=None, keep_state=False):
+    """parse the plan without blocking the event loop
+
+    Args:
+        cv: the ConfigValidator
+        plan: the compiled config dict
+        concurrency: maximum number of validations that run at the same time
+        executor: executor for validators without avalidate and for the serial part. None is the default executor of the loop.
+        keep_state: if True the result can be passed to *ConfigValidator.revalidate*
+
+    Returns:
+        the result (AttributeDict)
+
+    Raises:
+        ParserException: if the input is not valid
+    """
+    loop = asyncio.get_event_loop()
+    collector = AsyncCollector()
+    parse_obj = ParseObj(cv.cp, cp_init_args=cv.cp_init_args, context_data=dict(cv.data), validator_cache=cv.validator_cache, executor=collector, keep_state=keep_state)
+    plan.prefetch(parse_obj)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_job(future, fn, validator_class, validator_init_dict, validator_key, raw_value):
+        async with semaphore:
+            if getattr(validator_class, "avalidate", None) is None:
+                res = await loop.run_in_executor(executor, fn, validator_class, validator_init_dict, validator_key, raw_value)
+            else:
+                res = await _avalidate(parse_obj, validator_class, validator_init_dict, validator_key, raw_value)
+        future.set_result(res)
+
+    await asyncio.gather(*[run_job(*job) for job in collector.jobs])
+    # the prefetched results are used by the serial walk, which must not prefetch again
+    parse_obj.executor = None
+    return await loop.run_in_executor(executor, run_plan, plan, parse_obj)
+
+
+async def _avalidate(parse_obj, validator_class, validator_init_dict, validator_key, raw_value):
+    # same result structure as ParseObj._prefetch_job
+    try:
+        validator = parse_obj._get_validator(validator_class, validator_init_dict, validator_key)
+    except Exception as e:
+        return False, e
+    try:
+        return True, (await validator.avalidate(raw_value), None)
+    except Exception as e:
+        return True, (None, e)
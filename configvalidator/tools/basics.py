@@ -12,6 +12,8 @@ from six import string_types
 from collections import namedtuple
 from configvalidator.tools.exceptions import LoadException, ValidatorException
 from configvalidator.tools.parser import ParseObj
+from configvalidator.tools.plan import SectionStep, OptionStep
+from configvalidator.tools.view import DictView, Mapping
 
 
 logger = logging.getLogger(__name__)
@@ -90,14 +92,14 @@ def load_option_feature(feature_name):
 def load_validator_form_dict(option_dict):
     validator_class_name = "default"
     validator_class_dict = {}
-    if isinstance(option_dict, dict) and "validator" in option_dict and option_dict["validator"] is not None:
+    if isinstance(option_dict, Mapping) and "validator" in option_dict and option_dict["validator"] is not None:
         if isinstance(option_dict["validator"], string_types):
             validator_class_name = option_dict["validator"]
         else:
             validator_class_dict = option_dict["validator"]
             if "type" in validator_class_dict:
                 validator_class_name = validator_class_dict["type"]
-                del validator_class_dict["type"]
+                validator_class_dict = DictView(validator_class_dict, exclude=("type",))
     return load_validator(validator_class_name), validator_class_dict
 
 
@@ -112,9 +114,43 @@ def decorate_fn(func):
         if not isinstance(value, string_types):
             raise ValidatorException("input must be a string.")
         return func(self, value)
+    with_check_input_is_string.input_checked = True
     return with_check_input_is_string
 
 
+def decorate_try_fn(func):
+    def try_with_check_input_is_string(self, value):
+        if not isinstance(value, string_types):
+            return False, ValidatorException("input must be a string.")
+        return func(self, value)
+    try_with_check_input_is_string.input_checked = True
+    return try_with_check_input_is_string
+
+
+def validate_by_try(try_validate):
+    """validate for classes which only implement try_validate
+
+    the function of the class is used (not self.try_validate), so that
+    subclasses which call the validate method of this class don't end in a loop.
+    """
+    def validate(self, value):
+        ok, res = try_validate(self, value)
+        if ok:
+            return res
+        raise res
+    return validate
+
+
+def try_by_validate(validate):
+    """try_validate for classes which only implement validate (see validate_by_try)"""
+    def try_validate(self, value):
+        try:
+            return True, validate(self, value)
+        except Exception as e:
+            return False, e
+    return try_validate
+
+
 class CollectMetaclass(abc.ABCMeta):
 
     """Metaclass which safes the class, so that the loads methods can find them.
@@ -142,10 +178,27 @@ class CollectMetaclass(abc.ABCMeta):
             return
         if "name" not in dct:
             self.name = name
+        if "cacheable" not in dct and ("__init__" in dct or "validate" in dct or "try_validate" in dct):
+            # a new constructor or validate method must declare again that the instances are
+            # cacheable, e.g. validate could change the instance
+            self.cacheable = False
         if "inactive" not in dct or dct["inactive"] is not True:
             if issubclass(self, Validator):
+                # validate and try_validate must have the same behavior. If a class
+                # implements only one of them, the other one is derived from it
+                if "try_validate" in dct and "validate" not in dct:
+                    self.validate = validate_by_try(dct["try_validate"])
+                    self.__abstractmethods__ = frozenset(x for x in self.__abstractmethods__ if x != "validate")
+                elif "validate" in dct and "try_validate" not in dct:
+                    self.try_validate = try_by_validate(dct["validate"])
                 # only string input for validator functions
-                self.validate = decorate_fn(self.validate)
+                if not getattr(self.validate, "input_checked", False):
+                    self.validate = decorate_fn(self.validate)
+                if not getattr(self.try_validate, "input_checked", False):
+                    self.try_validate = decorate_try_fn(self.try_validate)
+                if dct.get("avalidate") is not None:
+                    # the check is done before the coroutine is created
+                    self.avalidate = decorate_fn(self.avalidate)
                 DATA_VALIDATOR[self.name] = self
             if issubclass(self, SectionFeature):
                 DATA_SECTION_FEATURE[self.name] = self
@@ -175,7 +228,40 @@ class Validator(object):
     For Attribute information see Entry class.
 
     a instance lives in one section/option from ini_validator dict
+
+    Attributes:
+        cacheable: True if instances can be shared between options and parse runs.
+                   This requires that the instance only depends on the init parameters and
+                   the data attribute, and that validate doesn't change the instance.
+                   Classes with an own __init__, validate or try_validate method must declare this attribute again.
+        blocking: True if validate waits for I/O (disk, network). If a parse runs with threads,
+                  these validators are executed in a thread pool. The result depends on the
+                  environment, so it is not reused by revalidate and not stored by a ResultCache.
+        avalidate: optional coroutine function (async def avalidate(self, value)) with the same
+                   behavior as validate. It is used by *ConfigValidator.aparse*, validators
+                   without it are executed in an executor.
+
+    A validator implements *validate* or *try_validate* (or both), the metaclass
+    derives the missing one. Combined validators (or, and, one-off) use try_validate,
+    so invalid input of a sub validator doesn't raise an exception.
     """
+    cacheable = False
+    blocking = False
+    avalidate = None
+
+    def try_validate(self, value):
+        """validate without exception for invalid input
+
+        Args:
+            value (String): the value to check
+
+        Returns:
+            tuple (True, the validated value) or (False, the exception which validate would raise)
+        """
+        try:
+            return True, self.validate(value)
+        except Exception as e:
+            return False, e
 
     @abc.abstractmethod
     def validate(self, value):
@@ -206,10 +292,24 @@ class SectionFeature(object):
         """
 
         :param parse_obj: parser object which stores the data
-        :param section_dict: the configuration dict for the current section
+        :param section_dict: the configuration for the current section (read only mapping)
         :return:
         """
 
+    @classmethod
+    def compile(cls, section, section_dict):
+        """
+        compile the configuration for one section into a plan step.
+
+        the default step creates a new feature instance and calls *parse_section* on every parse run.
+        Features which can resolve there configuration in advance should override this method.
+
+        :param section: the section name
+        :param section_dict: the configuration dict for the section (without the feature key)
+        :return: a step with a *run(parse_obj)* method
+        """
+        return SectionStep(section, cls, DictView(section_dict))
+
 
 @six.add_metaclass(CollectMetaclass)
 class OptionFeature(object):
@@ -226,6 +326,17 @@ class OptionFeature(object):
         """
 
         :param parse_obj: parser object which stores the data
-        :param option_dict: the configuration dict for the current option
+        :param option_dict: the configuration for the current option (read only mapping)
         :return:
         """
+
+    @classmethod
+    def compile(cls, option, option_dict):
+        """
+        compile the configuration for one option into a plan step.
+
+        :param option: the option name
+        :param option_dict: the configuration dict for the option (without the "feature" entry)
+        :return: a step with a *run(parse_obj)* method
+        """
+        return OptionStep(option, cls, DictView(option_dict))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import pickle
+import logging
+import functools
+import multiprocessing
+from six.moves import configparser
+from configvalidator.tools import basics
+from configvalidator.tools.configValidator import ConfigValidator
+from configvalidator.tools.exceptions import ParserException, ErrorRecord
+from configvalidator.tools.plan import SchemaPlan
+
+
+logger = logging.getLogger(__name__)
+
+
+def parse_many(config_dict, sources, workers=None, cp_class=None, cp_init_args=None, data=None, feature_key="__feature__", chunksize=None):
+    """validate many ini files against one config dict
+
+    The config dict is compiled once and send with every chunk of files to the
+    worker processes of a *ProcessPoolExecutor*. The workers read and validate the files.
+    On python 2 this needs the *futures* backport.
+    The results are yielded as soon as they are finished, so the order is not
+    the order of *sources*.
+
+    :param config_dict: the config dict or a plan from *ConfigValidator.compile*
+    :param sources: the ini files. Every entry is passed to *read* of a new cp instance.
+    :param workers: number of worker processes. Default is the number of cpus. With 1 (or less) the files are parsed in this process.
+    :param cp_class: the ConfigParser class. Default is *RawConfigParser*
+    :param cp_init_args: kwargs for new cp instances
+    :param data: dict with data for the validators (see *ConfigValidator.add_data*)
+    :param feature_key: the dict key for section features (ignored for a compiled plan)
+    :param chunksize: number of files a worker handles at once. Default depends on the number of files and workers.
+    :return: generator with tuples (source, result). The result is an AttributeDict or a ParserException with the errors
+             (the same *records* as from *parse*, from worker processes with the arguments of the messages as strings
+             if they can't be pickled).
+    """
+    if isinstance(config_dict, SchemaPlan):
+        plan = config_dict
+    else:
+        plan = ConfigValidator.compile(config_dict, feature_key=feature_key)
+    if cp_class is None:
+        cp_class = configparser.RawConfigParser
+    if cp_init_args is None:
+        cp_init_args = {}
+    data = {} if data is None else dict(data)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers <= 1:
+        for source in sources:
+            yield _parse_source(source, plan, cp_class, cp_init_args, data)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    sources = list(sources)
+    if chunksize is None:
+        chunksize = max(1, min(64, len(sources) // (workers * 4)))
+    # no initializer (python >= 3.7 only): the plan is pickled with every chunk
+    parse_sources = functools.partial(_parse_sources, plan=plan, cp_class=cp_class, cp_init_args=cp_init_args, data=data, global_data=dict(basics.GLOBAL_DATA))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = []
+    try:
+        for idx in range(0, len(sources), chunksize):
+            futures.append(executor.submit(parse_sources, sources[idx:idx + chunksize]))
+        for future in as_completed(futures):
+            for res in future.result():
+                yield res
+    finally:
+        # the caller may stop before all results are consumed
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _parse_sources(sources, plan, cp_class, cp_init_args, data, global_data):
+    basics.GLOBAL_DATA.update(global_data)
+    return [_parse_source(source, plan, cp_class, cp_init_args, data, pickleable=True) for source in sources]
+
+
+def _parse_source(source, plan, cp_class, cp_init_args, data, pickleable=False):
+    try:
+        cp = cp_class(**cp_init_args)
+        cp.read(source)
+        cv = ConfigValidator(cp, cp_init_args=cp_init_args)
+        for key, value in data.items():
+            cv.add_data(key, value)
+        return source, cv.parse(plan)
+    except ParserException as e:
+        return source, _pickleable_exception(e) if pickleable else e
+    except Exception as e:
+        logger.debug(e)
+        return source, ParserException("error parsing {source}: {error}".format(source=source, error=e))
+
+
+def _pickleable_exception(e):
+    """the exception or a copy with the same records, whose arguments are strings"""
+    try:
+        pickle.loads(pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL))
+        return e
+    except Exception as pickle_error:
+        # e.g. exceptions of custom validators
+        logger.debug(pickle_error)
+    if e.exception is not None:
+        # ParserException(message, exception): only the message is kept
+        return ParserException(str(e))
+    records = []
+    for record in e.records:
+        if isinstance(record, ErrorRecord):
+            try:
+                validator = pickle.loads(pickle.dumps(record.validator, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                validator = None
+            record = ErrorRecord(record.code, record.section, record.option, validator, dict((k, str(v)) for k, v in record.args.items()))
+        else:
+            record = str(record)
+        records.append(record)
+    return ParserException.from_errors(records)
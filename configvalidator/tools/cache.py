@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import threading
+from configvalidator.tools.compat import OrderedDict
+from six import string_types, integer_types
+from configvalidator.tools.view import Mapping
+
+
+_MISSING = object()
+_NUMBER_TYPES = frozenset((bool, float) + integer_types)
+_STRING_TYPES = frozenset(string_types)
+
+
+class LRUCache(object):
+
+    """thread safe mapping with a bounded size
+
+    If the cache is full, the least recently used entry is removed.
+
+    Attributes:
+        maxsize: maximum number of entries. 0 disables the cache.
+        hits: number of successful lookups
+        misses: number of failed lookups
+    """
+
+    def __init__(self, maxsize=1024):
+        assert maxsize >= 0
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._move_to_end(key, value)
+            self.hits += 1
+            return value
+
+    if hasattr(OrderedDict, "move_to_end"):
+        def _move_to_end(self, key, value):
+            self._data.move_to_end(key)
+    else:
+        def _move_to_end(self, key, value):
+            del self._data[key]
+            self._data[key] = value
+
+    def set(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def make_key(value):
+    """transform a value into a hashable key
+
+    mappings, lists, tuples and sets are transformed recursively.
+    The type of numbers is part of the key, so that 1, 1.0 and True are different keys.
+
+    Args:
+        value: the value
+
+    Returns:
+        a hashable value
+
+    Raises:
+        TypeError: if the value (or a part of it) is not hashable
+    """
+    value_type = type(value)
+    if value_type in _NUMBER_TYPES:
+        return value_type, value
+    if value is None or value_type in _STRING_TYPES:
+        return value
+    if isinstance(value, Mapping):
+        # a read only view has the same key as the dict it shows
+        return dict, frozenset([(k, make_key(v)) for k, v in value.items()])
+    if isinstance(value, string_types):
+        return value
+    if isinstance(value, (bool, float) + integer_types):
+        return value.__class__, value
+    if isinstance(value, list):
+        return list, tuple(make_key(x) for x in value)
+    if isinstance(value, tuple):
+        return tuple, tuple(make_key(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(make_key(x) for x in value)
+    hash(value)
+    return value
+
+
+VALIDATOR_CACHE = LRUCache(maxsize=1024)
@@ -6,11 +6,13 @@
 
 import abc
 import six
-import json
 import logging
 from configvalidator.tools.basics import load_section_feature
 from configvalidator.tools.parser import ParseObj
-from configvalidator.tools.exceptions import InitException
+from configvalidator.tools.plan import SchemaPlan, ErrorStep
+from configvalidator.tools.cache import VALIDATOR_CACHE
+from configvalidator.tools.view import DictView
+from configvalidator.tools.exceptions import InitException, ParserException
 
 
 logger = logging.getLogger(__name__)
@@ -23,16 +25,18 @@ class ConfigValidator(object):
         cp: An class which fulfill the configparser interface
         cp_init_args: This item will be passed as kwargs to new cp instances
         data: local data store
+        validator_cache: cache for validator instances, shared by all parse runs. None disables the cache.
 
     """
 
-    def __init__(self, cp, cp_init_args=None):
+    def __init__(self, cp, cp_init_args=None, validator_cache=VALIDATOR_CACHE):
         """Inits ConfigValidator."""
         self.cp = cp
         assert isinstance(cp, object)
         self.cp_init_args = cp_init_args
         assert isinstance(self.cp_init_args, dict) or self.cp_init_args is None
         self.data = {}
+        self.validator_cache = validator_cache
         for method_name in ["has_option", "read", "get", "options"]:
             if method_name not in dir(cp):
                 raise InitException("No such method \"{method_name}\". Need to implement the ConfigParser interface".format(method_name=method_name))
@@ -50,28 +54,171 @@ class ConfigValidator(object):
         assert isinstance(key, object)
         del self.data[key]
 
-    def parse(self, config_dict, feature_key="__feature__"):
+    def parse(self, config_dict, feature_key="__feature__", threads=None, lazy=False, hooks=None, with_stats=False, max_errors=None, keep_state=False):
         """
 
-        :param config_dict:
-        :param feature_key:
+        :param config_dict: the config dict or a plan from *compile*
+        :param feature_key: the dict key for section features (ignored for a compiled plan)
+        :param threads: number of threads for blocking validators (file system, network, sub ini files).
+                        The result and the errors are the same as without threads. None parses serial.
+                        Only *ThreadPoolExecutor.submit* is used, so on python 2 the futures backport is enough.
+        :param lazy: if True nothing is validated here. The options are validated when they are
+                     accessed (see LazyResult), *validate_all* validates everything. threads is ignored.
+        :param hooks: list of functions hook(event, section, option, validator_name, elapsed_ns), which are
+                      called after the construction ("init") and the validation ("validate") of a validator and
+                      after the options that waited for a dependency were validated ("resolve").
+                      With threads the hooks are called from the threads. See ParseProfiler.
+        :param with_stats: if True a tuple with the result and a ParseStats object is returned.
+                           For a lazy result the stats grow with every accessed option.
+        :param max_errors: stop the parse after this number of errors. The options which wait for
+                           dependencies are skipped. *info* of the ParserException is the list of
+                           the error messages. 1 stops at the first error, values below 1 are rejected.
+                           Ignored for lazy results.
+        :param keep_state: if True the result keeps the plan, the raw input and the values, so that it
+                           can be passed to *revalidate*. The state is not pickled, so results of
+                           *parse_many* and of a ResultCache can't be revalidated.
         :return:
         """
-        parse_obj = ParseObj(self.cp, cp_init_args=self.cp_init_args, context_data=dict(self.data))
-        # copy config dict so that changes wont affect the original dict.
-        tmp_config_dict = json.loads(json.dumps(config_dict))
-        for section, section_config_dict in tmp_config_dict.items():
+        if max_errors is not None and max_errors < 1:
+            raise ParserException("max_errors must be at least 1 or None, not {max_errors!r}".format(max_errors=max_errors))
+        stats = None
+        if with_stats:
+            from configvalidator.tools.stats import ParseStats
+            stats = ParseStats()
+            stats_start = stats.start()
+        if isinstance(config_dict, SchemaPlan):
+            plan = config_dict
+        else:
+            plan = self.compile(config_dict, feature_key=feature_key)
+        if stats is not None:
+            stats.stop("prepare", stats_start)
+        if lazy:
+            from configvalidator.tools.lazy import LazyResult
+            res = LazyResult(plan, ParseObj(self.cp, cp_init_args=self.cp_init_args, context_data=dict(self.data), validator_cache=self.validator_cache, hooks=hooks, stats=stats, keep_state=keep_state))
+        elif threads is None or threads < 1:
+            res = self._run(plan, hooks=hooks, stats=stats, max_errors=max_errors, keep_state=keep_state)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                res = self._run(plan, executor=executor, hooks=hooks, stats=stats, max_errors=max_errors, keep_state=keep_state)
+        if with_stats:
+            return res, stats
+        return res
+
+    def aparse(self, config_dict, feature_key="__feature__", concurrency=16, executor=None, keep_state=False):
+        """
+        asyncio version of *parse* (Python 3.5+): data = await cv.aparse(config_dict)
+
+        The options without dependencies are validated concurrently: validators with
+        an *avalidate* coroutine on the event loop, blocking validators in the executor.
+        The result and the errors are the same as for *parse*.
+
+        :param config_dict: the config dict or a plan from *compile*
+        :param feature_key: the dict key for section features (ignored for a compiled plan)
+        :param concurrency: maximum number of validations that run at the same time, at least 1
+        :param executor: executor for sync validators. None is the default executor of the event loop.
+        :param keep_state: see *parse*
+        :return: coroutine with the result
+        """
+        if concurrency < 1:
+            raise ParserException("concurrency must be at least 1, not {concurrency!r}".format(concurrency=concurrency))
+        from configvalidator.tools.aio import aparse
+        if isinstance(config_dict, SchemaPlan):
+            plan = config_dict
+        else:
+            plan = self.compile(config_dict, feature_key=feature_key)
+        return aparse(self, plan, concurrency=concurrency, executor=executor, keep_state=keep_state)
+
+    def revalidate(self, previous, cp):
+        """
+        validate a new cp instance against the config of a previous parse.
+
+        only the options with a changed raw value and the options which depend on them
+        are validated again, the other values are reused from the previous result.
+        Blocking validators (file system, network, sub_ini) are always validated again.
+
+        :param previous: the result of *parse* with keep_state=True (or of *revalidate*).
+                         Pickled results (e.g. from *parse_many* or the disk of a ResultCache) have no state.
+        :param cp: the new cp instance
+        :return: tuple with the new result and a set with the IniKeys (section, option) whose values changed
+        :raises ParserException: if the previous result has no state
+        """
+        # no getattr: AttributeDict raises KeyError for unknown attributes
+        state = getattr(previous, "__dict__", {}).get("_parse_state")
+        if state is None:
+            raise ParserException("the previous result has no parse state, parse it with keep_state=True")
+        parse_obj = ParseObj(cp, cp_init_args=self.cp_init_args, context_data=dict(self.data), validator_cache=self.validator_cache, previous=state, keep_state=True)
+        if parse_obj.state(state.plan).data != state.data:
+            # other data can lead to other validators
+            parse_obj.previous = None
+        res = run_plan(state.plan, parse_obj)
+        return res, state.changed_keys(parse_obj.parsed_values)
+
+    def watch(self, paths, config_dict, on_change=None, on_error=None, interval=1.0, debounce=0.5, feature_key="__feature__", start=True):
+        """
+        parse ini files and parse them again if they change.
+
+        The files are read with new instances of the cp class. Changes of sub_ini files
+        are also detected. If changed files are not valid, the last valid result is kept.
+
+        :param paths: ini file or list of ini files
+        :param config_dict: the config dict or a plan from *compile*
+        :param on_change: function(result, changed_keys) called after a new result was set
+        :param on_error: function(exception) called if the changed files are not valid
+        :param interval: seconds between two checks
+        :param debounce: seconds the files must be unchanged before they are parsed
+        :param feature_key: the dict key for section features (ignored for a compiled plan)
+        :param start: start the background thread
+        :return: ConfigWatcher, the current result is available as *result*
+        """
+        from configvalidator.tools.watch import ConfigWatcher
+        watcher = ConfigWatcher(self, paths, config_dict, on_change=on_change, on_error=on_error, interval=interval, debounce=debounce, feature_key=feature_key)
+        if not watcher.load():
+            raise watcher.error
+        if start:
+            watcher.start()
+        return watcher
+
+    def _run(self, plan, executor=None, hooks=None, stats=None, max_errors=None, keep_state=False):
+        parse_obj = ParseObj(self.cp, cp_init_args=self.cp_init_args, context_data=dict(self.data), validator_cache=self.validator_cache, executor=executor, hooks=hooks, stats=stats, max_errors=max_errors,
+                             keep_state=keep_state)
+        return run_plan(plan, parse_obj)
+
+    @staticmethod
+    def compile(config_dict, feature_key="__feature__"):
+        """compile a config dict into a reusable plan
+
+        All features, validator classes and validator parameters are resolved once.
+        The plan can be passed to *parse* instead of the config dict.
+        The config dict is not copied: the plan holds read only views of it,
+        so the dict must not be changed as long as the plan is used.
+
+        :param config_dict: the config dict
+        :param feature_key: the dict key for section features
+        :return: SchemaPlan
+        """
+        steps = []
+        for section, section_config_dict in config_dict.items():
             try:
-                parse_obj.current_section = section
                 section_class_name = "default"
                 if feature_key in section_config_dict:
                     section_class_name = section_config_dict[feature_key]
-                    del section_config_dict[feature_key]
                 section_class = load_section_feature(section_class_name)
-                section_instance = section_class(parse_obj, **section_config_dict)
-                section_instance.parse_section(parse_obj, section_config_dict)
+                steps.append(section_class.compile(section, DictView(section_config_dict, exclude=(feature_key,))))
             except Exception as e:
-                parse_obj.add_error(error_msg="Error parsing section {section}: {raise_msg}".format(section=section, raise_msg=e), exception=e)
-        parse_obj.current_section = None
-        parse_obj.current_option = None
-        return parse_obj.result()
+                steps.append(ErrorStep(section, e))
+        return SchemaPlan(steps, feature_key)
+
+
+def run_plan(plan, parse_obj):
+    """run the plan and return the result (with the state for *ConfigValidator.revalidate* if parse_obj.keep_state)"""
+    plan.run(parse_obj)
+    stats = parse_obj.stats
+    if stats is not None:
+        stats_start = stats.start()
+    res = parse_obj.result()
+    if parse_obj.keep_state:
+        res._parse_state = parse_obj.state(plan)
+    if stats is not None:
+        stats.stop("result", stats_start)
+    return res
@@ -30,21 +30,25 @@ class ConfigValidatorException(Exception):
 
     @classmethod
     def from_list(cls, l):
+        """ValidatorException with the errors of the list items
+
+        the items are error messages, ValidatorExceptions or tuples (error message, exception)
+        """
         assert isinstance(l, list)
         assert len(l) > 0
-        exc_l = []
+        errors = []
         for item in l:
             if isinstance(item, string_types):
-                exc_l.append(ValidatorException(item))
+                errors.append((item, None))
             elif isinstance(item, ValidatorException):
-                exc_l.append(item)
+                errors.extend(item.errors)
             else:
                 assert len(item) == 2
                 assert isinstance(item[1], Exception)
-                exc_l.append(ValidatorException(item[0], item[1]))
-        v = exc_l[0]
-        for x in exc_l[1:]:
-            v.add(x)
+                errors.append((item[0], item[1]))
+        # no intermediate exception for every item
+        v = ValidatorException.__new__(ValidatorException)
+        v._errors = errors
         return v
 
     def __str__(self):
@@ -79,8 +83,41 @@ class ParserException(ConfigValidatorException):
     def __init__(self, error_msg, exception=None):
         assert isinstance(error_msg, string_types)
         assert isinstance(exception, Exception) or exception is None
-        self.error_msg = error_msg
+        self._error_msg = error_msg
         self.exception = exception
+        self._records = None
+
+    @classmethod
+    def from_errors(cls, errors):
+        """exception for a list of errors (ErrorRecords or messages), which are formatted when they are rendered"""
+        res = cls.__new__(cls)
+        res._error_msg = None
+        res.exception = None
+        res._records = list(errors)
+        return res
+
+    @property
+    def error_msg(self):
+        if self._error_msg is None:
+            self._error_msg = "\n".join(str(record) for record in self._records)
+        return self._error_msg
+
+    @property
+    def records(self):
+        """list of the single errors (ErrorRecords or messages)"""
+        if self._records is None:
+            return [self.error_msg]
+        return self._records
+
+    @property
+    def info(self):
+        return [str(record) for record in self.records]
+
+    @property
+    def errors(self):
+        if self._records is None:
+            return [(self.error_msg, self.exception)]
+        return [(str(record), None) for record in self._records]
 
     def __str__(self):
         if self.exception is None:
@@ -88,6 +125,63 @@ class ParserException(ConfigValidatorException):
         else:
             return "{msg} | {error}".format(msg=self.error_msg, error=self.exception)
 
+    def __reduce__(self):
+        # from_errors doesn't call __init__, so args are not the init parameters
+        return _new_exception, (self.__class__,), self.__dict__
+
+
+def _new_exception(cls):
+    return cls.__new__(cls)
+
+
+class ErrorRecord(object):
+
+    """error of a parse run, which is formatted when it is rendered (*str*)
+
+    Attributes:
+        code: kind of the error, selects the message format (see MESSAGES)
+        section: the section or None
+        option: the option or None
+        validator: the validator class or None
+        args: dict with the values for the message (e.g. the exception as "error")
+    """
+
+    __slots__ = ("code", "section", "option", "validator", "args")
+
+    MESSAGES = {
+        "value": "error validating [{section}]{option}: {error}",
+        "raw_value": "error validating [{section}]: {error}",
+        "raw_option": "{option} - {error}",
+        "missing": "No value for Section/Option: '{section}'/'{option}'",
+        "depends_syntax": "error validating [{section}]{option}: depends syntax: 'str: (str, str)'",
+        "circle": "error validating [{section}]{option}: circle reference with {refs}",
+        "unresolved": "not all dependencies resolved: {refs}",
+        "section": "Error parsing section {section}: {error}",
+    }
+
+    def __init__(self, code, section=None, option=None, validator=None, args=None):
+        self.code = code
+        self.section = section
+        self.option = option
+        self.validator = validator
+        self.args = {} if args is None else args
+
+    def __str__(self):
+        return self.MESSAGES[self.code].format(section=self.section, option=self.option, **self.args)
+
+    def __repr__(self):
+        return "ErrorRecord({code!r}, {section!r}, {option!r})".format(code=self.code, section=self.section, option=self.option)
+
+    def __eq__(self, other):
+        if isinstance(other, ErrorRecord):
+            return str(self) == str(other)
+        return str(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
 
 class ValidatorException(ConfigValidatorException):
 
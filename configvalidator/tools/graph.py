@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+from configvalidator.tools.compat import OrderedDict
+
+
+class PendingItem(object):
+
+    """item which waits for dependencies
+
+    Attributes:
+        key: the key of the item
+        data: the data for the item (e.g. validator and raw value)
+        dependencies: dict with parameter name -> key of the dependency
+        missing: number of dependencies that are not available (in-degree)
+    """
+
+    __slots__ = ("key", "data", "dependencies", "missing")
+
+    def __init__(self, key, data, dependencies):
+        self.key = key
+        self.data = data
+        self.dependencies = dependencies
+        self.missing = len(set(dependencies.values()))
+
+
+class DependencyGraph(object):
+
+    """graph of the items that wait for dependencies
+
+    Every item has an in-degree counter with the number of dependencies that
+    are not available yet. If a key becomes available, the counter of all
+    waiting items is decreased and the items without missing dependencies
+    are returned, so that they can be processed in topological order.
+    All operations are linear in the number of items plus dependencies.
+    """
+
+    def __init__(self):
+        # key -> PendingItem, in order of registration
+        self._items = OrderedDict()
+        # key -> list of items which wait for this key
+        self._waiting = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def get(self, key):
+        return self._items[key]
+
+    def add(self, key, data, dependencies):
+        """register an item which waits for its dependencies
+
+        Args:
+            key: the key of the item
+            data: the data for the item
+            dependencies: dict with parameter name -> key of the dependency.
+                          All dependencies must be not available.
+
+        Returns:
+            the PendingItem
+        """
+        item = PendingItem(key, data, dependencies)
+        # a new registration replaces the old one
+        self._items.pop(key, None)
+        self._items[key] = item
+        for dep in set(dependencies.values()):
+            self._waiting.setdefault(dep, []).append(item)
+        return item
+
+    def remove(self, key):
+        """remove the item, e.g. after it was processed"""
+        self._items.pop(key, None)
+
+    def available(self, key):
+        """mark the key as available
+
+        Args:
+            key: the key
+
+        Returns:
+            list with the items which have no missing dependencies anymore
+        """
+        ready = []
+        for item in self._waiting.pop(key, ()):
+            if self._items.get(item.key) is not item:
+                # replaced or removed
+                continue
+            item.missing -= 1
+            if item.missing == 0:
+                ready.append(item)
+        return ready
+
+    def cycles(self):
+        """find all circle references of the waiting items
+
+        One pass of Tarjan's algorithm for strongly connected components.
+        Every component with more than one item or with an item that depends
+        on itself is a circle.
+
+        Returns:
+            list of circles. Every circle is a list of keys in order of registration.
+        """
+        order = dict((key, idx) for idx, key in enumerate(self._items))
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        res = []
+        counter = 0
+        for root in self._items:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._successors(root)))]
+            while work:
+                key, successors = work[-1]
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = low[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self._successors(succ))))
+                        break
+                    elif succ in on_stack:
+                        low[key] = min(low[key], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[key])
+                    if low[key] == index[key]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == key:
+                                break
+                        if len(component) > 1 or key in self._successors(key):
+                            res.append(sorted(component, key=order.get))
+        res.sort(key=lambda component: order[component[0]])
+        return res
+
+    def _successors(self, key):
+        return [dep for dep in self._items[key].dependencies.values() if dep in self._items]
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import io
+import os
+import re
+import sys
+import mmap
+import threading
+import bisect
+import locale
+from configvalidator.tools.compat import OrderedDict
+from six import string_types, text_type
+from six.moves import configparser, intern
+from configvalidator.tools.exceptions import ConfigParserException
+
+
+_SECTION = re.compile(br"\[(?P<header>.+)\]")
+# section headers without indentation are always section headers, indented
+# ones could also be continuation lines
+_SECTION_LINE = re.compile(br"^\[(?P<header>[^\n]+)\]", re.M)
+_INDENTED_SECTION_LINE = re.compile(br"^[ \t]+\[[^\n]*\]", re.M)
+_COMMENT_PREFIXES = (b"#", b";")
+_INDENT = (b" ", b"\t")
+# the first byte of a line after a value, which can't continue the value
+_NO_CONTINUATION = (b" ", b"\t", b"\r", b"\n", b"#", b";")
+# dicts keep the insertion order since python 3.7
+_dict = dict if sys.version_info >= (3, 7) else OrderedDict
+
+
+class IniReader(object):
+
+    """read only ini file source with the ConfigParser interface
+
+    The files are read with one bulk read and parsed in one pass with the
+    semantics of *RawConfigParser* (sections, DEFAULT section, '=' and ':'
+    delimiters, full line comments, continuation lines, lower case option names).
+    Section and option names are interned. For every option only the offset
+    of its value is stored, the value is decoded when *get* is called.
+
+    Can be used as drop-in for *RawConfigParser* with ConfigValidator::
+
+        cp = IniReader()
+        cp.read("user_input.ini")
+        data = ConfigValidator(cp=cp).parse(config_dict)
+
+    Attributes:
+        encoding: encoding of the files
+        default_section: name of the section with the default values
+        strict: True if a section or option must not be repeated in one file
+    """
+
+    def __init__(self, encoding=None, default_section="DEFAULT", strict=True):
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.default_section = default_section
+        self.strict = strict
+        # the content of the files. The offsets of the values are global,
+        # the first offset of every buffer is stored in _bases
+        self._buffers = []
+        self._bases = []
+        self._sources = []
+        self._size = 0
+        self._sections = _dict()
+        self._defaults = _dict()
+
+    def optionxform(self, optionstr):
+        return optionstr.lower()
+
+    def read(self, filenames, encoding=None):
+        """read and parse the files. Files which can't be opened are ignored.
+
+        :param filenames: file name or list of file names
+        :param encoding: encoding of the files. Default is the encoding of the reader.
+        :return: list with the successfully read files
+        """
+        if isinstance(filenames, string_types):
+            filenames = [filenames]
+        read_ok = []
+        for filename in filenames:
+            try:
+                data = self._open(filename)
+            except (IOError, OSError):
+                continue
+            self._read_buffer(data, filename, encoding)
+            read_ok.append(filename)
+        return read_ok
+
+    def read_file(self, f, source=None):
+        """parse the content of a file object (binary or text)"""
+        if source is None:
+            source = getattr(f, "name", "<???>")
+        data = f.read()
+        if isinstance(data, text_type):
+            self._read_buffer(data.encode(self.encoding), source, self.encoding)
+        else:
+            self._read_buffer(data, source)
+
+    def read_string(self, string, source="<string>"):
+        """parse the content of a string"""
+        self._read_buffer(string.encode(self.encoding), source, self.encoding)
+
+    @property
+    def bytes_read(self):
+        """the size of the read content (see ParseStats)"""
+        return self._size
+
+    def sections(self):
+        return list(self._sections)
+
+    def has_section(self, section):
+        return section in self._sections
+
+    def options(self, section):
+        options = self._options(section)
+        if options is None:
+            raise configparser.NoSectionError(section)
+        return list(options) + [option for option in self._defaults if option not in options]
+
+    def has_option(self, section, option):
+        option = self.optionxform(option)
+        if not section or section == self.default_section:
+            return option in self._defaults
+        options = self._options(section)
+        if options is None:
+            return False
+        return option in options or option in self._defaults
+
+    def get(self, section, option):
+        return self._decode(self._offset(section, option))
+
+    def items(self, section):
+        return [(option, self.get(section, option)) for option in self.options(section)]
+
+    def lineno(self, section, option):
+        """line number of the option in its file"""
+        buf, local = self._locate(self._offset(section, option))
+        return _count_lines(buf, 0, local) + 1
+
+    def source(self, section, option):
+        """file name or source name, which contains the option"""
+        return self._sources[self._buffer_idx(self._offset(section, option))][0]
+
+    def _options(self, section):
+        """the dict option -> offset of the section or None"""
+        return self._sections.get(section)
+
+    def _offset(self, section, option):
+        option = self.optionxform(option)
+        if not section or section == self.default_section:
+            options = self._defaults
+        else:
+            options = self._options(section)
+            if options is None:
+                raise configparser.NoSectionError(section)
+        try:
+            return options[option]
+        except KeyError:
+            try:
+                return self._defaults[option]
+            except KeyError:
+                raise configparser.NoOptionError(option, section)
+
+    def _buffer_idx(self, offset):
+        if len(self._bases) == 1:
+            return 0
+        return bisect.bisect_right(self._bases, offset) - 1
+
+    def _locate(self, offset):
+        idx = self._buffer_idx(offset)
+        return self._buffers[idx], offset - self._bases[idx]
+
+    def _decode(self, offset):
+        idx = self._buffer_idx(offset)
+        buf = self._buffers[idx]
+        encoding = self._sources[idx][1]
+        start = offset - self._bases[idx]
+        size = len(buf)
+        line_end = buf.find(b"\n", start)
+        if line_end == -1:
+            line_end = size
+        value = buf[start:line_end].rstrip()
+        if line_end + 1 >= size or buf[line_end + 1:line_end + 2] not in _NO_CONTINUATION:
+            # the next line is not indented: no continuation lines
+            return value.decode(encoding)
+        # continuation lines: the same rules as RawConfigParser (lines with a
+        # deeper indentation than the option, comment lines are removed, empty lines are kept)
+        line_start = buf.rfind(b"\n", 0, start) + 1
+        option_line = buf[line_start:start]
+        indent_level = len(option_line) - len(option_line.lstrip())
+        lines = [value]
+        empty_lines = 0
+        pos = line_end + 1
+        while pos < size:
+            line_end = buf.find(b"\n", pos)
+            if line_end == -1:
+                line_end = size
+            line = buf[pos:line_end]
+            pos = line_end + 1
+            stripped = line.strip()
+            if not stripped:
+                empty_lines += 1
+                continue
+            if stripped[:1] in _COMMENT_PREFIXES:
+                continue
+            if len(line) - len(line.lstrip()) <= indent_level:
+                break
+            lines.extend([b""] * empty_lines)
+            empty_lines = 0
+            lines.append(stripped)
+        return b"\n".join(lines).decode(encoding)
+
+    def _open(self, filename):
+        """the content of the file"""
+        with open(filename, "rb") as f:
+            return f.read()
+
+    def _read_buffer(self, data, source, encoding=None):
+        base = self._size
+        self._buffers.append(data)
+        self._bases.append(base)
+        self._sources.append((source, encoding or self.encoding))
+        self._size += len(data)
+        self._index(data, base)
+
+    def _index(self, data, base):
+        """parse the content of a new buffer"""
+        self._scan(data, base, base, 0, set())
+
+    def _scan(self, data, base, file_base, lineno, sections_added, section=None):
+        """parse the lines of data
+
+        :param data: the content (complete lines)
+        :param base: global offset of the first byte of data
+        :param file_base: global offset of the file start
+        :param lineno: number of the line before data
+        :param sections_added: sections of the current file (strict mode)
+        :param section: name of the section, which contains data. None for the file start
+        :return: number of the last line
+        """
+        source, encoding = self._sources[self._buffer_idx(base)]
+        options = None if section is None else self._get_section(section)
+        option = None
+        indent_level = 0
+        offset = base
+        for line in io.BytesIO(data):
+            line_start = offset
+            offset += len(line)
+            lineno += 1
+            stripped = line.strip()
+            if not stripped or stripped[:1] in _COMMENT_PREFIXES:
+                continue
+            if line[:1] in _INDENT:
+                indent = len(line) - len(line.lstrip())
+                if option is not None and indent > indent_level:
+                    # continuation line, read by _decode
+                    continue
+            else:
+                indent = 0
+            indent_level = indent
+            if stripped[:1] == b"[":
+                match = _SECTION.match(stripped)
+                if match is not None:
+                    section = _intern(match.group("header").decode(encoding))
+                    if section != self.default_section:
+                        if self.strict and section in sections_added:
+                            raise ConfigParserException("{source}, line {lineno}: section '{section}' already exists".format(source=source, lineno=lineno, section=section))
+                        sections_added.add(section)
+                    options = self._get_section(section)
+                    option = None
+                    continue
+            if options is None:
+                raise ConfigParserException("{source}, line {lineno}: file contains no section headers: {line!r}".format(source=source, lineno=lineno, line=line.rstrip()))
+            # the first '=' or ':' separates the option and the value
+            idx = stripped.find(b"=")
+            colon = stripped.find(b":")
+            if colon != -1 and (idx == -1 or colon < idx):
+                idx = colon
+            if idx <= 0:
+                raise ConfigParserException("{source}, line {lineno}: parsing error: {line!r}".format(source=source, lineno=lineno, line=line.rstrip()))
+            option = _intern(self.optionxform(stripped[:idx].rstrip().decode(encoding)))
+            if self.strict and options.get(option, -1) >= file_base:
+                raise ConfigParserException("{source}, line {lineno}: option '{option}' in section '{section}' already exists".format(source=source, lineno=lineno, section=section, option=option))
+            rest = stripped[idx + 1:]
+            options[option] = line_start + indent + idx + 1 + len(rest) - len(rest.lstrip())
+        return lineno
+
+    def _get_section(self, section):
+        if section == self.default_section:
+            return self._defaults
+        try:
+            return self._sections[section]
+        except KeyError:
+            options = self._sections[section] = _dict()
+            return options
+
+
+class MmapIniReader(IniReader):
+
+    """read only ini file source for huge files
+
+    The files are memory mapped. Reading a file only builds an index with
+    the byte ranges of the sections. The options of a section are indexed
+    when the section is used the first time (*options*, *has_option*, *get*)
+    and only the values that are read are decoded. So the memory usage
+    depends on the used sections and not on the file size.
+
+    Errors inside a section are reported when the section is used.
+    The DEFAULT section and files with indented section headers (which can
+    only be found by parsing every line) are indexed completely by *read*.
+
+    Call *close* (or use the reader as context manager) to unmap the files.
+    """
+
+    def __init__(self, encoding=None, default_section="DEFAULT", strict=True):
+        super(MmapIniReader, self).__init__(encoding=encoding, default_section=default_section, strict=strict)
+        # section -> list of (start offset, end offset, line number before start) which are not indexed
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        for buf in self._buffers:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _open(self, filename):
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # empty files can't be mapped
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index(self, data, base):
+        if _INDENTED_SECTION_LINE.search(data) is not None:
+            return super(MmapIniReader, self)._index(data, base)
+        source, encoding = self._sources[-1]
+        headers = list(_SECTION_LINE.finditer(data))
+        sections_added = set()
+        # only comments before the first section
+        pos = headers[0].start() if headers else len(data)
+        lineno = self._scan(data[:pos], base, base, 0, sections_added)
+        for idx, match in enumerate(headers):
+            lineno += _count_lines(data, pos, match.start())
+            pos = match.start()
+            end = headers[idx + 1].start() if idx + 1 < len(headers) else len(data)
+            section = _intern(match.group("header").decode(encoding))
+            body = data.find(b"\n", pos, end) + 1 or end
+            if section == self.default_section:
+                self._scan(data[body:end], base + body, base, lineno + 1, set(), section=section)
+                continue
+            if self.strict and section in sections_added:
+                raise ConfigParserException("{source}, line {lineno}: section '{section}' already exists".format(source=source, lineno=lineno + 1, section=section))
+            sections_added.add(section)
+            self._get_section(section)
+            self._pending.setdefault(section, []).append((base + body, base + end, lineno + 1))
+
+    def _options(self, section):
+        if section in self._pending:
+            with self._lock:
+                ranges = self._pending.get(section)
+                if ranges is not None:
+                    for start, end, lineno in ranges:
+                        idx = self._buffer_idx(start)
+                        base = self._bases[idx]
+                        data = self._buffers[idx][start - base:end - base]
+                        self._scan(data, start, base, lineno, set(), section=section)
+                    # removed after the scan, so other threads wait for the complete section
+                    del self._pending[section]
+        return self._sections.get(section)
+
+
+def _count_lines(buf, start, end, chunk_size=2 ** 20):
+    """number of line breaks in buf[start:end] (mmap objects have no count method)"""
+    res = 0
+    while start < end:
+        res += buf[start:min(end, start + chunk_size)].count(b"\n")
+        start += chunk_size
+    return res
+
+
+def _intern(name):
+    # python 2 can only intern byte strings
+    return intern(name) if isinstance(name, str) else name
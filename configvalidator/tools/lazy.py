@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import threading
+from configvalidator.tools.compat import OrderedDict
+from configvalidator.tools.exceptions import ParserException, ErrorRecord
+from configvalidator.tools.parser import IniKey
+from configvalidator.tools.plan import CompiledSectionStep, ValidatorStep
+from configvalidator.tools.result import AttributeDict
+from configvalidator.tools.view import Mapping
+
+
+class LazyResult(Mapping):
+
+    """result of *ConfigValidator.parse(lazy=True)*
+
+    An option is validated when it is accessed the first time, the value
+    (or the error) is kept. The options it depends on are validated before.
+    Sections without compiled options (e.g. raw_section_input) are validated
+    at once. The keys are the sections of the config dict.
+
+    Access to an invalid option raises a ParserException with its errors.
+    *validate_all* validates the remaining options and returns the complete
+    result like *parse* (the errors are in the order of the validation).
+    """
+
+    def __init__(self, plan, parse_obj):
+        self._plan = plan
+        self._parse_obj = parse_obj
+        # section -> step
+        self._steps = OrderedDict((step.section, step) for step in plan.sections)
+        # section -> option -> step, for compiled sections (see _options)
+        self._option_steps = {}
+        # unit -> errors of its validation. A unit is the IniKey of an option or
+        # IniKey(section, None) for a section which is validated at once
+        self._done = {}
+        # unit -> units it depends on
+        self._dependencies = {}
+        self._lazy_sections = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, section):
+        if section not in self._steps:
+            raise KeyError(section)
+        try:
+            return self._lazy_sections[section]
+        except KeyError:
+            return self._lazy_sections.setdefault(section, LazySection(self, section))
+
+    def __iter__(self):
+        return iter(self._steps)
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __contains__(self, section):
+        return section in self._steps
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+    def __repr__(self):
+        return "LazyResult({sections!r})".format(sections=list(self._steps))
+
+    def get(self, section, option):
+        return self._get(section, option)
+
+    def validate_all(self):
+        """validate all options, which were not accessed so far
+
+        :return: the complete result (AttributeDict)
+        :raises ParserException: with all errors, if the input is not valid
+        """
+        with self._lock:
+            for step in self._plan.sections:
+                for unit in self._units(step):
+                    self._run(unit, set())
+            res = self._parse_obj.result()
+            if self._parse_obj.keep_state:
+                res._parse_state = self._parse_obj.state(self._plan)
+            return res
+
+    def _units(self, step):
+        if not isinstance(step, CompiledSectionStep):
+            return [IniKey(section=step.section, option=None)]
+        res = [IniKey(section=step.section, option=option_step.option) for option_step in step.options]
+        if step.error is not None:
+            res.append(IniKey(section=step.section, option=None))
+        return res
+
+    def _unit(self, section, option):
+        """the unit which validates the option"""
+        options = self._options(section)
+        if options is None:
+            return IniKey(section=section, option=None)
+        if option in options:
+            return IniKey(section=section, option=option)
+        if self._steps[section].error is not None:
+            # the option is maybe behind the error
+            return IniKey(section=section, option=None)
+        raise KeyError(option)
+
+    def _options(self, section):
+        """dict option -> step of a compiled section or None"""
+        try:
+            return self._option_steps[section]
+        except KeyError:
+            pass
+        step = self._steps[section]
+        options = None
+        if isinstance(step, CompiledSectionStep):
+            options = dict((option_step.option, option_step) for option_step in step.options)
+        self._option_steps[section] = options
+        return options
+
+    def _get(self, section, option):
+        with self._lock:
+            unit = self._unit(section, option)
+            self._run(unit, set())
+            values = self._parse_obj.parsed_values.get(section, {})
+            if option in values:
+                return values[option]
+            errors = self._errors(unit, set())
+            key = IniKey(section=section, option=option)
+            if key in self._parse_obj.dependencies:
+                errors.append(ErrorRecord("unresolved", args={"refs": "'{section}'/'{option}'".format(section=section, option=option)}))
+            if errors:
+                raise ParserException.from_errors(errors)
+            raise KeyError(option)
+
+    def _section(self, section):
+        """the values of the section, all options are validated"""
+        with self._lock:
+            if section not in self._steps:
+                raise KeyError(section)
+            errors = []
+            for unit in self._units(self._steps[section]):
+                self._run(unit, set())
+                errors.extend(self._errors(unit, set()))
+            if errors:
+                raise ParserException.from_errors(errors)
+            return self._parse_obj.parsed_values.get(section, {})
+
+    def _errors(self, unit, visited):
+        # the errors of the unit and the units it depends on
+        if unit in visited:
+            return []
+        visited.add(unit)
+        res = list(self._done.get(unit, ()))
+        for dep in self._dependencies.get(unit, ()):
+            res.extend(self._errors(dep, visited))
+        return res
+
+    def _run(self, unit, running):
+        """validate the unit and the units it depends on"""
+        if unit in self._done or unit in running:
+            return
+        running.add(unit)
+        parse_obj = self._parse_obj
+        step = self._steps[unit.section]
+        dependencies = []
+        if unit.option is not None:
+            step = self._options(unit.section)[unit.option]
+            if isinstance(step, ValidatorStep):
+                # the dependencies are validated before, so the option is validated at once
+                for dep in self._static_dependencies(step):
+                    dependencies.append(dep)
+                    self._run(dep, running)
+        start = len(parse_obj.errors)
+        parse_obj.current_section = unit.section
+        parse_obj.current_option = unit.option
+        try:
+            if isinstance(step, CompiledSectionStep):
+                # the options are validated on their own, only the compile error is left
+                raise step.error
+            step.run(parse_obj)
+        except Exception as e:
+            parse_obj.add_error(ErrorRecord("section", unit.section, args={"error": e}), exception=e)
+        finally:
+            parse_obj.current_section = None
+            parse_obj.current_option = None
+        self._done[unit] = parse_obj.errors[start:]
+        # other steps (features) can also wait for dependencies
+        for key in list(parse_obj.dependencies) if parse_obj.dependencies else ():
+            if key not in parse_obj.dependencies or key.section != unit.section or (unit.option is not None and key.option != unit.option):
+                continue
+            for dep_key in set(parse_obj.dependencies.get(key).dependencies.values()):
+                try:
+                    dep = self._unit(dep_key.section, dep_key.option)
+                except KeyError:
+                    continue
+                dependencies.append(dep)
+                self._run(dep, running)
+        self._dependencies[unit] = dependencies
+        running.discard(unit)
+
+    def _static_dependencies(self, step):
+        res = []
+        for name in step.dependencies or ():
+            ref = step.validator_kwargs.get(name)
+            if isinstance(ref, tuple) and len(ref) == 2:
+                try:
+                    res.append(self._unit(*ref))
+                except (KeyError, TypeError):
+                    # reported by add_value
+                    pass
+        return res
+
+
+class LazySection(Mapping):
+
+    """section of a LazyResult
+
+    Access to an option validates only this option (and its dependencies).
+    Iteration validates the whole section.
+    """
+
+    __slots__ = ("_result", "_section")
+
+    def __init__(self, result, section):
+        self._result = result
+        self._section = section
+
+    def __getitem__(self, option):
+        return self._result._get(self._section, option)
+
+    def __iter__(self):
+        return iter(list(self._result._section(self._section)))
+
+    def __len__(self):
+        return len(self._result._section(self._section))
+
+    def __contains__(self, option):
+        try:
+            self[option]
+        except KeyError:
+            return False
+        return True
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        val = self[name]
+        if isinstance(val, dict) and not isinstance(val, AttributeDict):
+            return AttributeDict(val)
+        return val
+
+    def __repr__(self):
+        return "LazySection({section!r})".format(section=self._section)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import io
+import os
+from bisect import bisect_right
+from six import string_types
+from configvalidator.tools.cache import LRUCache, make_key
+from configvalidator.tools.exceptions import InitException
+
+
+class NetworkIndex(object):
+
+    """set of networks for fast lookups of ip addresses (integers)
+
+    The networks are stored as sorted, disjoint intervals [first address, last address].
+    A lookup is a binary search: O(log n) for n intervals.
+
+    Attributes:
+        networks: number of networks the index was built from
+    """
+
+    __slots__ = ("networks", "_starts", "_ends")
+
+    def __init__(self, intervals):
+        """
+        :param intervals: iterable of (first address, last address) tuples, in any order, can overlap
+        """
+        starts = []
+        ends = []
+        count = 0
+        for start, end in sorted(intervals):
+            count += 1
+            if ends and start <= ends[-1] + 1:
+                # overlapping or adjacent
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        self.networks = count
+        self._starts = starts
+        self._ends = ends
+
+    def __contains__(self, ip):
+        idx = bisect_right(self._starts, ip)
+        return idx > 0 and ip <= self._ends[idx - 1]
+
+    def __len__(self):
+        """number of disjoint intervals"""
+        return len(self._starts)
+
+    def __repr__(self):
+        return "NetworkIndex(networks={networks}, intervals={intervals})".format(networks=self.networks, intervals=len(self))
+
+
+# shared by all validator instances: (family, networks) -> NetworkIndex
+NETWORK_INDEX_CACHE = LRUCache(maxsize=64)
+
+
+def read_networks(path):
+    """the networks of a file: one network per line, "#" starts a comment"""
+    res = []
+    with io.open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line != "":
+                res.append(line)
+    return res
+
+
+def network_index(family, networks, parse_network):
+    """the (shared) index for a list of networks or a file with networks
+
+    Networks of the other address family are skipped, so one list can be used
+    for ipv4 and ipv6. The index of a file is built again if the file changes.
+
+    Args:
+        family: "ipv4" or "ipv6"
+        networks: list of networks (IP/CIDR or IP for a single address) or the path of a file
+        parse_network: function network -> (first address, last address) of the family
+
+    Returns:
+        NetworkIndex
+
+    Raises:
+        InitException: if a network is not valid or the file can't be read
+    """
+    if isinstance(networks, string_types):
+        try:
+            stat = os.stat(networks)
+        except OSError as e:
+            raise InitException("can't read network file '{path}': {msg}".format(path=networks, msg=e))
+        key = (family, "file", os.path.abspath(networks), stat.st_mtime, stat.st_size)
+    else:
+        try:
+            key = (family, make_key(networks))
+        except TypeError:
+            key = None
+    index = None if key is None else NETWORK_INDEX_CACHE.get(key)
+    if index is None:
+        if isinstance(networks, string_types):
+            try:
+                networks = read_networks(networks)
+            except (IOError, OSError, UnicodeDecodeError) as e:
+                raise InitException("can't read network file '{path}': {msg}".format(path=networks, msg=e))
+        index = NetworkIndex(_intervals(family, networks, parse_network))
+        if key is not None:
+            NETWORK_INDEX_CACHE.set(key, index)
+    return index
+
+
+def _intervals(family, networks, parse_network):
+    for network in networks:
+        if not isinstance(network, string_types):
+            raise InitException("invalid network {network!r}: must be a string".format(network=network))
+        if (":" in network) != (family == "ipv6"):
+            continue
+        try:
+            yield parse_network(network)
+        except Exception as e:
+            raise InitException("invalid network '{network}': {msg}".format(network=network, msg=e))
@@ -3,20 +3,33 @@
 :copyright: (c) 2015 by Jan-Hendrik Dolling.
 :license: Apache 2.0, see LICENSE for more details.
 """
+import time
+import timeit
 import logging
+import functools
 from collections import namedtuple
-from configvalidator.tools.exceptions import ParserException
+from configvalidator.tools.exceptions import ParserException, ErrorRecord
+from configvalidator.tools.cache import VALIDATOR_CACHE, make_key
+from configvalidator.tools.graph import DependencyGraph
 from configvalidator.tools.result import AttributeDict
 from six import string_types
 
 
 logger = logging.getLogger(__name__)
 IniKey = namedtuple("IniKey", ["section", "option"])
+_MISSING = object()
+
+
+def _now_ns():
+    return int(timeit.default_timer() * 1000000000)
+
+
+_now_ns = getattr(time, "perf_counter_ns", _now_ns)
 
 
 class ParseObj(object):
 
-    def __init__(self, cp, cp_init_args=None, context_data=None):
+    def __init__(self, cp, cp_init_args=None, context_data=None, validator_cache=VALIDATOR_CACHE, executor=None, previous=None, hooks=None, stats=None, max_errors=None, keep_state=False):
         self.cp = cp
         self.cp_init_args = cp_init_args
         if self.cp_init_args is None:
@@ -28,25 +41,61 @@ class ParseObj(object):
         self.current_section = None
         self.current_option = None
         self.parsed_values = {}
-        self.future_values_key_item = {}
-        self.future_values_key_dep = {}
+        # items which wait for dependencies
+        self.dependencies = DependencyGraph()
         self.errors = []
+        # cache for validator instances. None disables the cache
+        self.validator_cache = validator_cache
+        self._data_key = None
+        # executor for blocking validators (see prefetch). None runs everything serial
+        self.executor = executor
+        self._prefetched = {}
+        # state of a previous parse, whose values can be reused (see ConfigValidator.revalidate)
+        self.previous = previous
+        # the raw input for every section/option
+        self.raw_values = {}
+        # True if a validator depends on the environment (file system, network, time).
+        # such results must not be cached (see ResultCache)
+        self.volatile = False
+        # functions hook(event, section, option, validator_name, elapsed_ns) or None (see ParseProfiler).
+        # event is "init" (validator construction), "validate" or "resolve" (options which waited for
+        # this option, the time contains their init and validate events)
+        self.hooks = tuple(hooks) if hooks else None
+        # ParseStats or None
+        self.stats = stats
+        # the parse stops if this number of errors is reached. None collects all errors
+        self.max_errors = max_errors
+        self.stopped = False
+        # True if the result keeps the state for ConfigValidator.revalidate
+        self.keep_state = keep_state
+        if stats is not None:
+            stats.bytes_read = getattr(cp, "bytes_read", None)
 
     def result(self):
         assert self.current_section is None
         assert self.current_option is None
+        if self.stopped:
+            # the options which wait for dependencies were skipped, they are no errors
+            raise ParserException.from_errors(self.errors[:self.max_errors])
         errors = list(self.errors)
-        if self.future_values_key_item or self.future_values_key_dep:
+        for circle in self.dependencies.cycles():
+            # reported for the item which closed the circle
+            cur_key = circle[-1]
+            refs = [key for key in circle if key != cur_key] or [cur_key]
+            errors.append(ErrorRecord("circle", cur_key.section, cur_key.option, args={
+                "refs": ", ".join("[{section}]{option}".format(section=key.section, option=key.option) for key in refs)}))
+        if self.dependencies:
             res = []
-            for dep in self.future_values_key_item:
+            for dep in self.dependencies:
                 res.append(
                     "'{section}'/'{option}'".format(
                         section=dep.section,
                         option=dep.option))
-            errors.append("not all dependencies resolved: {res}".format(res="|".join(res)))
+            errors.append(ErrorRecord("unresolved", args={"refs": "|".join(res)}))
         if len(errors) > 0:
-            raise ParserException("\n".join(errors))
-        return AttributeDict(self.parsed_values)
+            raise ParserException.from_errors(errors)
+        # the sections are wrapped once, attribute access returns them without a copy
+        return AttributeDict((section, AttributeDict(options)) for section, options in self.parsed_values.items())
 
     def add_value(
         self,
@@ -55,28 +104,50 @@ class ParseObj(object):
         dependencies_list=None,
         default=None,
         custom_validate_fn=None,
-            custom_error_fn=None):
+        custom_error_fn=None,
+            validator_key=None):
+        if self.stopped:
+            return
         # posebility to set cudtiom validate methods for one section/option
         # if it can be validated (dependencies resolved)
+        # a prefetched result can only be used for the default validation
+        prefetch_allowed = custom_validate_fn is None and not dependencies_list
         if custom_validate_fn is None:
             custom_validate_fn = self.validate
         if custom_error_fn is None:
             custom_error_fn = self._handle_error
+        stats = self.stats
+        if stats is not None:
+            stats_start = stats.start()
         # read value or check if default value should bee used
         if not self.cp.has_option(self.current_section, self.current_option):
             if default is None:
-                self.add_error("No value for Section/Option: '{section}'/'{option}'".format(section=self.current_section, option=self.current_option))
+                if stats is not None:
+                    stats.stop("read", stats_start)
+                self.add_error(ErrorRecord("missing", self.current_section, self.current_option, validator_class))
                 return
             else:
                 raw_value = default
         else:
             raw_value = self.cp.get(self.current_section, self.current_option)
+        cur_key = IniKey(section=self.current_section, option=self.current_option)
+        if stats is not None:
+            stats.stop("read", stats_start)
+        self.raw_values[cur_key] = raw_value
         # check dependencies
         if dependencies_list is None:
             dependencies_list = []
+        elif dependencies_list:
+            # resolved dependencies are written into a copy, so that the
+            # (possibly shared) init dict is never changed
+            validator_init_dict = dict(validator_init_dict)
+            # the precomputed key doesn't match the changed dict
+            validator_key = None
         need_work = {}
+        dependency_keys = []
         for dependencies_parameter in dependencies_list:
             dep_section, dep_option = validator_init_dict[dependencies_parameter]
+            dependency_keys.append(IniKey(section=dep_section, option=dep_option))
             if self.has_option(dep_section, dep_option):
                 # this dependencie can resolved instancly
                 validator_init_dict[dependencies_parameter] = self.get(dep_section, dep_option)
@@ -84,126 +155,264 @@ class ParseObj(object):
                 # this dependencie need to be resolved later. mayby at the end
                 # of the parsing process
                 need_work[dependencies_parameter] = (dep_section, dep_option)
+        if stats is not None:
+            stats.add_option(_validator_name(validator_class), cur_key, dependency_keys)
         # check if future work is needed
-        cur_key = IniKey(section=self.current_section, option=self.current_option)
         if not need_work:
+            if stats is not None:
+                stats_start = stats.start()
             # all dependenvies where resolves, so this entry can be validated
             # instancly
+            job = self._prefetched.pop(cur_key, None) if prefetch_allowed else None
+            # the prefetch job reports its own events
+            hooks = self.hooks if job is None else None
+            if hooks is not None:
+                start = _now_ns()
             try:
-                validator = self._get_validator(validator_class, validator_init_dict)
+                validator = self._get_previous(cur_key, validator_class, raw_value, dependency_keys, custom_validate_fn)
+                if validator is not None:
+                    pass
+                elif job is not None and job.matches(validator_class, raw_value):
+                    validator = job.get_validator()
+                else:
+                    validator = self._get_validator(validator_class, validator_init_dict, validator_key)
             except Exception as e:
-                self._handle_error(section=self.current_section, option=self.current_option, error=str(e))
+                if hooks is not None:
+                    self._call_hooks("init", cur_key, validator_class, start)
+                if stats is not None:
+                    stats.stop("validate", stats_start)
+                self._handle_error(section=self.current_section, option=self.current_option, error=e, validator=validator_class)
                 return
+            if hooks is not None:
+                self._call_hooks("init", cur_key, validator_class, start)
+            self._check_volatile(validator_class, validator)
             try:
-                custom_validate_fn(self.current_section, self.current_option, validator, raw_value)
-                self._resolve_dep(cur_key)
+                if hooks is None:
+                    custom_validate_fn(self.current_section, self.current_option, validator, raw_value)
+                else:
+                    start = _now_ns()
+                    try:
+                        custom_validate_fn(self.current_section, self.current_option, validator, raw_value)
+                    finally:
+                        self._call_hooks("validate", cur_key, validator_class, start)
             except Exception as e:
-                custom_error_fn(section=self.current_section, option=self.current_option, error=e)
+                if stats is not None:
+                    stats.stop("validate", stats_start)
+                self._call_error_fn(custom_error_fn, self.current_section, self.current_option, e, validator_class)
+                return
+            if stats is not None:
+                stats.stop("validate", stats_start)
+            try:
+                self._resolve_dep(cur_key, validator_class)
+            except Exception as e:
+                self._call_error_fn(custom_error_fn, self.current_section, self.current_option, e, validator_class)
         else:
             # check for syntax error in the depends dict
             for k, v in need_work.items():
                 if (not isinstance(k, string_types) or not isinstance(v, tuple) or not len(v) == 2 or not len([x for x in v if isinstance(x, string_types)]) == 2):
-                    self.add_error("error validating [{section}]{option}: depends syntax: 'str: (str, str)'".format(section=self.current_section, option=self.current_option))
+                    self.add_error(ErrorRecord("depends_syntax", self.current_section, self.current_option, validator_class))
                     return
             # generate dependencies dict
             gen_depend_dict = {}
             for k, (s, o) in need_work.items():
                 gen_depend_dict[k] = IniKey(section=s, option=o)
+            if stats is not None:
+                stats.deferred += 1
             # add an future to calculate this entry, if the needed dependencies
-            # ar avalabil
-            self.future_values_key_item[cur_key] = {
+            # ar avalabil. circle references are reported by *result*
+            self.dependencies.add(cur_key, {
                 "custom_validate_fn": custom_validate_fn,
                 "custom_error_fn": custom_error_fn,
                 "validator_class": validator_class,
                 "validator_config": validator_init_dict,
                 "value": raw_value,
-                "dependencies": gen_depend_dict,
-            }
-            # set the data structur for easy accesing dependencies
-            for dep in self.future_values_key_item[cur_key]["dependencies"].values():
-                if dep not in self.future_values_key_dep:
-                    self.future_values_key_dep[dep] = []
-                # check for circle ref
-                if cur_key in self._get_all_refs(dep):
-                    self.add_error("error validating [{section}]{option}: circle reference with [{section_dep}]{option_dep}".format(section=cur_key.section, option=cur_key.option, section_dep=dep.section, option_dep=dep.option))
-                    return
-                self.future_values_key_dep[dep].append(cur_key)
+                "dependency_keys": dependency_keys,
+            }, gen_depend_dict)
 
-    def _resolve_dep(self, key):
+    def prefetch(self, validator_class, validator_init_dict, default=None, validator_key=None):
+        """
+        start the validation for the current section/option in the executor.
+
+        only blocking (or async) validators without dependencies are started. *add_value* uses the
+        result later, if it is called with the same validator and no custom validate function.
+        So the results and the order of the errors are the same as without the executor.
+        """
+        if self.executor is None or not self._prefetch_validator(validator_class):
+            return
+        if not self.cp.has_option(self.current_section, self.current_option):
+            if default is None:
+                return
+            raw_value = default
+        else:
+            raw_value = self.cp.get(self.current_section, self.current_option)
+        cur_key = IniKey(section=self.current_section, option=self.current_option)
+        job_fn = self._prefetch_job if self.hooks is None else functools.partial(self._prefetch_job, key=cur_key)
+        future = self.executor.submit(job_fn, validator_class, validator_init_dict, validator_key, raw_value)
+        self._prefetched[cur_key] = PrefetchedValidator(validator_class, raw_value, future)
+
+    def _prefetch_validator(self, validator_class):
+        if getattr(validator_class, "blocking", False) is True:
+            return True
+        # executors of aparse run validators with avalidate
+        return getattr(self.executor, "supports_async", False) is True and getattr(validator_class, "avalidate", None) is not None
+
+    def _prefetch_job(self, validator_class, validator_init_dict, validator_key, raw_value, key=None):
+        # runs in a thread of the executor, so the hooks must be thread safe
+        hooks = self.hooks
+        if hooks is not None:
+            start = _now_ns()
+        try:
+            validator = self._get_validator(validator_class, validator_init_dict, validator_key)
+        except Exception as e:
+            return False, e
+        finally:
+            if hooks is not None:
+                self._call_hooks("init", key, validator_class, start)
+                start = _now_ns()
+        try:
+            return True, (validator.validate(raw_value), None)
+        except Exception as e:
+            return True, (None, e)
+        finally:
+            if hooks is not None:
+                self._call_hooks("validate", key, validator_class, start)
+
+    def _call_hooks(self, event, key, validator_class, start):
+        elapsed_ns = _now_ns() - start
+        name = _validator_name(validator_class)
+        for hook in self.hooks:
+            hook(event, key.section, key.option, name, elapsed_ns)
+
+    def _resolve_dep(self, key, validator_class=None):
         """
         this method resolves dependencies for the given key.
         call the method afther the item "key" was added to the list of avalable items
+
+        the items are handled in topological order without recursion:
+        all items which only waited for "key" are validated, afterwards the
+        same is done for every item that was validated successfully.
         """
-        if key in self.future_values_key_dep:
-            # there are some dependencies that can be resoled
-            dep_list = self.future_values_key_dep[key]
-            del self.future_values_key_dep[key]  # remove dependencies
+        if not self.has_option(key.section, key.option):
+            return
+        if not self.dependencies or self.stopped:
+            return
+        if self.hooks is None and self.stats is None:
+            self.__resolve_dep_stack(key)
+            return
+        if self.stats is not None:
+            stats_start = self.stats.start()
+        start = _now_ns()
+        try:
+            self.__resolve_dep_stack(key)
+        finally:
+            if self.stats is not None:
+                self.stats.stop("resolve", stats_start)
+            if self.hooks is not None:
+                self._call_hooks("resolve", key, validator_class or type(None), start)
+
+    def __resolve_dep_stack(self, key):
+        stack = [key]
+        while stack and not self.stopped:
             also_finish = []
-            # iterate over the dependencies that can now be resoled
-            for dep in dep_list:
-                if self.__resolve_dep_helper(dep, key) is True:
-                    also_finish.append(dep)
-            # maybe the resolving process leed to new deps that can be resolved
-            for dep in also_finish:
-                self._resolve_dep(dep)
-
-    def __resolve_dep_helper(self, dep, key):
-        # in the item "dep" the dependencie "key" can be resolved
-        data = self.future_values_key_item[dep]["dependencies"]
-        args = {}
-        new_data = {}
-        for arg_name, dependent_from in data.items():
-            if key == dependent_from:
-                args[arg_name] = self.get(dependent_from.section, dependent_from.option)
-            else:
-                new_data[arg_name] = dependent_from
-        self.future_values_key_item[dep]["dependencies"] = new_data
-        new_config = self.future_values_key_item[dep]["validator_config"]
-        for k, v in args.items():
-            new_config[k] = v
-        self.future_values_key_item[dep]["validator_config"] = new_config
-        if not new_data:
-            # resolve this item
-            custom_validate_fn = self.future_values_key_item[dep]["custom_validate_fn"]
-            custom_error_fn = self.future_values_key_item[dep]["custom_error_fn"]
+            for item in self.dependencies.available(stack.pop()):
+                if self.__resolve_dep_helper(item) is True:
+                    also_finish.append(item.key)
+            # the first finished item is handled first
+            stack.extend(reversed(also_finish))
+
+    def __resolve_dep_helper(self, item):
+        # all dependencies of the item are available
+        data = item.data
+        new_config = dict(data["validator_config"])
+        for arg_name, dependent_from in item.dependencies.items():
+            new_config[arg_name] = self.get(dependent_from.section, dependent_from.option)
+        dep = item.key
+        hooks = self.hooks
+        try:
+            if hooks is not None:
+                start = _now_ns()
             try:
-                validator = self._get_validator(self.future_values_key_item[dep]["validator_class"], self.future_values_key_item[dep]["validator_config"])
-                custom_validate_fn(dep.section, dep.option, validator, self.future_values_key_item[dep]["value"])
-                del self.future_values_key_item[dep]
-                return True
-            except Exception as e:
-                custom_error_fn(section=dep.section, option=dep.option, error=e)
-        return False
+                validator = self._get_previous(dep, data["validator_class"], data["value"], data["dependency_keys"], data["custom_validate_fn"])
+                if validator is None:
+                    validator = self._get_validator(data["validator_class"], new_config)
+            finally:
+                if hooks is not None:
+                    self._call_hooks("init", dep, data["validator_class"], start)
+                    start = _now_ns()
+            self._check_volatile(data["validator_class"], validator)
+            try:
+                data["custom_validate_fn"](dep.section, dep.option, validator, data["value"])
+            finally:
+                if hooks is not None:
+                    self._call_hooks("validate", dep, data["validator_class"], start)
+        except Exception as e:
+            self._call_error_fn(data["custom_error_fn"], dep.section, dep.option, e, data["validator_class"])
+            return False
+        self.dependencies.remove(dep)
+        return self.has_option(dep.section, dep.option)
+
+    def _check_volatile(self, validator_class, validator):
+        # blocking validators depend on the environment. a instance can also
+        # be blocking, e.g. if it contains blocking sub validators
+        if getattr(validator_class, "blocking", False) is True or getattr(validator, "blocking", False) is True:
+            self.volatile = True
+
+    def _get_previous(self, key, validator_class, raw_value, dependency_keys, validate_fn):
+        """
+        validator which returns the value from the previous parse or None.
+
+        the value is reused if the raw value is the same and the values of all
+        dependencies are unchanged. Blocking validators depend on the environment
+        (file system, network), so they are always executed again.
+        A custom validate function can store something else than *validator.validate(raw_value)*,
+        so it gets the real validator, unless it declares *reuse_previous = True*.
+        """
+        previous = self.previous
+        if previous is None or getattr(validator_class, "blocking", False) is True:
+            return None
+        if validate_fn != self.validate and getattr(validate_fn, "reuse_previous", False) is not True:
+            return None
+        if previous.raw_values.get(key, _MISSING) != raw_value:
+            return None
+        for dep in dependency_keys:
+            if previous.value(dep) != self.parsed_values[dep.section][dep.option]:
+                return None
+        value = previous.value(key)
+        if value is _MISSING:
+            return None
+        return ReusedValidator(value)
+
+    def state(self, plan):
+        """the state that is needed to revalidate the result later"""
+        from configvalidator.tools.basics import GLOBAL_DATA
+        data = dict(GLOBAL_DATA)
+        data.update(self.context_data)
+        return ParseState(plan, data, self.raw_values, self.parsed_values)
+
+    def _call_error_fn(self, error_fn, section, option, error, validator_class):
+        if error_fn == self._handle_error:
+            self._handle_error(section=section, option=option, error=error, validator=validator_class)
+        else:
+            error_fn(section=section, option=option, error=error)
 
-    def _handle_error(self, section, option, error):
-        self.add_error("error validating [{section}]{option}: {msg}".format(section=section,
-                                                                            option=option,
-                                                                            msg=error))
+    def _handle_error(self, section, option, error, validator=None):
+        self.add_error(ErrorRecord("value", section, option, validator, {"error": error}))
 
     def add_error(self, error_msg, exception=None):
-        logger.debug(error_msg)
+        """add an error
+
+        :param error_msg: the message or an ErrorRecord, which is formatted when it is rendered
+        :param exception: the exception which caused the error
+        """
+        logger.debug("%s", error_msg)
         if exception is not None:
             logger.debug(exception)
         self.errors.append(error_msg)
-
-    def _get_all_refs(self, dep, handled_refs=None):
-        """
-        get al list of all dependencies for the given item "dep"
-        """
-        if handled_refs is None:
-            handled_refs = [dep]
-        else:
-            if dep in handled_refs:
-                return []
-        res = []
-        if dep in self.future_values_key_item:
-            res.extend(
-                self.future_values_key_item[dep]["dependencies"].values())
-            add = []
-            for h_d in res:
-                add.extend(self._get_all_refs(h_d, handled_refs))
-            res.extend(add)
-        return list(set(res))
+        if self.max_errors is not None and len(self.errors) >= self.max_errors and not self.stopped:
+            self.stopped = True
+            # the started validations are not needed anymore
+            for job in self._prefetched.values():
+                job.cancel()
 
     def get(self, section, option):
         return self.parsed_values[section][option]
@@ -223,14 +432,128 @@ class ParseObj(object):
                     option=option))
         self.parsed_values[section][option] = value
 
-    def _get_validator(self, validator_class, validator_init_dict):
+    def _get_validator(self, validator_class, validator_init_dict, validator_key=None):
+        key = None
+        if self.validator_cache is not None and getattr(validator_class, "cacheable", False) is True:
+            key = self._get_validator_key(validator_class, validator_init_dict, validator_key)
+            if key is not None:
+                validator = self.validator_cache.get(key)
+                if validator is not None:
+                    if self.stats is not None:
+                        self.stats.add_validator(reused=True)
+                    return validator
         try:
-            return validator_class(self, **validator_init_dict)
+            validator = validator_class(self, **validator_init_dict)
         except Exception as e:
             raise ParserException(
                 "error init validator '{name}'".format(
                     name=validator_class.name),
                 e)
+        if self.stats is not None:
+            self.stats.add_validator(cacheable=key is not None)
+        # a instance can withdraw the class decision, e.g. if it contains not cacheable sub validators
+        if key is not None and getattr(validator, "cacheable", False) is True:
+            self.validator_cache.set(key, validator)
+        return validator
+
+    def _get_validator_key(self, validator_class, validator_init_dict, validator_key=None):
+        """
+        cache key for a validator: the validator class, the init parameter and the data,
+        which is set as "data" attribute to new instances.
+        validator_key is the already computed key for the init parameter (see make_key).
+        returns None if the key can't be generated (not hashable input).
+        """
+        if self._data_key is None:
+            from configvalidator.tools.basics import GLOBAL_DATA
+            data = dict(GLOBAL_DATA)
+            data.update(self.context_data)
+            try:
+                self._data_key = (make_key(data),)
+            except TypeError:
+                self._data_key = False
+        if self._data_key is False:
+            return None
+        if validator_key is not None:
+            return validator_class, validator_key, self._data_key
+        try:
+            return validator_class, make_key(validator_init_dict), self._data_key
+        except TypeError:
+            return None
 
     def validate(self, section, option, validator, raw_value):
         self.add(section, option, validator.validate(raw_value))
+
+
+def _validator_name(validator_class):
+    return getattr(validator_class, "name", None) or validator_class.__name__
+
+
+class PrefetchedValidator(object):
+
+    """validator which returns the result of a validation that was started by *ParseObj.prefetch*"""
+
+    def __init__(self, validator_class, raw_value, future):
+        self.validator_class = validator_class
+        self.raw_value = raw_value
+        self._future = future
+        self._value = None
+        self._error = None
+
+    def matches(self, validator_class, raw_value):
+        return self.validator_class is validator_class and self.raw_value == raw_value
+
+    def cancel(self):
+        self._future.cancel()
+
+    def get_validator(self):
+        created, res = self._future.result()
+        if not created:
+            # the validator could not be created
+            raise res
+        self._value, self._error = res
+        return self
+
+    def validate(self, value):
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class ReusedValidator(object):
+
+    """validator which returns the value of a previous parse"""
+
+    def __init__(self, value):
+        self._value = value
+
+    def validate(self, value):
+        return self._value
+
+
+class ParseState(namedtuple("ParseState", ["plan", "data", "raw_values", "values"])):
+
+    """state of a finished parse, used by *ConfigValidator.revalidate*
+
+    Attributes:
+        plan: the compiled config dict
+        data: the data for the validators (global and context data)
+        raw_values: dict with IniKey -> raw input
+        values: dict with section -> option -> validated value
+    """
+
+    __slots__ = ()
+
+    def value(self, key):
+        """the validated value for the IniKey or _MISSING"""
+        return self.values.get(key.section, {}).get(key.option, _MISSING)
+
+    def changed_keys(self, values):
+        """set with the IniKeys, whose values are different in the given values"""
+        res = set()
+        for section in set(self.values) | set(values):
+            old = self.values.get(section, {})
+            new = values.get(section, {})
+            for option in set(old) | set(new):
+                if old.get(option, _MISSING) != new.get(option, _MISSING):
+                    res.add(IniKey(section=section, option=option))
+        return res
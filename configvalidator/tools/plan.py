@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import logging
+from collections import namedtuple
+from configvalidator.tools.cache import make_key
+from configvalidator.tools.exceptions import ErrorRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaPlan(object):
+
+    """compiled form of a config dict
+
+    A plan is created by *ConfigValidator.compile* and holds for every section
+    a step with the already loaded features, validator classes and validator
+    parameters. Running a plan against a ParseObj skips the interpretation
+    of the config dict, so one plan can be used for any number of parse runs.
+
+    Attributes:
+        sections: tuple with one step per section
+        feature_key: the feature key that was used to compile the plan
+        fingerprint: digest of the plan, which is the same in every process (see ResultCache).
+                     Raises TypeError if the plan contains values without a stable representation.
+    """
+
+    __slots__ = ("_sections", "_feature_key", "_fingerprint")
+
+    def __init__(self, sections, feature_key="__feature__"):
+        self._sections = tuple(sections)
+        self._feature_key = feature_key
+        self._fingerprint = None
+
+    @property
+    def sections(self):
+        return self._sections
+
+    @property
+    def feature_key(self):
+        return self._feature_key
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            from configvalidator.tools.resultcache import fingerprint
+            self._fingerprint = fingerprint((self._sections, self._feature_key))
+        return self._fingerprint
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __getstate__(self):
+        return self._sections, self._feature_key
+
+    def __setstate__(self, state):
+        self._sections, self._feature_key = state
+        self._fingerprint = None
+
+    def run(self, parse_obj):
+        """run all steps against the given parser object
+
+        Args:
+            parse_obj: parser object which stores the data
+        """
+        if parse_obj.executor is not None:
+            self.prefetch(parse_obj)
+        for step in self._sections:
+            if parse_obj.stopped:
+                break
+            parse_obj.current_section = step.section
+            try:
+                step.run(parse_obj)
+            except Exception as e:
+                parse_obj.add_error(ErrorRecord("section", step.section, args={"error": e}), exception=e)
+        parse_obj.current_section = None
+        parse_obj.current_option = None
+
+    def prefetch(self, parse_obj):
+        """start the blocking validations in the executor of the parser object
+
+        Steps can implement *prefetch(parse_obj)*. Errors are ignored here,
+        they are reported when the step runs.
+        """
+        for step in self._sections:
+            prefetch = getattr(step, "prefetch", None)
+            if prefetch is None:
+                continue
+            parse_obj.current_section = step.section
+            try:
+                prefetch(parse_obj)
+            except Exception as e:
+                logger.debug(e)
+        parse_obj.current_section = None
+        parse_obj.current_option = None
+
+
+class SectionStep(namedtuple("SectionStep", ["section", "feature_class", "config"])):
+
+    """section with a feature that is not compilable
+
+    the feature is instanced and called for every parse run.
+    The config is a read only view, so all runs can share it.
+    """
+
+    __slots__ = ()
+
+    def run(self, parse_obj):
+        feature = self.feature_class(parse_obj, **self.config)
+        feature.parse_section(parse_obj, self.config)
+
+
+class CompiledSectionStep(namedtuple("CompiledSectionStep", ["section", "options", "error"])):
+
+    """section with already compiled options
+
+    Attributes:
+        section: the section name
+        options: tuple with one step per option
+        error: exception which was raised during compiling the section or None.
+               The options before the error are still part of the step.
+    """
+
+    __slots__ = ()
+
+    def run(self, parse_obj):
+        for step in self.options:
+            if parse_obj.stopped:
+                break
+            parse_obj.current_option = step.option
+            step.run(parse_obj)
+        parse_obj.current_option = None
+        if self.error is not None:
+            raise self.error
+
+    def prefetch(self, parse_obj):
+        for step in self.options:
+            prefetch = getattr(step, "prefetch", None)
+            if prefetch is not None:
+                parse_obj.current_option = step.option
+                prefetch(parse_obj)
+        parse_obj.current_option = None
+
+
+class ErrorStep(namedtuple("ErrorStep", ["section", "error"])):
+
+    """section which could not be compiled at all"""
+
+    __slots__ = ()
+
+    def run(self, parse_obj):
+        raise self.error
+
+
+class OptionStep(namedtuple("OptionStep", ["option", "feature_class", "config"])):
+
+    """option with a feature that is not compilable"""
+
+    __slots__ = ()
+
+    def run(self, parse_obj):
+        feature = self.feature_class(parse_obj, **self.config)
+        feature.parse_option(parse_obj, self.config)
+
+
+class ValidatorStep(namedtuple("ValidatorStep", ["option", "validator_class", "validator_kwargs", "dependencies", "default", "validator_key"])):
+
+    """option which only needs a validator
+
+    Attributes:
+        option: the option name
+        validator_class: the loaded validator class
+        validator_kwargs: the validator parameters (read only mapping)
+        dependencies: tuple with the dependencies parameter names or None
+        default: the default value or None
+        validator_key: cache key for the validator parameters or None
+    """
+
+    __slots__ = ()
+
+    def run(self, parse_obj):
+        parse_obj.add_value(
+            self.validator_class,
+            self.validator_kwargs,
+            dependencies_list=self.dependencies,
+            default=self.default,
+            validator_key=self.validator_key)
+
+    def prefetch(self, parse_obj):
+        if not self.dependencies:
+            parse_obj.prefetch(self.validator_class, self.validator_kwargs, default=self.default, validator_key=self.validator_key)
+
+
+def validator_cache_key(validator_class, validator_kwargs):
+    """cache key for the validator parameters or None if the validator is not cacheable"""
+    if getattr(validator_class, "cacheable", False) is not True:
+        return None
+    try:
+        return make_key(validator_kwargs)
+    except TypeError:
+        return None
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import threading
+from configvalidator.tools.parser import IniKey
+
+
+class ParseProfiler(object):
+
+    """hook for *ConfigValidator.parse(hooks=[...])*, which collects the time per option and validator
+
+    usage:
+       >> profiler = ParseProfiler()
+       >> data = cv.parse(config_dict, hooks=[profiler])
+       >> print(profiler.report())
+
+    The time of an option is the sum of its init and validate events.
+    The resolve events are only counted in *events*, their time contains
+    the init and validate events of the options that waited for a dependency.
+    One profiler can collect the events of many parse runs (also from threads).
+
+    Attributes:
+        options: dict IniKey -> nanoseconds
+        validators: dict validator name -> [number of validations, nanoseconds]
+        events: dict event -> [number of events, nanoseconds]
+    """
+
+    def __init__(self):
+        self.options = {}
+        self.validators = {}
+        self.events = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event, section, option, validator_name, elapsed_ns):
+        with self._lock:
+            total = self.events.setdefault(event, [0, 0])
+            total[0] += 1
+            total[1] += elapsed_ns
+            if event == "resolve":
+                return
+            key = IniKey(section=section, option=option)
+            self.options[key] = self.options.get(key, 0) + elapsed_ns
+            total = self.validators.setdefault(validator_name, [0, 0])
+            if event == "validate":
+                total[0] += 1
+            total[1] += elapsed_ns
+
+    def clear(self):
+        with self._lock:
+            self.options.clear()
+            self.validators.clear()
+            self.events.clear()
+
+    def top(self, n=10):
+        """list with the n slowest options as (IniKey, nanoseconds)"""
+        with self._lock:
+            return sorted(self.options.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def validator_totals(self):
+        """list with (validator name, number of validations, nanoseconds), the slowest validator first"""
+        with self._lock:
+            return sorted(((name, count, ns) for name, (count, ns) in self.validators.items()), key=lambda item: item[2], reverse=True)
+
+    def report(self, n=10):
+        """the n slowest options and the time per validator as text"""
+        lines = ["slowest options:"]
+        for key, ns in self.top(n):
+            lines.append("  {us:>12.1f} us  [{section}]{option}".format(us=ns / 1000.0, section=key.section, option=key.option))
+        lines.append("validators:")
+        for name, count, ns in self.validator_totals():
+            lines.append("  {us:>12.1f} us  {count:>8}x  {name}".format(us=ns / 1000.0, count=count, name=name))
+        return "\n".join(lines)
@@ -25,16 +25,21 @@ assert res["SectionA"]["option1"] == res.SectionA.option1
 
     def __getattr__(self, name):
         """
-        TODO
+        nested AttributeDicts (the sections of a parse result) are returned
+        by reference, other dicts are wrapped into a new AttributeDict.
         """
         val = self[name]
         if isinstance(val, AttributeDict):
-            return AttributeDict(val)
+            return val
         elif isinstance(val, dict):
             return AttributeDict(val)
         else:
             return val
 
+    def __reduce__(self):
+        # pickle must not use __getattr__ to look for __getstate__
+        return AttributeDict, (dict(self),)
+
     def get(self, section, option):
         """
         TODO
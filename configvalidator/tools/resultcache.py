@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import io
+import os
+import time
+import pickle
+import hashlib
+import locale
+import logging
+import tempfile
+import threading
+from six import string_types, integer_types, binary_type
+from six.moves import configparser
+import configvalidator
+from configvalidator.tools import basics
+from configvalidator.tools.cache import LRUCache
+from configvalidator.tools.configValidator import ConfigValidator, run_plan
+from configvalidator.tools.parser import ParseObj
+from configvalidator.tools.plan import SchemaPlan
+from configvalidator.tools.view import Mapping
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache(object):
+
+    """cache for the results of ini files
+
+    The key of a result is the fingerprint of the compiled config dict, the
+    digest of the ini file content and the digest of the data for the validators.
+    So byte identical files share one result, no matter where they are stored.
+    The key also contains the package version and the namespace, so results of
+    another configvalidator version (or another namespace) are not used.
+
+    The results on disk are loaded with *pickle*, which can execute code.
+    Only use a directory that no untrusted user can write to.
+
+    Results of a parse with validators that depend on the environment (blocking
+    validators like path, file, dir, cert and freePort, or sub_ini files) are only
+    stored if *volatile_ttl* is set, and only for that time.
+    Failed parse runs are never stored.
+
+    The cached results are shared, so they must not be changed.
+
+    Attributes:
+        directory: directory for the on-disk tier or None
+        namespace: part of every key, e.g. to separate applications that share a directory
+        ttl: seconds a result is valid or None for no limit
+        volatile_ttl: seconds a result with environment dependent validators is valid. 0 disables them.
+        hits: number of results found in the cache (memory or disk)
+        disk_hits: number of results found on disk
+        misses: number of parse runs
+    """
+
+    def __init__(self, maxsize=128, directory=None, ttl=None, volatile_ttl=0, namespace=None):
+        """
+        :param maxsize: maximum number of results in memory
+        :param directory: directory for pickled results, which can be shared between processes and restarts.
+                          It must be trusted: the files are loaded with pickle.
+        :param ttl: seconds a result is valid or None for no limit
+        :param volatile_ttl: seconds a result with environment dependent validators is valid
+        :param namespace: string that is part of every key or None
+        """
+        self.directory = directory
+        self.namespace = namespace
+        self.ttl = ttl
+        self.volatile_ttl = volatile_ttl
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __len__(self):
+        return len(self._memory)
+
+    def parse(self, source, config_dict, cp_class=None, cp_init_args=None, data=None, feature_key="__feature__", encoding=None):
+        """validate an ini file or return the cached result
+
+        :param source: the ini file
+        :param config_dict: the config dict or a plan from *ConfigValidator.compile*
+        :param cp_class: the ConfigParser class. Default is *RawConfigParser*
+        :param cp_init_args: kwargs for new cp instances
+        :param data: dict with data for the validators (see *ConfigValidator.add_data*)
+        :param feature_key: the dict key for section features (ignored for a compiled plan)
+        :param encoding: encoding of the ini file. Default is the preferred encoding of the system.
+        :return: the result (AttributeDict)
+        :raises ParserException: if the input is not valid
+        """
+        if isinstance(config_dict, SchemaPlan):
+            plan = config_dict
+        else:
+            plan = ConfigValidator.compile(config_dict, feature_key=feature_key)
+        if cp_class is None:
+            cp_class = configparser.RawConfigParser
+        if cp_init_args is None:
+            cp_init_args = {}
+        context_data = {} if data is None else dict(data)
+        try:
+            with open(source, "rb") as f:
+                content = f.read()
+        except (IOError, OSError):
+            # read ignores missing files, so the result is the one of an empty file
+            content = b""
+        key = self.key(plan, content, cp_class, cp_init_args, context_data)
+        if key is not None:
+            res = self.get(key)
+            if res is not None:
+                return res
+        with self._lock:
+            self.misses += 1
+        cp = cp_class(**cp_init_args)
+        if hasattr(cp, "read_file"):
+            # the content with the computed digest is parsed, not a newer version of the file
+            cp.read_file(io.StringIO(content.decode(encoding or locale.getpreferredencoding(False))), source)
+        else:
+            cp.read(source)
+        parse_obj = ParseObj(cp, cp_init_args=cp_init_args, context_data=context_data)
+        res = run_plan(plan, parse_obj)
+        if key is not None:
+            self.set(key, res, volatile=parse_obj.volatile)
+        return res
+
+    def key(self, plan, content, cp_class, cp_init_args, context_data):
+        """the cache key (hex string) or None if the input has no stable fingerprint"""
+        try:
+            plan_fingerprint = plan.fingerprint
+            data = dict(basics.GLOBAL_DATA)
+            data.update(context_data)
+            parts = (
+                configvalidator.__version__,
+                fingerprint(self.namespace),
+                plan_fingerprint,
+                hashlib.sha256(content).hexdigest(),
+                fingerprint((cp_class, cp_init_args)),
+                fingerprint(data))
+        except TypeError as e:
+            logger.debug(e)
+            return None
+        return hashlib.sha256("|".join(parts).encode("ascii")).hexdigest()
+
+    def get(self, key):
+        """the cached result for the key or None"""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and (entry[0] is None or entry[0] > now):
+            with self._lock:
+                self.hits += 1
+            return entry[1]
+        entry = self._load(key)
+        if entry is not None and (entry[0] is None or entry[0] > now):
+            self._memory.set(key, entry)
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+            return entry[1]
+        return None
+
+    def set(self, key, result, volatile=False):
+        """store a result
+
+        :param key: the cache key (see *key*)
+        :param result: the result
+        :param volatile: True if the result depends on the environment
+        """
+        ttl = self.ttl
+        if volatile:
+            if not self.volatile_ttl:
+                return
+            ttl = self.volatile_ttl if ttl is None else min(ttl, self.volatile_ttl)
+        entry = (None if ttl is None else time.time() + ttl, result)
+        self._memory.set(key, entry)
+        self._store(key, entry)
+
+    def clear(self):
+        """remove all results (also on disk) and reset the counters"""
+        self._memory.clear()
+        with self._lock:
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            # broken file, e.g. from an older version
+            logger.debug(e)
+            return None
+
+    def _store(self, key, entry):
+        if self.directory is None:
+            return
+        try:
+            content = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # the values of custom validators are maybe not pickleable
+            logger.debug(e)
+            return
+        # other processes never read a partly written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            _replace(tmp_path, self._path(key))
+        except (IOError, OSError) as e:
+            logger.debug(e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+_replace = getattr(os, "replace", os.rename)
+_SCALAR_TYPES = frozenset(string_types + integer_types + (binary_type, bool, float))
+
+
+def fingerprint(value):
+    """stable digest of a value (e.g. a plan), which is the same in every process
+
+    mappings, lists, tuples, sets, classes and exceptions are handled recursively.
+
+    :param value: the value
+    :return: hex string
+    :raises TypeError: if a part of the value has no stable representation (e.g. a function)
+    """
+    out = []
+    _canonical(value, out)
+    return hashlib.sha256(u"".join(out).encode("utf-8")).hexdigest()
+
+
+def _canonical(value, out):
+    value_type = type(value)
+    if value is None or value_type in _SCALAR_TYPES or isinstance(value, string_types + integer_types + (binary_type, float)):
+        out.append(value_type.__name__ + u":" + repr(value) + u";")
+    elif isinstance(value, type):
+        out.append(u"class:" + value.__module__ + u"." + getattr(value, "__qualname__", value.__name__) + u";")
+    elif isinstance(value, SchemaPlan):
+        out.append(u"plan:" + value.fingerprint + u";")
+    elif isinstance(value, (list, tuple)):
+        # the class name separates the steps of a plan
+        out.append(value_type.__name__ + u"[")
+        for item in value:
+            _canonical(item, out)
+        out.append(u"]")
+    elif isinstance(value, Mapping):
+        items = []
+        for k, v in value.items():
+            item_out = []
+            _canonical(k, item_out)
+            _canonical(v, item_out)
+            items.append(u"".join(item_out))
+        out.append(u"{" + u"".join(sorted(items)) + u"}")
+    elif isinstance(value, (set, frozenset)):
+        items = []
+        for item in value:
+            item_out = []
+            _canonical(item, item_out)
+            items.append(u"".join(item_out))
+        out.append(u"set{" + u"".join(sorted(items)) + u"}")
+    elif isinstance(value, BaseException):
+        _canonical(value_type, out)
+        _canonical(value.args, out)
+    else:
+        raise TypeError("no stable fingerprint for {value!r}".format(value=value))
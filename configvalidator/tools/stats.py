@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import time
+import timeit
+import threading
+
+
+_cpu_time = getattr(time, "process_time", None) or time.clock
+PHASES = ("prepare", "read", "validate", "resolve", "result")
+
+
+class ParseStats(object):
+
+    """statistics of a parse run, returned by *ConfigValidator.parse(with_stats=True)*
+
+    The phases are "prepare" (compile the config dict), "read" (the raw values
+    from the cp instance), "validate" (validator instances and validation of the
+    options), "resolve" (validation of the options which waited for a dependency)
+    and "result" (build the result dict). The times of sub_ini files are part of
+    the validate phase of the option. With threads the validate phase is the time
+    the parse waited for the threads.
+
+    Attributes:
+        options: dict validator name -> number of options
+        deferred: number of options which waited for a dependency
+        validators_created: number of new validator instances
+        validators_reused: number of validator instances from the validator cache
+        cache_misses: number of cacheable validators that were not in the cache
+        cache_hits: the same as validators_reused, instances are only reused by the validator cache
+        bytes_read: size of the ini files or None if the cp instance doesn't report it (see IniReader)
+        sub_ini_files: number of parsed sub_ini files
+        sub_ini_bytes_read: size of the sub_ini files
+        wall: dict phase -> seconds
+        cpu: dict phase -> cpu seconds of the process
+        max_depth: length of the longest chain of dependencies
+    """
+
+    def __init__(self):
+        self.options = {}
+        self.deferred = 0
+        self.validators_created = 0
+        self.validators_reused = 0
+        self.cache_misses = 0
+        self.bytes_read = None
+        self.sub_ini_files = 0
+        self.sub_ini_bytes_read = 0
+        self.wall = dict((phase, 0.0) for phase in PHASES)
+        self.cpu = dict((phase, 0.0) for phase in PHASES)
+        # IniKey -> IniKeys it depends on
+        self._edges = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_hits(self):
+        return self.validators_reused
+
+    @property
+    def max_depth(self):
+        depth = {}
+        for key in self._edges:
+            if key in depth:
+                continue
+            # iterative depth first search, keys in a circle count once
+            stack = [(key, iter(self._edges[key]))]
+            depth[key] = None
+            while stack:
+                cur, deps = stack[-1]
+                for dep in deps:
+                    if dep not in depth and self._edges.get(dep):
+                        depth[dep] = None
+                        stack.append((dep, iter(self._edges[dep])))
+                        break
+                else:
+                    stack.pop()
+                    depth[cur] = max([1 + (depth.get(dep) or 0) for dep in self._edges[cur]] or [0])
+        return max([d for d in depth.values() if d is not None] or [0])
+
+    def start(self):
+        return timeit.default_timer(), _cpu_time()
+
+    def stop(self, phase, start):
+        self.wall[phase] += timeit.default_timer() - start[0]
+        self.cpu[phase] += _cpu_time() - start[1]
+
+    def add_option(self, validator_name, key, dependency_keys):
+        self.options[validator_name] = self.options.get(validator_name, 0) + 1
+        if dependency_keys:
+            self._edges[key] = tuple(dependency_keys)
+
+    def add_validator(self, reused=False, cacheable=False):
+        # validators are also created in the threads of a parse
+        with self._lock:
+            if reused:
+                self.validators_reused += 1
+            else:
+                self.validators_created += 1
+                if cacheable:
+                    self.cache_misses += 1
+
+    def add_sub_ini(self, stats, size):
+        """add the stats of a sub_ini file, whose times are already part of this parse"""
+        with self._lock:
+            for name, count in stats.options.items():
+                self.options[name] = self.options.get(name, 0) + count
+            self.deferred += stats.deferred
+            self.validators_created += stats.validators_created
+            self.validators_reused += stats.validators_reused
+            self.cache_misses += stats.cache_misses
+            self.sub_ini_files += 1 + stats.sub_ini_files
+            self.sub_ini_bytes_read += (size if stats.bytes_read is None else stats.bytes_read) + stats.sub_ini_bytes_read
+
+    def as_dict(self):
+        """the statistics as dict with json compatible values"""
+        return {
+            "options": dict(self.options),
+            "deferred": self.deferred,
+            "max_depth": self.max_depth,
+            "validators_created": self.validators_created,
+            "validators_reused": self.validators_reused,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "bytes_read": self.bytes_read,
+            "sub_ini_files": self.sub_ini_files,
+            "sub_ini_bytes_read": self.sub_ini_bytes_read,
+            "wall": dict(self.wall),
+            "cpu": dict(self.cpu),
+        }
+
+    def __repr__(self):
+        return "ParseStats({data!r})".format(data=self.as_dict())
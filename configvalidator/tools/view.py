@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+
+class DictView(Mapping):
+
+    """read only view of a dict
+
+    The view doesn't copy the dict. Keys from *exclude* are hidden, so that
+    e.g. the feature entry of a config dict can be removed without changing
+    the original dict.
+
+    remark: only the first level is read only. Values like lists or dicts
+    are the original objects and must not be changed.
+    """
+
+    __slots__ = ("_data", "_exclude")
+
+    def __init__(self, data, exclude=()):
+        if isinstance(data, DictView):
+            exclude = tuple(exclude) + data._exclude
+            data = data._data
+        self._data = data
+        self._exclude = tuple(x for x in exclude if x in data)
+
+    def __getitem__(self, key):
+        if self._exclude and key in self._exclude:
+            raise KeyError(key)
+        return self._data[key]
+
+    def __contains__(self, key):
+        if self._exclude and key in self._exclude:
+            return False
+        return key in self._data
+
+    def __iter__(self):
+        if not self._exclude:
+            return iter(self._data)
+        return (key for key in self._data if key not in self._exclude)
+
+    def __len__(self):
+        return len(self._data) - len(self._exclude)
+
+    def __reduce__(self):
+        return DictView, (self._data, self._exclude)
+
+    def __repr__(self):
+        return "{name}({data})".format(name=self.__class__.__name__, data=dict(self))
+
+    def keys(self):
+        if not self._exclude:
+            return self._data.keys()
+        return list(self)
+
+    def items(self):
+        if not self._exclude:
+            return self._data.items()
+        return [(key, self._data[key]) for key in self]
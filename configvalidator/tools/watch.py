@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import time
+import logging
+import threading
+from six import string_types
+from six.moves import configparser
+from configvalidator.tools.exceptions import ParserException, ConfigParserException
+from configvalidator.tools.parser import IniKey
+from configvalidator.tools.plan import SchemaPlan
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher(object):
+
+    """parses ini files again if they (or included sub_ini files) change
+
+    The current result is replaced by a new object, so readers can use
+    *result* without a lock. If the new files are not valid, the last valid
+    result is kept and the error is stored in *error*.
+
+    Attributes:
+        result: the last valid result
+        error: the exception of the last parse or None. A ParserException, or the
+               configparser.Error / ConfigParserException if the files can't be read.
+        paths: the watched ini files (without sub_ini files)
+    """
+
+    def __init__(self, cv, paths, config_dict, on_change=None, on_error=None, interval=1.0, debounce=0.5, feature_key="__feature__"):
+        """
+        :param cv: the ConfigValidator, which is used for parsing
+        :param paths: ini file or list of ini files
+        :param config_dict: the config dict or a plan from *compile*
+        :param on_change: function(result, changed_keys) called after a new result was set.
+                          changed_keys is None for the first result.
+        :param on_error: function(exception) called if the changed files are not valid or can't be read
+        :param interval: seconds between two checks
+        :param debounce: seconds the files must be unchanged before they are parsed
+        :param feature_key: the dict key for section features (ignored for a compiled plan)
+        """
+        self.cv = cv
+        self.paths = [paths] if isinstance(paths, string_types) else list(paths)
+        if isinstance(config_dict, SchemaPlan):
+            self.plan = config_dict
+        else:
+            self.plan = cv.compile(config_dict, feature_key=feature_key)
+        self.on_change = on_change
+        self.on_error = on_error
+        self.interval = interval
+        self.debounce = debounce
+        self.result = None
+        self.error = None
+        self._signature = None
+        self._pending = None
+        self._pending_since = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._inotify = None
+        self._watched_dirs = set()
+
+    def load(self):
+        """parse the files and set the result
+
+        :return: True if the result was replaced
+        """
+        # taken before reading, so that changes during the parse are not lost.
+        # It is stored after the files are handled, new sub_ini files of the
+        # result are added after the parse.
+        signature = self._get_signature()
+        try:
+            cp = self.cv.cp.__class__(**(self.cv.cp_init_args or {}))
+            cp.read(self.paths)
+            cv = self.cv.__class__(cp, cp_init_args=self.cv.cp_init_args, validator_cache=self.cv.validator_cache)
+            for key, value in self.cv.data.items():
+                cv.add_data(key, value)
+            if self.result is None:
+                res = cv.parse(self.plan, keep_state=True)
+                changed = None
+            else:
+                res, changed = cv.revalidate(self.result, cp)
+        except (ParserException, ConfigParserException, configparser.Error) as e:
+            # e.g. a duplicate option or a missing section header in an edited file
+            logger.debug(e)
+            self._signature = signature
+            self.error = e
+            if self.on_error is not None:
+                self.on_error(e)
+            return False
+        # atomic swap, the old result is not changed
+        self.result = res
+        self.error = None
+        self._signature = self._get_signature(known=signature)
+        if self.on_change is not None:
+            self.on_change(res, changed)
+        return True
+
+    def check(self):
+        """check the files once and parse them if they changed
+
+        :return: True if the result was replaced
+        """
+        signature = self._get_signature()
+        if signature == self._signature:
+            self._pending = None
+            return False
+        now = time.time()
+        if signature != self._pending:
+            # wait until the files are no longer changed
+            self._pending = signature
+            self._pending_since = now
+            if self.debounce > 0:
+                return False
+        if now - self._pending_since < self.debounce:
+            return False
+        self._pending = None
+        return self.load()
+
+    def start(self):
+        """check the files in a background thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ConfigWatcher")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watched_dirs = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def watched_files(self):
+        """the ini files and all sub_ini files of the current result"""
+        res = list(self.paths)
+        if self.result is not None:
+            for path in sub_ini_paths(self.result):
+                if path not in res:
+                    res.append(path)
+        return res
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wait()
+            if self._stop.is_set():
+                break
+            try:
+                self.check()
+            except Exception as e:
+                logger.exception(e)
+
+    def _wait(self):
+        if inotify_simple is None:
+            self._stop.wait(self.interval)
+            return
+        # inotify wakes up early, the mtimes are checked anyway
+        if self._inotify is None:
+            self._inotify = inotify_simple.INotify()
+        flags = inotify_simple.flags
+        for directory in set(os.path.dirname(os.path.abspath(path)) for path in self.watched_files()):
+            if directory not in self._watched_dirs and os.path.isdir(directory):
+                self._inotify.add_watch(directory, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MODIFY)
+                self._watched_dirs.add(directory)
+        self._inotify.read(timeout=int(self.interval * 1000))
+
+    def _get_signature(self, known=None):
+        # known: entries of an older signature, which are kept for these paths
+        known = dict((entry[0], entry) for entry in known or ())
+        res = []
+        for path in self.watched_files():
+            if path in known:
+                res.append(known[path])
+                continue
+            try:
+                stat = os.stat(path)
+                res.append((path, stat.st_mtime, stat.st_size))
+            except OSError:
+                res.append((path, None, None))
+        return tuple(res)
+
+
+def sub_ini_paths(result):
+    """the paths of all sub_ini files of a parse result (recursive)"""
+    from configvalidator.features.options import SubIniStep
+    state = getattr(result, "__dict__", {}).get("_parse_state")
+    if state is None:
+        return []
+    res = []
+    for section_step in state.plan.sections:
+        for step in getattr(section_step, "options", ()):
+            if not isinstance(step, SubIniStep):
+                continue
+            key = IniKey(section=section_step.section, option=step.option)
+            if key in state.raw_values:
+                res.append(state.raw_values[key])
+                res.extend(sub_ini_paths(state.value(key)))
+    return res
@@ -15,7 +15,9 @@ import logging
 from configvalidator.tools.exceptions import ParserException, ValidatorException, ConfigValidatorException, InitException
 from configvalidator.tools.basics import Validator, load_validator_form_dict
 from configvalidator.tools.timezone import TZ
-from six import string_types
+from configvalidator.tools.networks import network_index
+from configvalidator.tools.parser import _now_ns
+from six import string_types, integer_types
 from six.moves.urllib.parse import urlparse
 import socket
 
@@ -38,6 +40,7 @@ This validator represents the identity. The validation result is always true.
 
     """
     name = "default"
+    cacheable = True
 
     def validate(self, value):
         """determine if one input satisfies this validator.
@@ -52,6 +55,9 @@ This validator represents the identity. The validation result is always true.
         """
         return value
 
+    def try_validate(self, value):
+        return True, value
+
 
 class ErrorValidator(Validator):
 
@@ -60,12 +66,13 @@ class ErrorValidator(Validator):
     this validator always fails
     """
     name = "error"
+    cacheable = True
 
     def __init__(self, error_msg):
         self.error_msg = error_msg
 
-    def validate(self, value):
-        raise ValidatorException(self.error_msg)
+    def try_validate(self, value):
+        return False, ValidatorException(self.error_msg)
 
 
 class StringValidator(Validator):
@@ -78,6 +85,7 @@ This validator checks, if the input is an string.
     * max_length: the maximum string length (int)
     """
     name = "str"
+    cacheable = True
 
     def __init__(self, min_length=None, max_length=None, characters=None, first=None):
         self.min = min_length
@@ -95,10 +103,10 @@ This validator checks, if the input is an string.
             raise InitException("max_length must be a number")
         self.allowed_characters = characters
         self.first_characters = first
-        assert isinstance(self.allowed_characters, list) or self.allowed_characters is None
-        assert isinstance(self.first_characters, list) or self.first_characters is None
+        assert isinstance(self.allowed_characters, (list, tuple)) or self.allowed_characters is None
+        assert isinstance(self.first_characters, (list, tuple)) or self.first_characters is None
 
-    def validate(self, value):
+    def try_validate(self, value):
         errors = []
         try:
             self._validate_length(len(value))
@@ -113,8 +121,8 @@ This validator checks, if the input is an string.
                     errors.append("allowed characters: {items}".format(items=self.allowed_characters))
                     break
         if len(errors) > 0:
-            raise ValidatorException.from_list(errors)
-        return value
+            return False, ValidatorException.from_list(errors)
+        return True, value
 
     def _validate_length(self, value, error_msg=" string length"):
         errors = []
@@ -137,15 +145,17 @@ This validator checks, if the input is an string.
 
 class EmptyValidator(Validator):
     name = "empty"
+    cacheable = True
 
-    def validate(self, value):
+    def try_validate(self, value):
         if value != "":
-            raise ValidatorException("The input is not Empty.")
-        return ""
+            return False, ValidatorException("The input is not Empty.")
+        return True, ""
 
 
 class NotEmptyValidator(StringValidator):
     name = "not-empty"
+    cacheable = True
 
     def __init__(self):
         super(NotEmptyValidator, self).__init__(min_length=1)
@@ -164,6 +174,7 @@ This validator checks, if the input is an int.
     * max: the maximum input int (int)
     """
     name = "int"
+    cacheable = True
 
     def __init__(self, min=None, max=None):
         self.min = None
@@ -179,15 +190,17 @@ This validator checks, if the input is an int.
             except Exception:
                 raise InitException("max must be a number")
 
-    def validate(self, value):
+    def try_validate(self, value):
         try:
-            return self._validate_length(self.transform(value), error_msg="")
-        except ConfigValidatorException:
-            raise
+            value = self.transform(value)
         except Exception as e:
-            raise ValidatorException(
-                "Input is no {name}".format(name=self.name),
-                e)
+            return False, ValidatorException("Input is no {name}".format(name=self.name), e)
+        try:
+            return True, self._validate_length(value, error_msg="")
+        except ConfigValidatorException as e:
+            return False, e
+        except Exception as e:
+            return False, ValidatorException("Input is no {name}".format(name=self.name), e)
 
     def transform(self, value):
         return int(value)
@@ -227,16 +240,17 @@ t    | f
 1    | 0
     """
     name = "bool"
+    cacheable = True
     values_true = ["yes", "y", "true", "t", "1"]
     values_false = ["no", "n", "false", "f", "0"]
 
-    def validate(self, value):
+    def try_validate(self, value):
         allowed_values = list(
             itertools.chain(*zip(self.values_true, self.values_false)))
         if value.lower() not in allowed_values:
-            raise ValidatorException(
+            return False, ValidatorException(
                 "allowed values: {allowed_values}".format(allowed_values=", ".join(allowed_values)))
-        return value.lower() in self.values_true
+        return True, value.lower() in self.values_true
 
 
 class JsonValidator(DefaultValidator):
@@ -247,12 +261,13 @@ This validator checks, if the input is an json Serialized string.
  * This validator has no optional parameter.
     """
     name = "json"
+    cacheable = True
 
-    def validate(self, value):
+    def try_validate(self, value):
         try:
-            return json.loads(value)
+            return True, json.loads(value)
         except Exception as e:
-            raise ValidatorException("Invalid json input", e)
+            return False, ValidatorException("Invalid json input", e)
 
 
 class PathValidator(DefaultValidator):
@@ -267,6 +282,8 @@ This validator checks, if the input is an existing path (file or directory).
 
     """
     name = "path"
+    cacheable = True
+    blocking = True
 
     def __init__(
             self,
@@ -282,11 +299,11 @@ This validator checks, if the input is an existing path (file or directory).
         if isinstance(self._disallowed_prefix, string_types):
             self._disallowed_prefix = [self._disallowed_prefix]
         try:
-            assert isinstance(self._allowed_prefix, list) or self._allowed_prefix is None
+            assert isinstance(self._allowed_prefix, (list, tuple)) or self._allowed_prefix is None
         except AssertionError:
             raise InitException("invalid allowed_prefix input")
         try:
-            assert isinstance(self._disallowed_prefix, list)
+            assert isinstance(self._disallowed_prefix, (list, tuple))
         except AssertionError:
             raise InitException("invalid disallowed_prefix input")
 
@@ -329,6 +346,7 @@ Extending the *path* validator.
 
     """
     name = "file"
+    cacheable = True
 
     def __init__(
             self,
@@ -363,6 +381,7 @@ Extending the *path* validator.
 
     """
     name = "dir"
+    cacheable = True
 
     def __init__(
         self,
@@ -373,15 +392,15 @@ Extending the *path* validator.
             **kwargs):
         super(DirValidator, self).__init__(**kwargs)
         self._include_dirs = include_dirs if include_dirs is not None else []
-        assert isinstance(self._include_dirs, list)
+        assert isinstance(self._include_dirs, (list, tuple))
         self._include_files = include_files if include_files is not None else [
         ]
-        assert isinstance(self._include_files, list)
+        assert isinstance(self._include_files, (list, tuple))
         self._exclude_dirs = exclude_dirs if exclude_dirs is not None else []
-        assert isinstance(self._exclude_dirs, list)
+        assert isinstance(self._exclude_dirs, (list, tuple))
         self._exclude_files = exclude_files if exclude_files is not None else [
         ]
-        assert isinstance(self._exclude_files, list)
+        assert isinstance(self._exclude_files, (list, tuple))
 
     def validate(self, value):
         errors = []
@@ -412,6 +431,7 @@ This validator checks, if the input is a vailed port.
 
     """
     name = "port"
+    cacheable = True
 
     def __init__(self, allow_null=True):
         self.allow_null = allow_null
@@ -422,14 +442,14 @@ This validator checks, if the input is a vailed port.
         max = 65535
         super(PortValidator, self).__init__(min=min, max=max)
 
-    def validate(self, value):
-        try:
-            return super(PortValidator, self).validate(value)
-        except:
-            if self.allow_null is True:
-                raise ValidatorException("port range [0-65535]")
-            else:
-                raise ValidatorException("port range [1-65535]")
+    def try_validate(self, value):
+        ok, res = super(PortValidator, self).try_validate(value)
+        if ok:
+            return True, res
+        if self.allow_null is True:
+            return False, ValidatorException("port range [0-65535]")
+        else:
+            return False, ValidatorException("port range [1-65535]")
 
 
 class RegexValidator(Validator):
@@ -443,6 +463,7 @@ This validator checks, if the input matches a given regular expression.
 
     """
     name = "regex"
+    cacheable = True
 
     def __init__(self, pattern, flags=0):
         super(RegexValidator, self).__init__()
@@ -451,15 +472,13 @@ This validator checks, if the input matches a given regular expression.
         except Exception as e:
             raise InitException("error init regex: {msg}".format(msg=e))
 
-    def validate(self, value):
+    def try_validate(self, value):
         try:
             if self._pattern.match(value) is None:
-                raise ValidatorException("No Matching")
-        except ConfigValidatorException:
-            raise
+                return False, ValidatorException("No Matching")
         except Exception as e:
-            raise ValidatorException("Unknown Error", e)
-        return value
+            return False, ValidatorException("Unknown Error", e)
+        return True, value
 
 
 class EmailValidator(RegexValidator):
@@ -472,25 +491,25 @@ This validator checks, if the input is a vailed Email.
 
     """
     name = "email"
+    cacheable = True
 
     def __init__(self, hostname=None):
         self._hostname = hostname
-        assert isinstance(self._hostname, list) or self._hostname is None
+        assert isinstance(self._hostname, (list, tuple)) or self._hostname is None
         if self._hostname is not None:
             self._hostname = [x.lower() for x in self._hostname]
         super(EmailValidator, self).__init__(pattern=r"[^@]+@[^@]+\.[^@]+",
                                              flags=re.IGNORECASE)
 
-    def validate(self, value):
-        try:
-            super(EmailValidator, self).validate(value)
-        except ValidatorException:
-            raise ValidatorException("invalid email format")
+    def try_validate(self, value):
+        ok, _ = super(EmailValidator, self).try_validate(value)
+        if not ok:
+            return False, ValidatorException("invalid email format")
         if self._hostname is not None:
             _, host = value.split("@")
             if host.lower() not in self._hostname:
-                raise ValidatorException("invalid host")
-        return value
+                return False, ValidatorException("invalid host")
+        return True, value
 
 
 class OrValidator(Validator):
@@ -504,14 +523,17 @@ This validator checks, multiple validators. This validator is true if one of the
     * validators: this is a list of validator configurations. The validator configuration is either a dict or a string. (list)
  * This validator has the following optional parameter.
     * kwargs: this is a dict of global kwargs, that will be passed to all the validators in the *validators* list. (dict)
+    * short_circuit: stop at the first valid validator. The validators are tried in an adaptive order: the ones
+      which are cheap and often valid first. The result is the same, an invalid input is checked by all validators. Default False (bool)
 
 
     Attributes:
         validators (List): List of validators to check
     """
     name = "or"
+    cacheable = True
 
-    def __init__(self, validators, kwargs=None, **dependencies):
+    def __init__(self, validators, kwargs=None, short_circuit=False, **dependencies):
         """Inits OrValidator
 
         evalutest the entry "validator_OR" from the ini_validator dict.
@@ -523,10 +545,9 @@ This validator checks, multiple validators. This validator is true if one of the
                                       can't bee instanced
         """
         super(OrValidator, self).__init__()
-        assert isinstance(validators, list)
-        if kwargs is None:
-            kwargs = {}
-        assert isinstance(kwargs, dict)
+        assert isinstance(validators, (list, tuple))
+        # copy the kwargs, so that the input is not changed
+        kwargs = {} if kwargs is None else dict(kwargs)
         # transform validators to dict config
         validators_transformed = []
         for val in validators:
@@ -536,7 +557,8 @@ This validator checks, multiple validators. This validator is true if one of the
                 })
             else:
                 assert isinstance(val, dict)
-                validators_transformed.append(val)
+                # copy the config, so that the input is not changed
+                validators_transformed.append(dict(val))
         # assign dependencies
         for k, v in dependencies.items():
             fond = False
@@ -556,46 +578,95 @@ This validator checks, multiple validators. This validator is true if one of the
             validators_transformed = new_validators_transformed
         # get validators
         self._validators = []
-        self._used_validator = []
         for item in validators_transformed:
             val_class, kwarg_dict = load_validator_form_dict({"validator": item})
             val_inst = val_class(**kwarg_dict)
             # set data for this validator
             val_inst.data = self.data
             self._validators.append(val_inst)
-
-    def validate(self, value):
+        # the instance can only be shared, if all sub validators can be shared
+        self.cacheable = all(getattr(val, "cacheable", False) is True for val in self._validators)
+        # the result depends on the environment, if one sub validator does
+        self.blocking = any(getattr(val, "blocking", False) is True for val in self._validators)
+        self._short_circuit = short_circuit is True
+        # statistics per validator for the adaptive order (see _try_adaptive). The instance can be
+        # shared by threads, lost updates only change the order, not the result
+        self._order = list(range(len(self._validators)))
+        self._runs = 0
+        self._tries = [0] * len(self._validators)
+        self._hits = [0] * len(self._validators)
+        self._cost_ns = [0] * len(self._validators)
+        self._samples = [0] * len(self._validators)
+
+    def try_validate(self, value):
         """validate function form OrValidator
 
         Returns:
             True if at least one of the validators
             validate function return True
         """
+        if self._short_circuit:
+            return self._try_adaptive(value)
         errors = []
-        self._used_validator = []
+        used_validator = []
         for val in self._validators:
-            try:
-                val.validate(value)
-                self._used_validator.append(val)
-            except ValidatorException as e:
-                errors.append(e)
-            except Exception as e:
-                errors.append(ValidatorException("Unknown Error", e))
-        if len(self._used_validator) == 0:
-            raise ValidatorException.from_list(errors)
-        return value
+            ok, res = val.try_validate(value)
+            if ok:
+                used_validator.append(val)
+            else:
+                errors.append(_sub_error(res))
+        if len(used_validator) == 0:
+            return False, ValidatorException.from_list(errors)
+        return True, value
+
+    # the time of every SAMPLE_RATE run is measured, the order is computed every REORDER_RATE runs
+    SAMPLE_RATE = 16
+    REORDER_RATE = 256
+
+    def _try_adaptive(self, value):
+        self._runs += 1
+        sample = self._runs % OrValidator.SAMPLE_RATE == 0
+        errors = {}
+        for idx in self._order:
+            if sample:
+                start = _now_ns()
+            ok, res = self._validators[idx].try_validate(value)
+            if sample:
+                self._cost_ns[idx] += _now_ns() - start
+                self._samples[idx] += 1
+            self._tries[idx] += 1
+            if ok:
+                self._hits[idx] += 1
+                if self._runs % OrValidator.REORDER_RATE == 0:
+                    self._reorder()
+                return True, value
+            errors[idx] = res
+        # all validators are invalid, the errors are in the order of the validators
+        return False, ValidatorException.from_list([_sub_error(errors[idx]) for idx in range(len(self._validators))])
+
+    def _reorder(self):
+        """sort the validators by the expected cost of a valid result: mean cost / probability of a valid result"""
+        samples = [idx for idx in range(len(self._validators)) if self._samples[idx] > 0]
+        default_cost = sum(self._cost_ns[idx] / float(self._samples[idx]) for idx in samples) / len(samples) if samples else 1.0
+
+        def score(idx):
+            cost = self._cost_ns[idx] / float(self._samples[idx]) if self._samples[idx] > 0 else default_cost
+            return cost * (self._tries[idx] + 2) / (self._hits[idx] + 1.0)
+        self._order = sorted(range(len(self._validators)), key=score)
 
 
 class AndValidator(OrValidator):
     """
 This validator checks, multiple validators. This validator is true if all of the validatos are true. 
 
-The parameters are the same as the *or* validator. 
+The parameters are the same as the *or* validator. short_circuit has no effect,
+the error contains the messages of all invalid validators.
 
     """
     name = "and"
+    cacheable = True
 
-    def validate(self, value):
+    def try_validate(self, value):
         """validate function form OrValidator
 
         Returns:
@@ -603,36 +674,40 @@ The parameters are the same as the *or* validator.
             validate function return True
         """
         errors = []
-        self._used_validator = []
         for val in self._validators:
-            try:
-                val.validate(value)
-                self._used_validator.append(val)
-            except ValidatorException as e:
-                errors.append(e)
-            except Exception as e:
-                errors.append(ValidatorException("Unknown Error", e))
+            ok, res = val.try_validate(value)
+            if not ok:
+                errors.append(_sub_error(res))
         if len(errors) > 0:
-            raise ValidatorException.from_list(errors)
-        return value
+            return False, ValidatorException.from_list(errors)
+        return True, value
 
 
 class OneOffValidator(OrValidator):
     """The Validator has the exact same interface as the or Validator
     but it will return the result from the first validator that validates the input.
+
+    The validators are always tried in the given order (short_circuit has no effect),
+    because the result of the first valid validator is returned.
     """
     name = "one-off"
+    cacheable = True
 
-    def validate(self, value):
+    def try_validate(self, value):
         errors = []
         for val in self._validators:
-            try:
-                return val.validate(value)
-            except ValidatorException as e:
-                errors.append(e)
-            except Exception as e:
-                errors.append(ValidatorException("Unknown Error", e))
-        raise ValidatorException.from_list(errors)
+            ok, res = val.try_validate(value)
+            if ok:
+                return True, res
+            errors.append(_sub_error(res))
+        return False, ValidatorException.from_list(errors)
+
+
+def _sub_error(error):
+    """the error of a sub validator for ValidatorException.from_list"""
+    if isinstance(error, ValidatorException):
+        return error
+    return "Unknown Error", error
 
 
 class UrlValidator(Validator):
@@ -652,6 +727,7 @@ If scheme is only one item it will be passed to urlparse as scheme argument.
 
     """
     name = "url"
+    cacheable = True
 
     SCHEME_PORT_MAPPING = {
         "file": None,
@@ -685,18 +761,18 @@ If scheme is only one item it will be passed to urlparse as scheme argument.
         if scheme is None:
             self._url_scheme = None
         else:
-            assert isinstance(scheme, list)
+            assert isinstance(scheme, (list, tuple))
             self._url_scheme = [x.lower() for x in scheme]
         if hostname is not None:
-            assert isinstance(hostname, list)
+            assert isinstance(hostname, (list, tuple))
             self._hostname = [x.lower() for x in hostname]
         else:
             self._hostname = None
         self._port = port
-        assert isinstance(port, list) or self._port is None
+        assert isinstance(port, (list, tuple)) or self._port is None
         self.add_default_port = add_default_port is True
 
-    def validate(self, value):
+    def try_validate(self, value):
         errors = []
         try:
             o = urlparse(value)
@@ -732,10 +808,10 @@ If scheme is only one item it will be passed to urlparse as scheme argument.
                 if check_port not in check_ports:
                     errors.append("port not allowed")
         except Exception as e:
-            errors.append(ValidatorException("Unknown Error", e))
+            errors.append(("Unknown Error", e))
         if len(errors) > 0:
-            raise ValidatorException.from_list(errors)
-        return value
+            return False, ValidatorException.from_list(errors)
+        return True, value
 
 
 class IPv4Validator(Validator):
@@ -746,12 +822,16 @@ This validator checks, if the input is a vailed IPv4 adress.
  * This validator has the following optional parameter.
     * private: only private network ip addresses are valid inputs. Default ist False. (bool)
     * cidr: checks if the ip belongs to this network. Default is "0.0.0.0/0"
+    * allowed_networks: list of networks (IP/CIDR or IP) or the path of a file with one network per line ("#" starts a comment).
+      The ip must belong to one of them. Networks of the other ip version are ignored. Default None
+    * denied_networks: like allowed_networks, the ip must not belong to one of them. Default None
 
 
     """
     name = "ipv4"
+    cacheable = True
 
-    def __init__(self, private=False, cidr="0.0.0.0/0"):
+    def __init__(self, private=False, cidr="0.0.0.0/0", allowed_networks=None, denied_networks=None):
         try:
             self._private = private is True
             try:
@@ -760,55 +840,66 @@ This validator checks, if the input is a vailed IPv4 adress.
                     ip = "0.0.0.0"
             except:
                 raise InitException("cidr format error | IP/CIDR or /CIDR")
-            self._network = IPv4Validator.ip_to_bit_str(ip)
-            self._subnet_mask = IPv4Validator.subnet_mask_int_to_bit(
-                int(subnet_mask))
-            self._private_network_list = []
-            self._private_network_list.append((
-                IPv4Validator.ip_to_bit_str("10.0.0.0"),
-                IPv4Validator.subnet_mask_int_to_bit(8)
-            ))
-            self._private_network_list.append((
-                IPv4Validator.ip_to_bit_str("172.16.0.0"),
-                IPv4Validator.subnet_mask_int_to_bit(12)
-            ))
-            self._private_network_list.append((
-                IPv4Validator.ip_to_bit_str("192.168.0.0"),
-                IPv4Validator.subnet_mask_int_to_bit(16)
-            ))
+            # the addresses are 32 bit integers, a network is stored as (network & mask, mask)
+            self._subnet_mask = IPv4Validator.subnet_mask_int(int(subnet_mask))
+            self._network = IPv4Validator.ip_to_int(ip) & self._subnet_mask
+            self._private_network_list = IPv4Validator.PRIVATE_NETWORKS
+            self._allowed_networks = None if allowed_networks is None else network_index("ipv4", allowed_networks, IPv4Validator.network_range)
+            self._denied_networks = None if denied_networks is None else network_index("ipv4", denied_networks, IPv4Validator.network_range)
+            if isinstance(allowed_networks, string_types) or isinstance(denied_networks, string_types):
+                # the file can change, the index is shared by the file content (see network_index)
+                self.cacheable = False
         except InitException:
             raise
         except Exception as e:
             raise InitException(str(e))
 
+    @staticmethod
+    def _parse(ipv4_str):
+        """the address as int and None or None and the error message"""
+        items = ipv4_str.split(".")
+        if len(items) != 4:
+            return None, "IP format: [0-255].[0-255].[0-255].[0-255]"
+        res = 0
+        for item in items:
+            # only the canonical decimal form is valid (no leading zeros, signs or spaces)
+            byte = _IPV4_BYTES.get(item)
+            if byte is None:
+                return None, "invalid ipv4 format: [0-255] | no leading zeros"
+            res = res << 8 | byte
+        return res, None
+
+    @staticmethod
+    def ip_to_int(ipv4_str):
+        res, error_msg = IPv4Validator._parse(ipv4_str)
+        if res is None:
+            raise ValidatorException(error_msg)
+        return res
+
     @staticmethod
     def _split_ip_adress(ipv4_str):
-        res = ipv4_str.split(".")
-        if len(res) == 4:
-            for item in res:
-                status = True
-                try:
-                    status = not 0 <= int(item) < 256 or str(int(item)) != item
-                finally:
-                    if status is True:
-                        raise ValidatorException("invalid ipv4 format: [0-255] | no leading zeros")
-        else:
-            raise ValidatorException(
-                "IP format: [0-255].[0-255].[0-255].[0-255]")
-        return int(res[0]), int(res[1]), int(res[2]), int(res[3])
+        res = IPv4Validator.ip_to_int(ipv4_str)
+        return res >> 24, res >> 16 & 0xff, res >> 8 & 0xff, res & 0xff
 
     @staticmethod
     def ip_to_bit_str(ipv4_str):
-        def _gen_prefix(v):
-            return "".join(["0" for _ in range(8 - len("{b:b}".format(b=v)))])
+        bits = "{0:032b}".format(IPv4Validator.ip_to_int(ipv4_str))
+        return ".".join([bits[0:8], bits[8:16], bits[16:24], bits[24:32]])
 
-        b1, b2, b3, b4 = IPv4Validator._split_ip_adress(ipv4_str)
-        return "{p_b1}{b1}.{p_b2}{b2}.{p_b3}{b3}.{p_b4}{b4}".format(
-            p_b1=_gen_prefix(b1), b1="{b:b}".format(b=b1),
-            p_b2=_gen_prefix(b2), b2="{b:b}".format(b=b2),
-            p_b3=_gen_prefix(b3), b3="{b:b}".format(b=b3),
-            p_b4=_gen_prefix(b4), b4="{b:b}".format(b=b4),
-        )
+    @staticmethod
+    def subnet_mask_int(subnet_mask):
+        assert 0 <= subnet_mask <= 32
+        return 0xffffffff ^ (0xffffffff >> subnet_mask)
+
+    @staticmethod
+    def network_range(network):
+        """first and last address (int) of a network: IP/CIDR or IP"""
+        subnet_mask = 0xffffffff
+        if "/" in network:
+            network, bits = network.split("/")
+            subnet_mask = IPv4Validator.subnet_mask_int(int(bits))
+        first = IPv4Validator.ip_to_int(network) & subnet_mask
+        return first, first | (0xffffffff ^ subnet_mask)
 
     @staticmethod
     def subnet_mask_int_to_bit(subnet_mask):
@@ -820,18 +911,26 @@ This validator checks, if the input is a vailed IPv4 adress.
                 res += "."
         return res
 
-    def validate(self, value):
+    def try_validate(self, value):
+        ip, error_msg = IPv4Validator._parse(value)
+        if ip is None:
+            return False, ValidatorException(error_msg)
         try:
-            value_bit_str = IPv4Validator.ip_to_bit_str(value)
-            IpValidator.validate_bits(ip_bit_str=value_bit_str,
-                                      network=self._network,
-                                      subnet_mask_bit_str=self._subnet_mask,
-                                      private_network_list=None if self._private is False else self._private_network_list)
-        except ValidatorException:
-            raise
+            IpValidator.validate_bits(ip, self._network, self._subnet_mask, None if self._private is False else self._private_network_list)
+            error_msg = IpValidator.check_networks(ip, self._allowed_networks, self._denied_networks)
+            if error_msg is not None:
+                return False, ValidatorException(error_msg)
+        except ValidatorException as e:
+            return False, e
         except Exception as e:
-            raise ValidatorException("Unknown Error", e)
-        return value
+            return False, ValidatorException("Unknown Error", e)
+        return True, value
+
+
+_IPV4_BYTES = dict((str(byte), byte) for byte in range(256))
+IPv4Validator.PRIVATE_NETWORKS = tuple(
+    (IPv4Validator.ip_to_int(ip) & IPv4Validator.subnet_mask_int(bits), IPv4Validator.subnet_mask_int(bits))
+    for ip, bits in [("10.0.0.0", 8), ("172.16.0.0", 12), ("192.168.0.0", 16)])
 
 
 class Ipv6Validator(Validator):
@@ -842,12 +941,16 @@ This validator checks, if the input is a vailed IPv6 adress.
  * This validator has the following optional parameter.
     * private: only private network ip addresses are valid inputs. Default ist False. (bool)
     * cidr: checks if the ip belongs to this network. Default is "::/0"
+    * allowed_networks: list of networks (IP/CIDR or IP) or the path of a file with one network per line ("#" starts a comment).
+      The ip must belong to one of them. Networks of the other ip version are ignored. Default None
+    * denied_networks: like allowed_networks, the ip must not belong to one of them. Default None
     * host_subnet_mask: allowed /128 at the end of an valid ipv6 address. Default False (bool)
 
     """
     name = "ipv6"
+    cacheable = True
 
-    def __init__(self, private=False, cidr="::/0", host_subnet_mask=False):
+    def __init__(self, private=False, cidr="::/0", host_subnet_mask=False, allowed_networks=None, denied_networks=None):
         try:
             self._private = private is True
             self._host_subnet_mask = host_subnet_mask is True
@@ -857,106 +960,109 @@ This validator checks, if the input is a vailed IPv6 adress.
                     ip = "::"
             except:
                 raise InitException("cidr format error | IP/CIDR or /CIDR")
-            self._network = Ipv6Validator.ip_to_bit_str(ip)
-            self._subnet_mask = Ipv6Validator.subnet_mask_int_to_bit(
-                int(subnet_mask))
-            self._private_network_list = []
-            self._private_network_list.append((
-                Ipv6Validator.ip_to_bit_str("fc00::"),
-                Ipv6Validator.subnet_mask_int_to_bit(7)
-            ))
-            self._private_network_list.append((
-                Ipv6Validator.ip_to_bit_str("::1"),
-                Ipv6Validator.subnet_mask_int_to_bit(128)
-            ))
-            self._private_network_list.append((
-                Ipv6Validator.ip_to_bit_str("fe80::"),
-                Ipv6Validator.subnet_mask_int_to_bit(10)
-            ))
+            # the addresses are 128 bit integers, a network is stored as (network & mask, mask)
+            self._subnet_mask = Ipv6Validator.subnet_mask_int(int(subnet_mask))
+            self._network = Ipv6Validator.ip_to_int(ip) & self._subnet_mask
+            self._private_network_list = Ipv6Validator.PRIVATE_NETWORKS
+            self._allowed_networks = None if allowed_networks is None else network_index("ipv6", allowed_networks, Ipv6Validator.network_range)
+            self._denied_networks = None if denied_networks is None else network_index("ipv6", denied_networks, Ipv6Validator.network_range)
+            if isinstance(allowed_networks, string_types) or isinstance(denied_networks, string_types):
+                # the file can change, the index is shared by the file content (see network_index)
+                self.cacheable = False
         except InitException:
             raise
         except Exception as e:
             raise InitException(str(e))
 
     @staticmethod
-    def _split_ip_adress(ipv6_str, host_subnet_mask=False):
+    def _parse(ipv6_str, host_subnet_mask=False):
+        """the address as int and None or None and the error message"""
         assert isinstance(ipv6_str, string_types)
-        if host_subnet_mask is True:
-            if "/" in ipv6_str:
-                ipv6_str, subnet_mask = ipv6_str.split("/")
-                if subnet_mask != "128":
-                    raise ValidatorException("if subnet mask is given it must be 128!")
-        elif "/" in ipv6_str:
-            raise ValidatorException("error: host subnet mask not allowed")
+        if "/" in ipv6_str:
+            if host_subnet_mask is not True:
+                return None, "error: host subnet mask not allowed"
+            ipv6_str, subnet_mask = ipv6_str.split("/")
+            if subnet_mask != "128":
+                return None, "if subnet mask is given it must be 128!"
         if "#" in ipv6_str or ":" not in ipv6_str:
-            raise ValidatorException("invalid ipv6 format")
-        if "::" in ipv6_str:
-            ipv6_str = ipv6_str.replace("::", "#")
-            reduction = True
-        else:
-            reduction = False
-        data = [x for x in ipv6_str.split(":")]
+            return None, "invalid ipv6 format"
+        # "#" marks the reduction
+        data = ipv6_str.replace("::", "#").split(":")
+        ipv4 = None
         if "." in data[-1]:
-            # handle input -> ::x.x.x.x
-            if data[-1].startswith("#"):
-                ipv4 = data[-1][1:]
-                start_with = "#"
-            else:
-                ipv4 = data[-1]
-                start_with = ""
-            IPv4Validator().validate(ipv4)
-            # transform ipv4 suffix to hex format
-            ipv4_bit_string_suffix = IPv4Validator.ip_to_bit_str(ipv4)
-            b1, b2, b3, b4 = ipv4_bit_string_suffix.split(".")
-            data[-1] = "{start_with}{ip_item:x}".format(start_with=start_with, ip_item=int("{b1}{b2}".format(b1=b1, b2=b2), 2))
-            data.append("{0:x}".format(int("{b3}{b4}".format(b3=b3, b4=b4), 2)))
-        if reduction is True:
-            new = []
-            resolved = False
-            for item in data:
-                if "#" in item:
-                    if resolved is True or item.count("#") > 1:
-                        raise ValidatorException("invalid ipv6 syntax: only one reduction via ::")
-                    resolved = True
-                    count = len(data)
-                    prefix, suffix = item.split("#")
-                    if prefix != "":
-                        new.append(prefix)
-                        count += 1
-                    if suffix != "":
-                        count += 1
-                    for _ in range(9 - count):
-                        new.append("0")
-                    if suffix != "":
-                        new.append(suffix)
-                else:
-                    new.append(item)
-            data = new
-        assert "#" not in "".join(data)
-        if len(data) != 8:
-            raise ValidatorException("invalid IPv6 address - just 8 blocks")
-        res = []
-        for item in data:
+            # handle input -> ::x.x.x.x, the ipv4 address are the last two blocks
+            item = data.pop()
+            if item.startswith("#"):
+                data.append("#")
+                item = item[1:]
+            ipv4, error_msg = IPv4Validator._parse(item)
+            if ipv4 is None:
+                return None, error_msg
+        reduction = None
+        for idx, item in enumerate(data):
+            if "#" in item:
+                if reduction is not None or item.count("#") > 1:
+                    return None, "invalid ipv6 syntax: only one reduction via ::"
+                reduction = idx
+        zeros = 0
+        if reduction is not None:
+            # the reduction is replaced by zero blocks, a prefix and a suffix are blocks
+            prefix, suffix = data[reduction].split("#")
+            data[reduction:reduction + 1] = [item for item in (prefix, suffix) if item != ""]
+            if prefix != "":
+                reduction += 1
+        blocks = len(data) if ipv4 is None else len(data) + 2
+        if reduction is not None:
+            zeros = max(0, 8 - blocks)
+        if blocks + zeros != 8:
+            return None, "invalid IPv6 address - just 8 blocks"
+        res = 0
+        for idx, item in enumerate(data):
+            if idx == reduction:
+                res <<= 16 * zeros
             try:
-                bit_str = bin(int(item, 16))[2:]
-                if len(bit_str) > 16:
-                    raise ValidatorException("each ipv6 block has maximum 16 bits")
-                bit_str = bit_str.zfill(16)
-                res.append(bit_str)
+                block = int(item, 16)
             except Exception as e:
-                raise ValidatorException("invalid ipv6 syntax: {msg}".format(msg=e))
-        return tuple(res)
+                return None, "invalid ipv6 syntax: {msg}".format(msg=e)
+            if not 0 <= block <= 0xffff:
+                return None, "invalid ipv6 syntax: each ipv6 block has maximum 16 bits"
+            res = res << 16 | block
+        if reduction == len(data):
+            res <<= 16 * zeros
+        if ipv4 is not None:
+            res = res << 32 | ipv4
+        return res, None
+
+    @staticmethod
+    def ip_to_int(ipv6_str, host_subnet_mask=False):
+        res, error_msg = Ipv6Validator._parse(ipv6_str, host_subnet_mask)
+        if res is None:
+            raise ValidatorException(error_msg)
+        return res
+
+    @staticmethod
+    def _split_ip_adress(ipv6_str, host_subnet_mask=False):
+        bits = "{0:0128b}".format(Ipv6Validator.ip_to_int(ipv6_str, host_subnet_mask))
+        return tuple(bits[idx:idx + 16] for idx in range(0, 128, 16))
 
     @staticmethod
     def ip_to_bit_str(ipv6_str, host_subnet_mask=False):
-        res = ""
-        for item in Ipv6Validator._split_ip_adress(ipv6_str, host_subnet_mask):
-            b = "{0:b}".format(int("{b}".format(b=item), 2))
-            res += "{p_b}{b}.".format(
-                p_b="".join(["0" for _ in range(16 - len("{b}".format(b=b)))]),
-                b=b,
-            )
-        return res[:-1]
+        return ".".join(Ipv6Validator._split_ip_adress(ipv6_str, host_subnet_mask))
+
+    @staticmethod
+    def subnet_mask_int(subnet_mask):
+        assert 0 <= subnet_mask <= 128
+        return _IPV6_ALL ^ (_IPV6_ALL >> subnet_mask)
+
+    @staticmethod
+    def network_range(network):
+        """first and last address (int) of a network: IP/CIDR or IP"""
+        subnet_mask = _IPV6_ALL
+        if "/" in network:
+            network, bits = network.split("/")
+            subnet_mask = Ipv6Validator.subnet_mask_int(int(bits))
+        first = Ipv6Validator.ip_to_int(network) & subnet_mask
+        return first, first | (_IPV6_ALL ^ subnet_mask)
 
     @staticmethod
     def subnet_mask_int_to_bit(subnet_mask):
@@ -968,18 +1074,26 @@ This validator checks, if the input is a vailed IPv6 adress.
                 res += "."
         return res
 
-    def validate(self, value):
+    def try_validate(self, value):
         try:
-            value_bit_str = Ipv6Validator.ip_to_bit_str(value, self._host_subnet_mask)
-            IpValidator.validate_bits(ip_bit_str=value_bit_str,
-                                      network=self._network,
-                                      subnet_mask_bit_str=self._subnet_mask,
-                                      private_network_list=None if self._private is False else self._private_network_list)
-        except ValidatorException:
-            raise
+            ip, error_msg = Ipv6Validator._parse(value, self._host_subnet_mask)
+            if ip is None:
+                return False, ValidatorException(error_msg)
+            IpValidator.validate_bits(ip, self._network, self._subnet_mask, None if self._private is False else self._private_network_list)
+            error_msg = IpValidator.check_networks(ip, self._allowed_networks, self._denied_networks)
+            if error_msg is not None:
+                return False, ValidatorException(error_msg)
+        except ValidatorException as e:
+            return False, e
         except Exception as e:
-            raise ValidatorException("Unknown Error", e)
-        return value
+            return False, ValidatorException("Unknown Error", e)
+        return True, value
+
+
+_IPV6_ALL = (1 << 128) - 1
+Ipv6Validator.PRIVATE_NETWORKS = tuple(
+    (Ipv6Validator.ip_to_int(ip) & Ipv6Validator.subnet_mask_int(bits), Ipv6Validator.subnet_mask_int(bits))
+    for ip, bits in [("fc00::", 7), ("::1", 128), ("fe80::", 10)])
 
 
 class IpValidator(OrValidator):
@@ -992,33 +1106,69 @@ Checks if the input is either *ipv4* or *ipv6*.
     * private: only private network ip addresses are valid inputs. Default ist False. (bool)
     * ipv4_cidr: checks if the ip (if ipv4) belongs to this network. Default is "0.0.0.0/0"
     * ipv6_cidr: checks if the ip (if ipv6) belongs to this network. Default is "::/0"
+    * allowed_networks: list of networks (IP/CIDR or IP) or the path of a file with one network per line ("#" starts a comment).
+      The ip must belong to one of them. One list can contain ipv4 and ipv6 networks. Default None
+    * denied_networks: like allowed_networks, the ip must not belong to one of them. Default None
     * host_subnet_mask: allowed /128 at the end of an valid ipv6 address. Default False (bool)
 
 
     """
     name = "ip"
+    cacheable = True
 
     def __init__(
         self,
         private=False,
         ipv4_cidr="0.0.0.0/0",
         ipv6_cidr="::/0",
-            host_subnet_mask=False):
+            host_subnet_mask=False,
+            allowed_networks=None,
+            denied_networks=None):
         super(IpValidator, self).__init__(validators=[
             {
                 "type": "ipv4",
                 "private": private,
                 "cidr": ipv4_cidr,
+                "allowed_networks": allowed_networks,
+                "denied_networks": denied_networks,
             },
             {
                 "type": "ipv6",
                 "private": private,
                 "cidr": ipv6_cidr,
                 "host_subnet_mask": host_subnet_mask,
+                "allowed_networks": allowed_networks,
+                "denied_networks": denied_networks,
             }])
 
+    def try_validate(self, value):
+        """validate function form IpValidator
+
+        a ipv6 address contains a ":", a ipv4 address never does. So only one of the
+        validators is used for a valid input, the other one only for the error message.
+        """
+        ipv4, ipv6 = self._validators
+        if ":" in value:
+            family, other = ipv6, ipv4
+        else:
+            family, other = ipv4, ipv6
+        ok, res = family.try_validate(value)
+        if ok:
+            return True, value
+        ok, other_res = other.try_validate(value)
+        if ok:
+            return True, value
+        errors = [res, other_res] if family is ipv4 else [other_res, res]
+        return False, ValidatorException.from_list([_sub_error(error) for error in errors])
+
     @staticmethod
     def check_ip_in_network(network, subnet_mask, ip):
+        """True if the ip is in the network
+
+        the arguments are integers (the mask with the network bits set) or bit strings (see ip_to_bit_str)
+        """
+        if isinstance(ip, integer_types):
+            return ip & subnet_mask == network & subnet_mask
         return network[0:len(subnet_mask)] == ip[0:len(subnet_mask)]
 
     @staticmethod
@@ -1037,13 +1187,23 @@ Checks if the input is either *ipv4* or *ipv6*.
                     return
             raise ValidatorException("IP is not en private Network")
 
+    @staticmethod
+    def check_networks(ip, allowed_networks, denied_networks):
+        """None or the error message, if the ip (int) is not in the allowed networks or in the denied networks (NetworkIndex)"""
+        if allowed_networks is not None and ip not in allowed_networks:
+            return "IP is not in an allowed network"
+        if denied_networks is not None and ip in denied_networks:
+            return "IP is in a denied network"
+        return None
+
 
 class GeneralizedTimeValidator(Validator):
     """
     """
     name = "generalizedTime"
+    cacheable = True
 
-    def validate(self, value):
+    def try_validate(self, value):
         format_str = "input: YYYYMMDDHH[MM[SS[.fff]]] | YYYYMMDDHH[MM[SS[.fff]]]Z | YYYYMMDDHH[MM[SS[.fff]]]+-HHMM"
         try:
             year = int(value[0:4])
@@ -1077,7 +1237,7 @@ class GeneralizedTimeValidator(Validator):
                     elif value[start] == "-":
                         diff = -1
                     else:
-                        raise ValidatorException(format_str)
+                        return False, ValidatorException(format_str)
                     diff_hour = int(value[start + 1:start + 3])
                     diff_minute = int(value[start + 3:start + 5])
                     tzinfo = TZ(
@@ -1086,47 +1246,48 @@ class GeneralizedTimeValidator(Validator):
                         minutes=diff *
                         diff_minute)
             try:
-                return datetime.datetime(year=year,
-                                         month=month,
-                                         day=day,
-                                         hour=hour,
-                                         minute=minute,
-                                         second=second,
-                                         microsecond=microsecond,
-                                         tzinfo=tzinfo)
+                return True, datetime.datetime(year=year,
+                                               month=month,
+                                               day=day,
+                                               hour=hour,
+                                               minute=minute,
+                                               second=second,
+                                               microsecond=microsecond,
+                                               tzinfo=tzinfo)
             except ValueError as e:
-                raise ValidatorException(e.args[0], e)
-        except ValidatorException:
-            raise
+                return False, ValidatorException(e.args[0], e)
         except Exception as e:
-            raise ValidatorException(format_str, exception=e)
+            return False, ValidatorException(format_str, exception=e)
 
 class Base64Validator(DefaultValidator):
     """
     """
     name = "base64"
+    cacheable = True
 
     def __init__(self, encoding="utf-8"):
         self.encoding = encoding
     
-    def validate(self, value):
+    def try_validate(self, value):
         import base64
         try:
             res = base64.b64decode(value)
         except Exception as e:
-            raise ValidatorException(error_msg="invalid base64 string", exception=e)
+            return False, ValidatorException(error_msg="invalid base64 string", exception=e)
         try:
             if isinstance(res, bytes) and self.encoding is not None:
-                return res.decode(self.encoding)
+                return True, res.decode(self.encoding)
             else:
-                return res
+                return True, res
         except Exception as e:
-            raise ValidatorException(error_msg="Encoding error", exception=e)
+            return False, ValidatorException(error_msg="Encoding error", exception=e)
 
 class CertValidator(DefaultValidator):
     """
     """
     name = "cert"
+    cacheable = False
+    blocking = True
 
     def __init__(self, privateKey=None, pw=None, valid=True, allowed_X509Name=None, disallowed_X509Name=None):
         from OpenSSL import crypto
@@ -1301,10 +1462,11 @@ class ItemsValidator(DefaultValidator):
     """
     """
     name = "items"
+    cacheable = True
 
     def __init__(self, values=None, split_char=",", strip=True, min=None, max=None, skip_empty=False):
         self._values = values
-        assert isinstance(self._values, list) or self._values is None
+        assert isinstance(self._values, (list, tuple)) or self._values is None
         self._split_char = split_char
         self._strip = strip
         self._min = min
@@ -1315,7 +1477,7 @@ class ItemsValidator(DefaultValidator):
             self._max = IntValidator().transform(max)
         self.skip_empty = skip_empty is True
 
-    def validate(self, value):
+    def try_validate(self, value):
         items = []
         for item in [value] if self._split_char is None else value.split(self._split_char):
             if self._strip:
@@ -1324,24 +1486,25 @@ class ItemsValidator(DefaultValidator):
                 elm = item
             if self._values is not None:
                 if elm not in self._values:
-                    raise ValidatorException("Element '{elm}' ist not allowed: {allowed}".format(elm=elm, allowed=self._values))
+                    return False, ValidatorException("Element '{elm}' ist not allowed: {allowed}".format(elm=elm, allowed=self._values))
             if elm not in items:
                 if elm == "" and self.skip_empty is True:
                     continue
                 items.append(elm)
         if self._min is not None:
             if len(items) < self._min:
-                raise ValidatorException("the allowed number ({allowed}) was not reached ({entries}).".format(allowed=self._min, entries=len(items)))
+                return False, ValidatorException("the allowed number ({allowed}) was not reached ({entries}).".format(allowed=self._min, entries=len(items)))
         if self._max is not None:
             if len(items) > self._max:
-                raise ValidatorException("the allowed number ({allowed}) has been exceeded ({entries}).".format(allowed=self._max, entries=len(items)))
-        return items
+                return False, ValidatorException("the allowed number ({allowed}) has been exceeded ({entries}).".format(allowed=self._max, entries=len(items)))
+        return True, items
 
 
 class ItemValidator(ItemsValidator):
     """
     """
     name = "item"
+    cacheable = True
 
     def __init__(self, values=None, strip=True):
         super(
@@ -1353,26 +1516,29 @@ class ItemValidator(ItemsValidator):
             min=1,
             max=1)
 
-    def validate(self, value):
-        items = super(ItemValidator, self).validate(value)
-        return items[0]
+    def try_validate(self, value):
+        ok, res = super(ItemValidator, self).try_validate(value)
+        if ok:
+            return True, res[0]
+        return False, res
 
 
 class ListValidator(Validator):
     """
     """
     name = "list"
+    cacheable = True
 
     def __init__(self, strict=False):
         self.strict = strict is True
 
-    def validate(self, value):
+    def try_validate(self, value):
         value = value.strip()
         if value.startswith("[") and value.endswith("]"):
             value = value[1:-1]
         else:
             if self.strict:
-                raise ValidatorException("input list elements with [...]")
+                return False, ValidatorException("input list elements with [...]")
         res = []
         for item_org in value.split(","):
             item = item_org.strip()
@@ -1380,19 +1546,20 @@ class ListValidator(Validator):
                 res.append(item[1:-1])
             else:
                 if self.strict:
-                    raise ValidatorException("items must be surrounded by \" or '")
+                    return False, ValidatorException("items must be surrounded by \" or '")
                 else:
                     if value.count(",") == 0 and item == "":
                         # listen der form []; [   ], ... (ohne inhalt) nicht in [""] umwandeln sondern in []
                         continue
                     res.append(item_org)
-        return res
+        return True, res
 
 
 class DictValidator(Validator):
     """
     """
     name = "dict"
+    cacheable = True
 
     def __init__(self, strict=False, duplicate_keys=False):
         self.strict = strict is True
@@ -1404,12 +1571,19 @@ class DictValidator(Validator):
         self.__val2 = re.compile(r"\s*(?P<type>({|\[))\s*(?P<rest>.*)")
         self.__val3 = re.compile(r"(?P<value>[^,]*)(?P<rest>.*)")
 
-    def validate(self, value):
+    def try_validate(self, value):
+        try:
+            return self._try_parse(value)
+        except ValidatorException as e:
+            # duplicate keys and errors of nested dicts and lists
+            return False, e
+
+    def _try_parse(self, value):
         if value.startswith("{") and value.endswith("}"):
             value = value[1:-1]
         else:
             if self.strict:
-                raise ValidatorException("input dict elements with {...}")
+                return False, ValidatorException("input dict elements with {...}")
         res = {}
         item = value
         strict_error_msg = "items must be surrounded by \" or '"
@@ -1424,13 +1598,13 @@ class DictValidator(Validator):
                 item = key1.group("rest")
             elif key2 is not None:
                 if self.strict:
-                    raise ValidatorException(strict_error_msg)
+                    return False, ValidatorException(strict_error_msg)
                 key = key2.group("key")
                 item = key2.group("rest")
             else:
-                raise ValidatorException("can not identify any dict key")
+                return False, ValidatorException("can not identify any dict key")
             if len(item) == 0 or item[0] != ":":
-                raise ValidatorException(error_msq_split)
+                return False, ValidatorException(error_msq_split)
             item = item[1:]
             value1 = self.__val1.match(item)
             value2 = self.__val2.match(item)
@@ -1442,17 +1616,17 @@ class DictValidator(Validator):
                 item, val = self._add_sub_item(value2.group("type"), value2.group("rest"))
             elif value3 is not None:
                 if self.strict:
-                    raise ValidatorException(strict_error_msg)
+                    return False, ValidatorException(strict_error_msg)
                 val = value3.group("value")
                 item = value3.group("rest")
             else:
-                raise ValidatorException("can not identify any dict value")
+                return False, ValidatorException("can not identify any dict value")
             DictValidator.add_item(res, key, val, self.duplicate_keys)
             if len(item) > 0:
                 if item[0] != ",":
-                    raise ValidatorException("Key-value pairs must be split by comma.")
+                    return False, ValidatorException("Key-value pairs must be split by comma.")
                 item = item[1:]
-        return res
+        return True, res
 
     @staticmethod
     def add_item(d, key, value, duplicate_keys):
@@ -1499,6 +1673,7 @@ class NetBIOSValidator(StringValidator):
     """
     """
     name = "netbios"
+    cacheable = True
 
     def __init__(self):
         allowed_characters = list(string.ascii_uppercase + string.digits + string.ascii_lowercase)
@@ -1527,7 +1702,8 @@ class NetBIOSValidator(StringValidator):
     
 
 class StripQuotationMark(DefaultValidator):
-    
+    cacheable = True
+
     def __init__(self, validator_name, allowed_quotation_mark_map=None, validator_parameter_dict=None, force_strip=False, output_quotation_mark=False):
         from configvalidator import load_validator
         validator_class = load_validator(validator_name)
@@ -1535,6 +1711,7 @@ class StripQuotationMark(DefaultValidator):
             validator_parameter_dict = {}
         assert isinstance(validator_parameter_dict, dict)
         self._validator = validator_class(**validator_parameter_dict)
+        self.cacheable = getattr(self._validator, "cacheable", False) is True
         if allowed_quotation_mark_map is None:
             allowed_quotation_mark_map = [
                 ("\"", "\""),
@@ -1544,44 +1721,51 @@ class StripQuotationMark(DefaultValidator):
                 (u"»", u"«"),
                 (u"›", u"‹")
             ]
-        assert isinstance(allowed_quotation_mark_map, list)
+        assert isinstance(allowed_quotation_mark_map, (list, tuple))
         self._allowed_quotation_mark_map = allowed_quotation_mark_map
         self._force_strip = force_strip is True
         self._output_quotation_mark = output_quotation_mark is True
         
-    def validate(self, value):
-        res = self.strip_quotation_mark(value)
-        if self._output_quotation_mark is True and res != value:
-            return value
+    def try_validate(self, value):
+        ok, res = self.try_strip_quotation_mark(value)
+        if ok and self._output_quotation_mark is True and res != value:
+            return True, value
         else:
-            return res
-    
+            return ok, res
+
     def strip_quotation_mark(self, value):
+        ok, res = self.try_strip_quotation_mark(value)
+        if ok:
+            return res
+        raise res
+
+    def try_strip_quotation_mark(self, value):
         errors = []
         val_exc = False
         if not self._force_strip:
-            try:
-                return self._validator.validate(value)
-            except ValidatorException as e:
+            ok, res = self._validator.try_validate(value)
+            if ok:
+                return True, res
+            if isinstance(res, ValidatorException):
                 val_exc = True
-                errors.append(e)
-            except Exception as e:
-                errors.append(ValidatorException("Unknown Error", e))
+                errors.append(res)
+            else:
+                errors.append(("Unknown Error", res))
         if len(value) < 2:
             errors.append(ValidatorException("can not strip quotation mark - input len must be at least 2!"))
         else:
-            try:
-                q_m_input = (value[0], value[-1])
-                res = self._validator.validate(value[1:-1])
+            q_m_input = (value[0], value[-1])
+            ok, res = self._validator.try_validate(value[1:-1])
+            if ok:
                 if q_m_input not in self._allowed_quotation_mark_map:
                     errors.append(ValidatorException("The characters {input} are not in the list of allowed quotation mark.".format(input=q_m_input)))
-                return res
-            except ValidatorException as e:
+                return True, res
+            if isinstance(res, ValidatorException):
                 if not val_exc:
-                    errors.append(e)
-            except Exception as e:
-                errors.append(ValidatorException("Unknown Error", e))
-        raise ValidatorException.from_list(errors)
+                    errors.append(res)
+            else:
+                errors.append(("Unknown Error", res))
+        return False, ValidatorException.from_list(errors)
 
 """
 generate classes that allowed Quotation Marks around inputs
@@ -1599,13 +1783,15 @@ def generate_init_mepthod(elm):
 for class_name, elm in [("StripQuotationMarkPathValidator", PathValidator),
                         ("StripQuotationMarkFileValidator", FileValidator),
                         ("StripQuotationMarkDirValidator", DirValidator)]:
-    clazz = type(class_name, (StripQuotationMark,), {"__init__": generate_init_mepthod(elm), "name": "strip_" + elm.name})
+    clazz = type(class_name, (StripQuotationMark,), {"__init__": generate_init_mepthod(elm), "name": "strip_" + elm.name, "cacheable": True, "blocking": True})
     globals()[clazz.__name__] = clazz
     del clazz
 
 
 class PortInUseValidator(PortValidator):
     name = "freePort"
+    cacheable = True
+    blocking = True
 
     def __init__(self):
         super(PortInUseValidator, self).__init__(allow_null=False)
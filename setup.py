@@ -34,6 +34,12 @@ setup(
     license='Apache License 2.0',
     packages=find_packages(),
     install_requires=['six'],
+    extras_require={
+        # concurrent.futures for parse_many and parse(threads=N)
+        ':python_version < "3.2"': ['futures'],
+        # collections.OrderedDict for the caches and the dependency graph
+        ':python_version < "2.7"': ['ordereddict'],
+    },
     tests_require = test_requirements,
     classifiers=[
          'Development Status :: 4 - Beta',
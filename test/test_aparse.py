@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import sys
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator import ParserException
+from configvalidator.tools.basics import DATA_VALIDATOR
+
+if sys.version_info >= (3, 5):
+    from testutils.aio import create_validators, run
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "asyncio syntax requires Python 3.5")
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base = os.path.join(testutils.get_test_utils_base(), "data", "exist")
+        self.waiting, self.async_int = create_validators()
+
+    def tearDown(self):
+        del DATA_VALIDATOR["ASYNC_WAITING"]
+        del DATA_VALIDATOR["ASYNC_INT"]
+
+    def test_registration(self):
+        self.assertTrue(DATA_VALIDATOR["ASYNC_INT"] is self.async_int)
+        # the input check is also done for avalidate
+        with self.assertRaises(Exception) as e:
+            self.async_int().avalidate(1)
+        self.assertEqual("input must be a string.", str(e.exception))
+        self.assertEqual(None, DATA_VALIDATOR["int"].avalidate)
+
+    def test_same_result(self):
+        config_dict = testutils.get_dict()
+        config_dict["SectionA"] = testutils.get_dict()
+        config_dict["SectionA"]["a1"] = "file"
+        config_dict["SectionA"]["a2"] = "ASYNC_INT"
+        config_dict["SectionA"]["a3"] = {"validator": {"type": "int", "max": ("SectionA", "a2")}, "depends": ["max"]}
+        config_dict["SectionA"]["a4"] = "ASYNC_INT"
+        config_dict["SectionA"]["a5"] = {"feature": "sub_ini", "config": {"A": {"b": {}}}}
+        data = {"SectionA": {"a1": os.path.join(self.base, "default.ini"), "a2": "5", "a3": "4", "a4": "x", "a5": os.path.join(self.base, "default.ini")}}
+        cv = ConfigValidator(testutils.CPStub2(data))
+        with self.assertRaises(ParserException) as serial:
+            cv.parse(config_dict)
+        with self.assertRaises(ParserException) as asynchronous:
+            run(cv.aparse(config_dict))
+        self.assertEqual(str(serial.exception), str(asynchronous.exception))
+        data["SectionA"]["a4"] = "6"
+        res = run(cv.aparse(config_dict, concurrency=1))
+        self.assertEqual(cv.parse(config_dict), res)
+        self.assertEqual("Hallo Welt", res.SectionA.a5.A.b)
+
+    def test_invalid_concurrency(self):
+        cv = ConfigValidator(testutils.CPStub2({"SectionA": {"a1": "1"}}))
+        for concurrency in (0, -1):
+            with self.assertRaises(ParserException) as e:
+                cv.aparse({"SectionA": {"a1": "int"}}, concurrency=concurrency)
+            self.assertEqual("concurrency must be at least 1, not {0}".format(concurrency), str(e.exception))
+
+    def test_concurrent(self):
+        config_dict = {"SectionA": dict(("option_{idx}".format(idx=idx), "ASYNC_WAITING") for idx in range(3))}
+        data = {"SectionA": dict(("option_{idx}".format(idx=idx), str(idx)) for idx in range(3))}
+        cv = ConfigValidator(testutils.CPStub2(data))
+        res = run(cv.aparse(ConfigValidator.compile(config_dict)))
+        self.assertEqual({"option_0": "async 0", "option_1": "async 1", "option_2": "async 2"}, res.SectionA)
+        # with a lower limit the validations wait for each other
+        with self.assertRaises(ParserException):
+            self.waiting.count = 4
+            self.waiting.timeout = 0.2
+            self.waiting.started = []
+            self.waiting.event = None
+            config_dict["SectionA"]["option_3"] = "ASYNC_WAITING"
+            data["SectionA"]["option_3"] = "3"
+            run(cv.aparse(config_dict, concurrency=3))
+
+
+if __name__ == '__main__':
+    unittest.main()
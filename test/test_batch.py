@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+import os
+import pickle
+import shutil
+import tempfile
+from configvalidator import parse_many, ConfigValidator, AttributeDict, ParserException, ValidatorException
+from configvalidator.tools.batch import _pickleable_exception
+from configvalidator.tools.exceptions import ErrorRecord
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dict = {
+            "SectionA": {
+                "option_A1": {
+                    "validator": {"type": "int", "max": 100},
+                },
+                "option_A2": {
+                    "default": "x",
+                },
+            },
+        }
+        self.tmp_dir = tempfile.mkdtemp()
+        self.sources = []
+        for idx in range(10):
+            path = os.path.join(self.tmp_dir, "host_{idx}.ini".format(idx=idx))
+            with open(path, "w") as f:
+                f.write("[SectionA]\noption_A1 = {value}\n".format(value=idx * 20))
+            self.sources.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def check(self, results):
+        self.assertEqual(sorted(self.sources), sorted(results))
+        for idx, source in enumerate(self.sources):
+            if idx * 20 > 100:
+                self.assertTrue(isinstance(results[source], ParserException))
+                self.assertEqual("error validating [SectionA]option_A1: maximum: 100", str(results[source]))
+            else:
+                self.assertTrue(isinstance(results[source], AttributeDict))
+                self.assertEqual({"SectionA": {"option_A1": idx * 20, "option_A2": "x"}}, results[source])
+
+    def test_serial(self):
+        self.check(dict(parse_many(self.config_dict, self.sources, workers=1)))
+
+    def test_process_pool(self):
+        self.check(dict(parse_many(ConfigValidator.compile(self.config_dict), iter(self.sources), workers=2, chunksize=3)))
+
+    def test_process_pool_without_initializer(self):
+        # python < 3.7 and the futures backport have no initializer for the worker processes
+        from concurrent.futures import ProcessPoolExecutor
+
+        def executor(max_workers):
+            return ProcessPoolExecutor(max_workers=max_workers)
+        with mock.patch("concurrent.futures.ProcessPoolExecutor", executor):
+            self.check(dict(parse_many(self.config_dict, self.sources, workers=2, chunksize=3)))
+
+    def test_error_records(self):
+        for workers in (1, 2):
+            error = dict(parse_many(self.config_dict, self.sources, workers=workers, chunksize=3))[self.sources[-1]]
+            self.assertEqual(["error validating [SectionA]option_A1: maximum: 100"], error.info)
+            self.assertEqual(1, len(error.errors))
+            record = error.records[0]
+            self.assertTrue(isinstance(record, ErrorRecord))
+            self.assertEqual(("value", "SectionA", "option_A1"), (record.code, record.section, record.option))
+
+    def test_unpickleable_error(self):
+        # ValidatorException.from_list has no init parameters for pickle
+        error = ValidatorException.from_list(["a", "b"])
+        e = ParserException.from_errors([ErrorRecord("value", "SectionA", "option_A1", None, {"error": error}), "other error"])
+        res = pickle.loads(pickle.dumps(_pickleable_exception(e)))
+        self.assertEqual(str(e), str(res))
+        self.assertEqual(e.info, res.info)
+        self.assertEqual(("value", "SectionA", "option_A1", "a\nb"), (res.records[0].code, res.records[0].section, res.records[0].option, res.records[0].args["error"]))
+        # pickleable exceptions are kept
+        e = ParserException.from_errors([ErrorRecord("missing", "SectionA", "option_A1")])
+        self.assertTrue(_pickleable_exception(e) is e)
+
+    def test_missing_file(self):
+        res = dict(parse_many(self.config_dict, [os.path.join(self.tmp_dir, "NOT-EXISTING.ini")], workers=1))
+        self.assertEqual(
+            "No value for Section/Option: 'SectionA'/'option_A1'",
+            str(list(res.values())[0]))
+
+    def test_pickle_result(self):
+        res = AttributeDict({"SectionA": {"option_A1": 1}})
+        self.assertEqual(res, pickle.loads(pickle.dumps(res)))
+        self.assertEqual(1, pickle.loads(pickle.dumps(res)).SectionA.option_A1)
+
+
+if __name__ == '__main__':
+    unittest.main()
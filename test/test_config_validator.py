@@ -43,6 +43,7 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(isinstance(res, AttributeDict))
         self.assertEqual(1, len(res))
         self.assertTrue(isinstance(res.SectionB, AttributeDict))
+        self.assertTrue(res.SectionB is res.SectionB)
         self.assertEqual(1, len(res.SectionB))
         self.assertEqual("Hallo", res.SectionB.option_B2)
 
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import sys
+import testutils
+from configvalidator import ParserException
+from configvalidator.tools.graph import DependencyGraph
+
+
+def dep_option(option):
+    return dict(validator=dict(type="int", min=("SectionA", option)), depends=["min"])
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_graph(self):
+        graph = DependencyGraph()
+        graph.add("a", None, {"x": "b", "y": "c", "z": "b"})
+        graph.add("d", None, {"x": "b"})
+        self.assertEqual(2, graph.get("a").missing)
+        self.assertEqual(["d"], [item.key for item in graph.available("b")])
+        self.assertEqual([], graph.available("b"))
+        self.assertEqual(["a"], [item.key for item in graph.available("c")])
+        self.assertEqual(["a", "d"], list(graph))
+        graph.remove("a")
+        self.assertFalse("a" in graph)
+        self.assertEqual(1, len(graph))
+
+    def test_graph_cycles(self):
+        graph = DependencyGraph()
+        graph.add("a", None, {"x": "b"})
+        graph.add("b", None, {"x": "c"})
+        graph.add("c", None, {"x": "a"})
+        graph.add("d", None, {"x": "a"})
+        graph.add("e", None, {"x": "e"})
+        graph.add("f", None, {"x": "g"})
+        graph.add("g", None, {"x": "f", "y": "MISSING"})
+        self.assertEqual([["a", "b", "c"], ["e"], ["f", "g"]], graph.cycles())
+
+    def test_long_chain(self):
+        size = sys.getrecursionlimit() * 2
+        config_dict = testutils.get_dict()
+        config_dict["SectionA"] = testutils.get_dict()
+        for idx in range(size):
+            config_dict["SectionA"]["option_{idx}".format(idx=idx)] = dep_option("option_{idx}".format(idx=idx + 1))
+        config_dict["SectionA"]["option_{idx}".format(idx=size)] = "int"
+        cp = testutils.get_cp({"SectionA": dict(("option_{idx}".format(idx=idx), str(idx)) for idx in range(size + 1))})
+        with self.assertRaises(ParserException) as e:
+            cp.parse(config_dict)
+        # the last but one option is smaller than the last one, so the rest of the chain can't be resolved
+        error_msg, dep_msg = str(e.exception).split("\n")
+        self.assertEqual("error validating [SectionA]option_{idx}: minimum: {min}".format(idx=size - 1, min=size), error_msg)
+        self.assertEqual(size, len(dep_msg.split("|")))
+        cp = testutils.get_cp({"SectionA": dict(("option_{idx}".format(idx=idx), "7") for idx in range(size + 1))})
+        res = cp.parse(config_dict)
+        self.assertEqual(size + 1, len(res.SectionA))
+
+    def test_every_cycle_is_reported(self):
+        config_dict = testutils.get_dict()
+        config_dict["SectionA"] = testutils.get_dict()
+        config_dict["SectionA"]["option_A1"] = dep_option("option_A2")
+        config_dict["SectionA"]["option_A2"] = dep_option("option_A3")
+        config_dict["SectionA"]["option_A3"] = dep_option("option_A1")
+        config_dict["SectionA"]["option_A4"] = dep_option("option_A4")
+        config_dict["SectionA"]["option_A5"] = dep_option("option_A1")
+        cp = testutils.get_cp({"SectionA": dict(("option_A{idx}".format(idx=idx), "1") for idx in range(1, 6))})
+        with self.assertRaises(ParserException) as e:
+            cp.parse(config_dict)
+        self.assertEqual([
+            "error validating [SectionA]option_A3: circle reference with [SectionA]option_A1, [SectionA]option_A2",
+            "error validating [SectionA]option_A4: circle reference with [SectionA]option_A4",
+            "not all dependencies resolved: 'SectionA'/'option_A1'|'SectionA'/'option_A2'|'SectionA'/'option_A3'|'SectionA'/'option_A4'|'SectionA'/'option_A5'",
+        ], str(e.exception).split("\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
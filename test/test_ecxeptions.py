@@ -8,7 +8,9 @@ try:
     import unittest2 as unittest
 except ImportError:
     import unittest
-from configvalidator import ValidatorException
+import testutils
+from configvalidator import ValidatorException, ParserException, ConfigValidator
+from configvalidator.tools.exceptions import ErrorRecord
 
 
 class MyTestCase(unittest.TestCase):
@@ -26,6 +28,41 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(type(e2), ValidatorException)
         self.assertListEqual(e2.info, ["Hello", "demo"])
         self.assertListEqual(e2.errors, [("Hello", ex), ("demo", None)])
+        # nested
+        e3 = ValidatorException.from_list([e, ("x", ex)])
+        self.assertListEqual(e3.info, ["Hello", "world", "x"])
+        self.assertListEqual(e.info, ["Hello", "world"])
+
+    def test_error_record(self):
+        class Fail(object):
+            formatted = 0
+
+            def __str__(self):
+                Fail.formatted += 1
+                return "fail"
+        record = ErrorRecord("value", "SectionA", "a1", None, {"error": Fail()})
+        e = ParserException.from_errors([record, "other"])
+        self.assertEqual(0, Fail.formatted)
+        self.assertEqual([record, "other"], e.records)
+        self.assertEqual("error validating [SectionA]a1: fail\nother", str(e))
+        self.assertEqual(["error validating [SectionA]a1: fail", "other"], e.info)
+        self.assertEqual(record, "error validating [SectionA]a1: fail")
+        self.assertEqual(["x"], ParserException("x").records)
+
+    def test_parse_records(self):
+        cp = testutils.CPStub2({"SectionA": {"a1": "x"}, "SectionB": {"b1": "y"}})
+        config_dict = {
+            "SectionA": {"a1": "int", "a2": "int"},
+            "SectionB": {"__feature__": "raw_section_input", "validator": "int"},
+        }
+        with self.assertRaises(ParserException) as e:
+            ConfigValidator(cp=cp).parse(config_dict)
+        records = sorted(e.exception.records, key=lambda record: (record.section, record.option))
+        self.assertEqual(["value", "missing", "raw_value"], [record.code for record in records])
+        self.assertEqual(("SectionA", "a1", "int"), (records[0].section, records[0].option, records[0].validator.name))
+        self.assertEqual("error validating [SectionA]a1: Input is no int", str(records[0]))
+        self.assertEqual("No value for Section/Option: 'SectionA'/'a2'", str(records[1]))
+        self.assertEqual("error validating [SectionB]: b1 - Input is no int", str(records[2]))
 
 
 if __name__ == '__main__':
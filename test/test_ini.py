@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import io
+import os
+import shutil
+import tempfile
+from six.moves import configparser
+from configvalidator import ConfigValidator, ConfigParserException
+from configvalidator.tools.ini import IniReader, MmapIniReader
+
+
+INI = u"""# comment
+[DEFAULT]
+shared = from default
+
+[SectionA]
+Option_A1 = 10
+option_A2 : with colon
+option_A3 =
+option_A4 = first line
+    second line
+    # comment inside the value
+
+    third line
+
+; comment
+option_A5=no spaces
+option_A6 = value ; not a comment
+[SectionB]
+option_B1 = überall
+shared = overwritten
+"""
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "input.ini")
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(INI)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_same_as_raw_config_parser(self):
+        raw = configparser.RawConfigParser()
+        raw.read(self.path, encoding="utf-8")
+        reader = IniReader(encoding="utf-8")
+        self.assertEqual([self.path], reader.read([self.path, os.path.join(self.tmp_dir, "NOT-EXISTING.ini")]))
+        self.assertEqual(raw.sections(), reader.sections())
+        for section in raw.sections():
+            self.assertEqual(raw.options(section), reader.options(section))
+            for option in raw.options(section):
+                self.assertEqual(raw.get(section, option), reader.get(section, option))
+        self.assertEqual("first line\nsecond line\n\nthird line", reader.get("SectionA", "option_A4"))
+        self.assertTrue(reader.has_option("SectionA", "OPTION_A1"))
+        self.assertTrue(reader.has_option("SectionA", "shared"))
+        self.assertFalse(reader.has_option("SectionA", "option_B1"))
+        self.assertFalse(reader.has_option("SectionC", "shared"))
+        with self.assertRaises(configparser.NoSectionError):
+            reader.get("SectionC", "shared")
+        with self.assertRaises(configparser.NoOptionError):
+            reader.get("SectionA", "option_B1")
+
+    def test_line_numbers(self):
+        reader = IniReader(encoding="utf-8")
+        reader.read(self.path)
+        self.assertEqual(6, reader.lineno("SectionA", "option_A1"))
+        self.assertEqual(9, reader.lineno("SectionA", "option_A4"))
+        self.assertEqual(19, reader.lineno("SectionB", "option_B1"))
+        self.assertEqual(20, reader.lineno("SectionB", "shared"))
+        self.assertEqual(3, reader.lineno("SectionA", "shared"))
+        self.assertEqual(self.path, reader.source("SectionB", "shared"))
+
+    def test_read_string(self):
+        reader = IniReader()
+        reader.read_string(u"[A]\nb = 1\n")
+        reader.read_file(io.BytesIO(b"[A]\nc = 2\n"))
+        self.assertEqual(["b", "c"], reader.options("A"))
+        self.assertEqual("<???>", reader.source("A", "c"))
+
+    def test_errors(self):
+        for content, msg in [
+                (u"b = 1\n", "<string>, line 1: file contains no section headers: b'b = 1'"),
+                (u"[A]\nb\n", "<string>, line 2: parsing error: b'b'"),
+                (u"[A]\n[A]\n", "<string>, line 2: section 'A' already exists"),
+                (u"[A]\nb = 1\nB = 2\n", "<string>, line 3: option 'b' in section 'A' already exists")]:
+            with self.assertRaises(ConfigParserException) as e:
+                IniReader().read_string(content)
+            self.assertEqual(msg.replace("b'", "'") if str is bytes else msg, str(e.exception))
+        # not strict
+        reader = IniReader(strict=False)
+        reader.read_string(u"[A]\nb = 1\n[A]\nb = 2\n")
+        self.assertEqual("2", reader.get("A", "b"))
+
+    def test_config_validator(self):
+        reader = IniReader(encoding="utf-8")
+        reader.read(self.path)
+        res = ConfigValidator(reader).parse({
+            "SectionA": {"option_A1": "int", "option_A4": {}},
+            "SectionB": {"option_B1": {}, "shared": {}},
+        })
+        self.assertEqual(10, res.SectionA.option_A1)
+        self.assertEqual(u"überall", res.SectionB.option_B1)
+        self.assertEqual("overwritten", res.SectionB.shared)
+
+
+    def test_mmap_same_as_raw_config_parser(self):
+        raw = configparser.RawConfigParser()
+        raw.read(self.path, encoding="utf-8")
+        with MmapIniReader(encoding="utf-8") as reader:
+            self.assertEqual([self.path], reader.read(self.path))
+            self.assertEqual(raw.sections(), reader.sections())
+            for section in raw.sections():
+                self.assertEqual(raw.options(section), reader.options(section))
+                for option in raw.options(section):
+                    self.assertEqual(raw.get(section, option), reader.get(section, option))
+            self.assertEqual(19, reader.lineno("SectionB", "option_B1"))
+            self.assertEqual(20, reader.lineno("SectionB", "shared"))
+
+    def test_mmap_lazy(self):
+        with MmapIniReader(encoding="utf-8") as reader:
+            reader.read(self.path)
+            self.assertEqual(["SectionA", "SectionB"], sorted(reader._pending))
+            self.assertEqual("overwritten", reader.get("SectionB", "shared"))
+            # only the used section is indexed
+            self.assertEqual(["SectionA"], list(reader._pending))
+            self.assertEqual({}, reader._sections["SectionA"])
+            self.assertEqual("from default", reader.get("SectionA", "shared"))
+            self.assertEqual({}, reader._pending)
+
+    def test_mmap_errors(self):
+        path = os.path.join(self.tmp_dir, "errors.ini")
+        with open(path, "w") as f:
+            f.write("# comment\n[A]\nb\n[B]\nc = 1\n")
+        with MmapIniReader() as reader:
+            reader.read(path)
+            self.assertEqual("1", reader.get("B", "c"))
+            # the error is found, when the section is used
+            with self.assertRaises(ConfigParserException) as e:
+                reader.has_option("A", "b")
+            self.assertTrue(str(e.exception).startswith("{path}, line 3: parsing error:".format(path=path)))
+        with open(path, "w") as f:
+            f.write("[A]\nb = 1\n\n[A]\n")
+        with self.assertRaises(ConfigParserException) as e:
+            MmapIniReader().read(path)
+        self.assertEqual("{path}, line 4: section 'A' already exists".format(path=path), str(e.exception))
+        # empty file
+        with open(path, "w") as f:
+            f.write("")
+        self.assertEqual([path], MmapIniReader().read(path))
+
+    def test_mmap_indented_section(self):
+        path = os.path.join(self.tmp_dir, "indented.ini")
+        with open(path, "w") as f:
+            f.write("[A]\nb = 1\n  [C]\n")
+        raw = configparser.RawConfigParser()
+        raw.read(path)
+        with MmapIniReader() as reader:
+            reader.read(path)
+            self.assertEqual({}, reader._pending)
+            self.assertEqual(raw.get("A", "b"), reader.get("A", "b"))
+            self.assertEqual("1\n[C]", reader.get("A", "b"))
+
+
+if __name__ == '__main__':
+    unittest.main()
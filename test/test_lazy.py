@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator import ParserException
+from configvalidator.tools.basics import DATA_VALIDATOR
+from configvalidator.validators import DefaultValidator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.validated = []
+        validated = self.validated
+
+        def validate(inst, value):
+            validated.append(value)
+            return value
+        type("COUNTING", (DefaultValidator,), {"validate": validate})
+        self.config_dict = {
+            "SectionA": {
+                "a1": "COUNTING",
+                "a2": {"validator": {"type": "int", "max": 100}},
+                "a3": {"validator": {"type": "int", "max": ("SectionA", "a2")}, "depends": ["max"]},
+                "a4": {"validator": {"type": "int", "max": 5}},
+            },
+            "SectionB": {
+                "b1": "COUNTING",
+            },
+            "SectionC": {
+                "__feature__": "raw_section_input",
+                "validator": "int",
+            },
+        }
+        self.data = {
+            "SectionA": {"a1": "v1", "a2": "10", "a3": "7", "a4": "6"},
+            "SectionB": {"b1": "v2"},
+            "SectionC": {"c1": "1", "c2": "2"},
+        }
+
+    def tearDown(self):
+        del DATA_VALIDATOR["COUNTING"]
+
+    def parse(self, lazy=True):
+        return ConfigValidator(cp=testutils.CPStub2(self.data)).parse(self.config_dict, lazy=lazy)
+
+    def test_on_access(self):
+        res = self.parse()
+        self.assertEqual([], self.validated)
+        self.assertEqual(["SectionA", "SectionB", "SectionC"], sorted(res))
+        self.assertEqual("v2", res.SectionB.b1)
+        self.assertEqual("v2", res["SectionB"]["b1"])
+        self.assertEqual(["v2"], self.validated)
+        self.assertEqual("v1", res.get("SectionA", "a1"))
+        self.assertEqual(["v2", "v1"], self.validated)
+        self.assertEqual({"c1": 1, "c2": 2}, dict(res.SectionC))
+        self.assertTrue("c1" in res.SectionC)
+        self.assertFalse("c3" in res.SectionC)
+
+    def test_dependencies(self):
+        res = self.parse()
+        self.assertEqual(7, res.SectionA.a3)
+        self.assertEqual([], self.validated)
+        self.assertEqual(["SectionA"], list(res._parse_obj.parsed_values))
+        self.assertEqual(set(["a2", "a3"]), set(res._parse_obj.parsed_values["SectionA"]))
+        # invalid dependency
+        self.data["SectionA"]["a2"] = "200"
+        res = self.parse()
+        with self.assertRaises(ParserException) as e:
+            res.SectionA.a3
+        self.assertEqual(
+            "error validating [SectionA]a2: maximum: 100\n"
+            "not all dependencies resolved: 'SectionA'/'a3'", str(e.exception))
+        self.assertEqual("v1", res.SectionA.a1)
+
+    def test_circle(self):
+        self.config_dict["SectionA"]["a2"] = {"validator": {"type": "int", "max": ("SectionA", "a3")}, "depends": ["max"]}
+        res = self.parse()
+        with self.assertRaises(ParserException) as e:
+            res.SectionA.a3
+        self.assertEqual("not all dependencies resolved: 'SectionA'/'a3'", str(e.exception))
+
+    def test_errors(self):
+        res = self.parse()
+        for _ in range(2):
+            with self.assertRaises(ParserException) as e:
+                res.SectionA.a4
+            self.assertEqual("error validating [SectionA]a4: maximum: 5", str(e.exception))
+        with self.assertRaises(ParserException) as e:
+            dict(res.SectionA)
+        with self.assertRaises(KeyError):
+            res.SectionA.a5
+        with self.assertRaises(KeyError):
+            res.SectionD
+        with self.assertRaises(KeyError):
+            res.SectionC.c3
+
+    def test_validate_all(self):
+        res = self.parse()
+        self.assertEqual(10, res.SectionA.a2)
+        with self.assertRaises(ParserException) as lazy:
+            res.validate_all()
+        with self.assertRaises(ParserException) as eager:
+            self.parse(lazy=False)
+        self.assertEqual(str(eager.exception), str(lazy.exception))
+        # without errors
+        self.data["SectionA"]["a4"] = "5"
+        del self.validated[:]
+        res = self.parse()
+        self.assertEqual("v1", res.SectionA.a1)
+        full = res.validate_all()
+        # every option is validated once
+        self.assertEqual(["v1", "v2"], self.validated)
+        self.assertEqual(self.parse(lazy=False), full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from testutils import OrderedDict
+from configvalidator import ConfigValidator, ParserException
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dict = OrderedDict([
+            ("SectionA", OrderedDict([
+                ("a1", {"validator": {"type": "int", "min": ("SectionB", "b1")}, "depends": ["min"]}),
+                ("a2", "int"),
+                ("a3", "int"),
+            ])),
+            ("SectionB", OrderedDict([
+                ("b1", "int"),
+                ("b2", "int"),
+            ])),
+        ])
+        self.data = {
+            "SectionA": {"a1": "5", "a2": "x", "a3": "y"},
+            "SectionB": {"b1": "1", "b2": "z"},
+        }
+
+    def parse(self, **kwargs):
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        with self.assertRaises(ParserException) as e:
+            cv.parse(self.config_dict, **kwargs)
+        return e.exception
+
+    def test_all_errors(self):
+        e = self.parse()
+        self.assertEqual(3, len(e.info))
+        self.assertEqual("\n".join(e.info), str(e))
+        self.assertEqual(str(e), str(self.parse(max_errors=10)))
+
+    def test_fail_fast(self):
+        e = self.parse(max_errors=1)
+        self.assertEqual(["error validating [SectionA]a2: Input is no int"], e.info)
+        self.assertEqual(e.info[0], str(e))
+
+    def test_max_errors(self):
+        e = self.parse(max_errors=2)
+        self.assertEqual(2, len(e.info))
+        self.assertIn("[SectionA]a3", e.info[1])
+
+    def test_skip_dependencies(self):
+        # a1 waits for SectionB, which is not parsed anymore
+        self.data["SectionA"]["a3"] = "3"
+        e = self.parse(max_errors=1)
+        self.assertEqual(1, len(e.info))
+        self.assertNotIn("dependencies", str(e))
+
+    def test_threads(self):
+        self.config_dict["SectionB"]["b3"] = "path"
+        self.data["SectionB"]["b3"] = "/"
+        e = self.parse(max_errors=1, threads=2)
+        self.assertEqual(1, len(e.info))
+
+    def test_invalid_max_errors(self):
+        for max_errors in (0, -1):
+            e = self.parse(max_errors=max_errors)
+            self.assertEqual("max_errors must be at least 1 or None, not {0}".format(max_errors), str(e))
+
+    def test_valid(self):
+        self.data = {
+            "SectionA": {"a1": "5", "a2": "2", "a3": "3"},
+            "SectionB": {"b1": "1", "b2": "2"},
+        }
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        self.assertEqual(5, cv.parse(self.config_dict, max_errors=1).SectionA.a1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,90 @@ class MyTestCase(unittest.TestCase):
             load_option_feature("NOT-DEFINED")
         self.assertEqual(str(e.exception), "no option feature with the name NOT-DEFINED")
 
+    def test_try_validate(self):
+        from configvalidator.tools.basics import Validator, DATA_VALIDATOR
+        from configvalidator import ValidatorException
+
+        def try_validate(self, value):
+            if value == "x":
+                return False, ValidatorException("no x")
+            return True, value.upper()
+        type("TRY_ONLY", (Validator,), {"try_validate": try_validate})
+        type("VALIDATE_ONLY", (Validator,), {"validate": lambda s, x: int(x)})
+        try:
+            v = DATA_VALIDATOR["TRY_ONLY"]()
+            self.assertEqual("A", v.validate("a"))
+            self.assertEqual((True, "A"), v.try_validate("a"))
+            with self.assertRaises(ValidatorException) as e:
+                v.validate("x")
+            self.assertEqual("no x", str(e.exception))
+            ok, error = v.try_validate(1)
+            self.assertFalse(ok)
+            self.assertEqual("input must be a string.", str(error))
+            v = DATA_VALIDATOR["VALIDATE_ONLY"]()
+            self.assertEqual((True, 1), v.try_validate("1"))
+            ok, error = v.try_validate("a")
+            self.assertFalse(ok)
+            self.assertTrue(isinstance(error, ValueError))
+        finally:
+            del DATA_VALIDATOR["TRY_ONLY"]
+            del DATA_VALIDATOR["VALIDATE_ONLY"]
+
+    def test_try_validate_subclass(self):
+        # a subclass which overrides validate is used by the combined validators
+        from configvalidator.tools.basics import DATA_VALIDATOR
+        from configvalidator.validators import IntValidator
+
+        def validate(self, value):
+            return super(self.__class__, self).validate(value) * 2
+        type("DOUBLE", (IntValidator,), {"validate": validate})
+        try:
+            self.assertEqual(4, DATA_VALIDATOR["DOUBLE"]().validate("2"))
+            self.assertEqual((True, 4), DATA_VALIDATOR["DOUBLE"]().try_validate("2"))
+            self.assertEqual(4, DATA_VALIDATOR["one-off"](validators=["bool", "DOUBLE"]).validate("2"))
+        finally:
+            del DATA_VALIDATOR["DOUBLE"]
+
+    def test_builtin_try_validate(self):
+        from configvalidator.tools.basics import DATA_VALIDATOR
+        samples = [
+            ("int", {}, "1", "x"),
+            ("float", {}, "1.5", "x"),
+            ("bool", {}, "yes", "x"),
+            ("email", {}, "a@b.de", "x"),
+            ("regex", {"pattern": "a+"}, "aa", "b"),
+            ("ipv4", {}, "10.0.0.1", "x"),
+            ("ipv6", {}, "::1", "x"),
+            ("ip", {}, "::1", "x"),
+            ("empty", {}, "", "x"),
+            ("or", {"validators": ["int", "bool"]}, "1", "x"),
+            ("and", {"validators": ["int", "bool"]}, "1", "2"),
+            ("one-off", {"validators": ["int", "bool"]}, "y", "x"),
+            ("port", {}, "80", "-1"),
+            ("str", {"max_length": 2}, "ab", "abc"),
+            ("not-empty", {}, "a", ""),
+            ("netbios", {}, "HOST", ".host"),
+            ("url", {"scheme": ["https"]}, "https://a.de", "http://a.de"),
+            ("items", {"values": ["a", "b"]}, "a,b", "a,c"),
+            ("item", {"values": ["a", "b"]}, "a", "c"),
+            ("list", {"strict": True}, "['a']", "a"),
+            ("dict", {"strict": True}, "{'a': \"b\"}", "a: b"),
+            ("json", {}, "[1]", "x"),
+            ("base64", {}, "YQ==", "a"),
+            ("generalizedTime", {}, "2015010112Z", "2015010112X"),
+            ("StripQuotationMark", {"validator_name": "int"}, "'1'", "'x'"),
+        ]
+        for name, kwargs, valid, invalid in samples:
+            v = DATA_VALIDATOR[name](**kwargs)
+            self.assertEqual((True, v.validate(valid)), v.try_validate(valid), name)
+            ok, error = v.try_validate(invalid)
+            self.assertFalse(ok, name)
+            with self.assertRaises(Exception) as e:
+                v.validate(invalid)
+            self.assertEqual(str(e.exception), str(error), name)
+            # the error is returned without raising it
+            self.assertIsNone(getattr(error, "__traceback__", None), name)
+
     def test_add_new_class(self):
         from configvalidator.tools.basics import Validator
         from configvalidator import load_validator
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import shutil
+import tempfile
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator import ParserException, InitException, ValidatorException
+from configvalidator.tools.cache import LRUCache
+from configvalidator.tools.networks import NetworkIndex, NETWORK_INDEX_CACHE
+from configvalidator.validators import IPv4Validator, Ipv6Validator, IpValidator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "networks.txt")
+        NETWORK_INDEX_CACHE.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        NETWORK_INDEX_CACHE.clear()
+
+    def write(self, content, mtime):
+        with open(self.path, "w") as f:
+            f.write(content)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_index(self):
+        index = NetworkIndex([(10, 20), (15, 30), (31, 40), (50, 50), (0, 1)])
+        self.assertEqual(5, index.networks)
+        # overlapping and adjacent intervals are merged
+        self.assertEqual(3, len(index))
+        for ip in [0, 1, 10, 25, 40, 50]:
+            self.assertTrue(ip in index)
+        for ip in [2, 9, 41, 49, 51]:
+            self.assertFalse(ip in index)
+        self.assertFalse(1 in NetworkIndex([]))
+
+    def test_network_range(self):
+        self.assertEqual((0x0a000000, 0x0affffff), IPv4Validator.network_range("10.1.2.3/8"))
+        self.assertEqual((0x0a010203, 0x0a010203), IPv4Validator.network_range("10.1.2.3"))
+        self.assertEqual((0, 0xffffffff), IPv4Validator.network_range("0.0.0.0/0"))
+        self.assertEqual((0xfe80 << 112, (0xfe80 << 112) | ((1 << 118) - 1)), Ipv6Validator.network_range("fe80::1/10"))
+        self.assertEqual((1, 1), Ipv6Validator.network_range("::1"))
+
+    def test_ipv4(self):
+        v = IPv4Validator(allowed_networks=["10.0.0.0/8", "192.168.1.0/24", "1.2.3.4", "2001:db8::/32"], denied_networks=["10.66.0.0/16"])
+        self.assertEqual("10.1.2.3", v.validate("10.1.2.3"))
+        self.assertEqual("1.2.3.4", v.validate("1.2.3.4"))
+        self.assertEqual("192.168.1.255", v.validate("192.168.1.255"))
+        with self.assertRaises(ValidatorException) as e1:
+            v.validate("192.168.2.1")
+        self.assertEqual("IP is not in an allowed network", str(e1.exception))
+        with self.assertRaises(ValidatorException) as e2:
+            v.validate("10.66.1.1")
+        self.assertEqual("IP is in a denied network", str(e2.exception))
+        # the cidr and private checks come first
+        v = IPv4Validator(private=True, denied_networks=["10.0.0.0/24"])
+        self.assertEqual("IP is not en private Network", str(v.try_validate("1.1.1.1")[1]))
+        self.assertEqual("IP is in a denied network", str(v.try_validate("10.0.0.1")[1]))
+        self.assertTrue(v.try_validate("10.0.1.1")[0])
+
+    def test_ipv6(self):
+        v = Ipv6Validator(allowed_networks=["2001:db8::/32", "::1", "10.0.0.0/8"], denied_networks=["2001:db8:bad::/48"])
+        self.assertEqual("2001:db8::1", v.validate("2001:db8::1"))
+        self.assertEqual("::1", v.validate("::1"))
+        self.assertFalse(v.try_validate("::2")[0])
+        self.assertFalse(v.try_validate("::ffff:10.0.0.1")[0])
+        self.assertEqual("IP is in a denied network", str(v.try_validate("2001:db8:bad::1")[1]))
+
+    def test_ip(self):
+        v = IpValidator(allowed_networks=["10.0.0.0/8", "fd00::/8"], denied_networks=["10.0.0.0/24", "fd00::/16"])
+        self.assertEqual("10.1.0.1", v.validate("10.1.0.1"))
+        self.assertEqual("fd01::1", v.validate("fd01::1"))
+        for value in ["10.0.0.1", "fd00::1", "11.0.0.1", "fe80::1"]:
+            with self.assertRaises(ValidatorException):
+                v.validate(value)
+
+    def test_invalid(self):
+        with self.assertRaises(InitException) as e1:
+            IPv4Validator(allowed_networks=["10.0.0.0/8", "10.0.0.256"])
+        self.assertEqual("invalid network '10.0.0.256': invalid ipv4 format: [0-255] | no leading zeros", str(e1.exception))
+        with self.assertRaises(InitException) as e2:
+            Ipv6Validator(denied_networks=["fe80::/129"])
+        self.assertEqual("invalid network 'fe80::/129': ", str(e2.exception))
+        with self.assertRaises(InitException) as e3:
+            IPv4Validator(allowed_networks=[10])
+        self.assertEqual("invalid network 10: must be a string", str(e3.exception))
+        with self.assertRaises(InitException) as e4:
+            IPv4Validator(allowed_networks=os.path.join(self.tmp_dir, "missing.txt"))
+        self.assertTrue(str(e4.exception).startswith("can't read network file"))
+
+    def test_shared(self):
+        v1 = IPv4Validator(allowed_networks=["10.0.0.0/8"])
+        v2 = IpValidator(allowed_networks=["10.0.0.0/8"])
+        self.assertIs(v1._allowed_networks, v2._validators[0]._allowed_networks)
+        self.assertIsNot(v1._allowed_networks, v2._validators[1]._allowed_networks)
+        self.assertTrue(v1.cacheable)
+
+    def test_file(self):
+        self.write("# office\n10.0.0.0/8\n\n192.168.0.0/16  # lab\nfd00::/8\n", 1000000000)
+        v1 = IPv4Validator(allowed_networks=self.path)
+        v2 = Ipv6Validator(allowed_networks=self.path)
+        self.assertFalse(v1.cacheable)
+        self.assertEqual(2, v1._allowed_networks.networks)
+        self.assertEqual(1, v2._allowed_networks.networks)
+        self.assertTrue(v1.try_validate("192.168.3.4")[0])
+        self.assertTrue(v2.try_validate("fd12::1")[0])
+        self.assertIs(v1._allowed_networks, IPv4Validator(allowed_networks=self.path)._allowed_networks)
+        # a changed file is read again
+        self.write("10.0.0.0/8\n", 1000000010)
+        v3 = IPv4Validator(allowed_networks=self.path)
+        self.assertFalse(v3.try_validate("192.168.3.4")[0])
+        self.assertTrue(v1.try_validate("192.168.3.4")[0])
+
+    def test_parse(self):
+        self.write("10.0.0.0/8\n", 1000000000)
+        config_dict = {
+            "SectionA": {
+                "a": {"validator": {"type": "ipv4", "allowed_networks": self.path}},
+                "b": {"validator": {"type": "ip", "denied_networks": ["10.0.0.0/8", "fd00::/8"]}},
+            },
+        }
+        cv = ConfigValidator(cp=testutils.CPStub2({"SectionA": {"a": "10.1.1.1", "b": "fe80::1"}}), validator_cache=LRUCache())
+        self.assertEqual({"SectionA": {"a": "10.1.1.1", "b": "fe80::1"}}, cv.parse(config_dict))
+        # the file validator is not cached
+        self.assertEqual(1, len(cv.validator_cache))
+        self.write("11.0.0.0/8\n", 1000000010)
+        with self.assertRaises(ParserException) as e:
+            cv.parse(config_dict)
+        self.assertEqual("error validating [SectionA]a: IP is not in an allowed network", str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
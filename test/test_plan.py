@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import pickle
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator import AttributeDict
+from configvalidator import ParserException
+from configvalidator.tools.plan import SchemaPlan, CompiledSectionStep, ValidatorStep, SectionStep
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dict = {
+            "SectionA": {
+                "option_A1": {
+                    "default": "10",
+                    "validator": "int",
+                },
+                "option_A2": {
+                    "validator": {
+                        "type": "int",
+                        "min": 0,
+                        "max": ("SectionA", "option_A1"),
+                    },
+                    "depends": ["max"],
+                },
+            },
+            "SectionB": {
+                "__feature__": "raw_section_input",
+                "validator": "int",
+            },
+        }
+
+    def test_compile(self):
+        plan = ConfigValidator.compile(self.config_dict)
+        self.assertTrue(isinstance(plan, SchemaPlan))
+        self.assertEqual(2, len(plan))
+        steps = dict((step.section, step) for step in plan.sections)
+        self.assertTrue(isinstance(steps["SectionA"], CompiledSectionStep))
+        self.assertTrue(isinstance(steps["SectionB"], SectionStep))
+        options = dict((step.option, step) for step in steps["SectionA"].options)
+        self.assertTrue(isinstance(options["option_A2"], ValidatorStep))
+        self.assertEqual("int", options["option_A2"].validator_class.name)
+        self.assertEqual(("max",), options["option_A2"].dependencies)
+        self.assertEqual({"min": 0, "max": ("SectionA", "option_A1")}, dict(options["option_A2"].validator_kwargs))
+
+    def test_parse_plan(self):
+        plan = ConfigValidator.compile(self.config_dict)
+        for value in ["1", "5", "10"]:
+            cv = testutils.get_cp({"SectionA": {"option_A2": value}, "SectionB": {"b1": "7"}})
+            res = cv.parse(plan)
+            self.assertTrue(isinstance(res, AttributeDict))
+            self.assertEqual(res, cv.parse(self.config_dict))
+            self.assertEqual(int(value), res.SectionA.option_A2)
+            self.assertEqual(7, res.SectionB.b1)
+        cv = testutils.get_cp({"SectionA": {"option_A2": "11"}, "SectionB": {}})
+        with self.assertRaises(ParserException) as e:
+            cv.parse(plan)
+        self.assertEqual("error validating [SectionA]option_A2: maximum: 10", str(e.exception))
+
+    def test_plan_is_independent(self):
+        plan = ConfigValidator.compile(self.config_dict)
+        self.config_dict["SectionA"]["option_A1"]["default"] = "0"
+        del self.config_dict["SectionB"]
+        cv = testutils.get_cp({"SectionA": {"option_A2": "5"}, "SectionB": {"b1": "7"}})
+        res = cv.parse(plan)
+        self.assertEqual(10, res.SectionA.option_A1)
+        self.assertEqual(5, res.SectionA.option_A2)
+        self.assertEqual({"b1": 7}, res.SectionB)
+
+    def test_compile_errors(self):
+        config_dict = {
+            "SectionA": {
+                "__feature__": "NOT-DEFINED",
+            },
+            "SectionB": {
+                "option_B1": "NOT-DEFINED",
+            },
+        }
+        plan = ConfigValidator.compile(config_dict)
+        cv = testutils.get_cp()
+        with self.assertRaises(ParserException) as e:
+            cv.parse(plan)
+        self.assertListEqual(
+            sorted(["Error parsing section SectionA: no Section feature with the name NOT-DEFINED",
+                    "Error parsing section SectionB: no validator with the name NOT-DEFINED"]),
+            sorted(str(e.exception).split("\n")))
+
+    def test_plan_reuse_nested_config(self):
+        config_dict = {
+            "SectionA": {
+                "option_A1": {
+                    "validator": {
+                        "type": "or",
+                        "validators": [{"type": "int", "max": 5}, "email"],
+                    },
+                },
+            },
+        }
+        plan = ConfigValidator.compile(config_dict)
+        for _ in range(2):
+            cv = testutils.get_cp({"SectionA": {"option_A1": "7"}})
+            with self.assertRaises(ParserException) as e:
+                cv.parse(plan)
+            self.assertEqual("error validating [SectionA]option_A1: maximum: 5\ninvalid email format", str(e.exception))
+
+    def test_pickle(self):
+        plan = pickle.loads(pickle.dumps(ConfigValidator.compile(self.config_dict)))
+        cv = testutils.get_cp({"SectionA": {"option_A2": "5"}, "SectionB": {}})
+        self.assertEqual(5, cv.parse(plan).SectionA.option_A2)
+
+
+if __name__ == '__main__':
+    unittest.main()
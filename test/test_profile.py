@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator, ParseProfiler
+from configvalidator.tools.parser import IniKey
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dict = {
+            "SectionA": {
+                "a1": {"validator": {"type": "int", "min": ("SectionA", "a2")}, "depends": ["min"]},
+                "a2": "int",
+                "a3": "bool",
+            },
+            "SectionB": {
+                "__feature__": "raw_section_input",
+                "validator": "int",
+            },
+        }
+        self.data = {
+            "SectionA": {"a1": "10", "a2": "5", "a3": "true"},
+            "SectionB": {"b1": "1", "b2": "x"},
+        }
+        self.events = []
+
+    def hook(self, event, section, option, validator_name, elapsed_ns):
+        self.events.append((event, section, option, validator_name))
+        self.assertTrue(elapsed_ns >= 0)
+
+    def test_hooks(self):
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        with self.assertRaises(Exception):
+            cv.parse(self.config_dict, hooks=[self.hook])
+        events = set(self.events)
+        for option in ["a1", "a2"]:
+            self.assertIn(("init", "SectionA", option, "int"), events)
+            self.assertIn(("validate", "SectionA", option, "int"), events)
+        self.assertIn(("validate", "SectionA", "a3", "bool"), events)
+        # a1 waited for a2
+        self.assertIn(("resolve", "SectionA", "a2", "int"), events)
+        # raw section input and failed validations
+        self.assertIn(("validate", "SectionB", "b1", "int"), events)
+        self.assertIn(("validate", "SectionB", "b2", "int"), events)
+        self.assertEqual(1, len([e for e in self.events if e[0] == "resolve"]))
+
+    def test_no_hooks(self):
+        self.data["SectionB"]["b2"] = "2"
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        self.assertEqual(cv.parse(self.config_dict), cv.parse(self.config_dict, hooks=[self.hook]))
+
+    def test_threads(self):
+        self.config_dict["SectionA"]["a4"] = "path"
+        self.data["SectionA"]["a4"] = "/"
+        self.data["SectionB"]["b2"] = "2"
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        res = cv.parse(self.config_dict, threads=2, hooks=[self.hook])
+        self.assertEqual("/", res.SectionA.a4)
+        self.assertEqual(1, self.events.count(("init", "SectionA", "a4", "path")))
+        self.assertEqual(1, self.events.count(("validate", "SectionA", "a4", "path")))
+
+    def test_profiler(self):
+        self.data["SectionB"]["b2"] = "2"
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        profiler = ParseProfiler()
+        cv.parse(self.config_dict, hooks=[profiler])
+        cv.parse(self.config_dict, hooks=[profiler])
+        self.assertEqual(5, len(profiler.options))
+        self.assertEqual(2, len(profiler.top(2)))
+        self.assertIn(IniKey("SectionB", "b1"), profiler.options)
+        totals = dict((name, count) for name, count, ns in profiler.validator_totals())
+        self.assertEqual({"int": 8, "bool": 2}, totals)
+        self.assertEqual([10, 10, 2], [profiler.events["init"][0], profiler.events["validate"][0], profiler.events["resolve"][0]])
+        report = profiler.report(n=3)
+        self.assertIn("slowest options:", report)
+        self.assertIn("bool", report)
+        profiler.clear()
+        self.assertEqual({}, profiler.options)
+
+
+if __name__ == '__main__':
+    unittest.main()
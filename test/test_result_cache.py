@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import os
+import shutil
+import tempfile
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+from configvalidator import ResultCache, ConfigValidator, ParserException
+from configvalidator.tools.resultcache import fingerprint
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dict = {
+            "SectionA": {
+                "option_A1": {"validator": {"type": "int", "max": 100}},
+                "option_A2": {"default": "x"},
+            },
+        }
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_same_content(self):
+        cache = ResultCache()
+        plan = ConfigValidator.compile(self.config_dict)
+        host_1 = self.write("host_1.ini", "[SectionA]\noption_A1 = 10\n")
+        host_2 = self.write("host_2.ini", "[SectionA]\noption_A1 = 10\n")
+        res = cache.parse(host_1, plan)
+        self.assertEqual({"SectionA": {"option_A1": 10, "option_A2": "x"}}, res)
+        self.assertTrue(cache.parse(host_2, plan) is res)
+        # a new compiled plan has the same fingerprint
+        self.assertTrue(cache.parse(host_2, self.config_dict) is res)
+        self.assertEqual((2, 1), (cache.hits, cache.misses))
+        # other content
+        self.write("host_2.ini", "[SectionA]\noption_A1 = 20\n")
+        self.assertEqual(20, cache.parse(host_2, plan).SectionA.option_A1)
+        # other data for the validators
+        cache.parse(host_1, plan, data={"key": "value"})
+        self.assertEqual((2, 3), (cache.hits, cache.misses))
+        self.assertEqual(3, len(cache))
+
+    def test_errors_not_cached(self):
+        cache = ResultCache()
+        path = self.write("host.ini", "[SectionA]\noption_A1 = 200\n")
+        for _ in range(2):
+            with self.assertRaises(ParserException) as e:
+                cache.parse(path, self.config_dict)
+            self.assertEqual("error validating [SectionA]option_A1: maximum: 100", str(e.exception))
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_volatile(self):
+        self.config_dict["SectionA"]["option_A3"] = {"validator": {"type": "or", "validators": ["int", "dir"]}, "default": self.tmp_dir}
+        path = self.write("host.ini", "[SectionA]\noption_A1 = 10\n")
+        cache = ResultCache()
+        first = cache.parse(path, self.config_dict)
+        self.assertEqual(self.tmp_dir, first.SectionA.option_A3)
+        self.assertFalse(cache.parse(path, self.config_dict) is first)
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+        cache = ResultCache(volatile_ttl=60)
+        first = cache.parse(path, self.config_dict)
+        self.assertTrue(cache.parse(path, self.config_dict) is first)
+        # expired
+        cache = ResultCache(volatile_ttl=60, ttl=0)
+        cache.parse(path, self.config_dict)
+        cache.parse(path, self.config_dict)
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_disk(self):
+        directory = os.path.join(self.tmp_dir, "cache")
+        path = self.write("host.ini", "[SectionA]\noption_A1 = 10\n")
+        res = ResultCache(directory=directory).parse(path, self.config_dict)
+        cache = ResultCache(directory=directory)
+        self.assertEqual(res, cache.parse(path, self.config_dict))
+        self.assertEqual((1, 1, 0), (cache.hits, cache.disk_hits, cache.misses))
+        cache.parse(path, self.config_dict)
+        self.assertEqual((2, 1, 0), (cache.hits, cache.disk_hits, cache.misses))
+        cache.clear()
+        self.assertEqual([], os.listdir(directory))
+        cache.parse(path, self.config_dict)
+        self.assertEqual((0, 0, 1), (cache.hits, cache.disk_hits, cache.misses))
+
+    def test_version_and_namespace(self):
+        directory = os.path.join(self.tmp_dir, "cache")
+        path = self.write("host.ini", "[SectionA]\noption_A1 = 10\n")
+        ResultCache(directory=directory, namespace="app1").parse(path, self.config_dict)
+        cache = ResultCache(directory=directory, namespace="app2")
+        cache.parse(path, self.config_dict)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        # results of another version are not used
+        with mock.patch("configvalidator.__version__", "0.0.1"):
+            cache = ResultCache(directory=directory, namespace="app1")
+            cache.parse(path, self.config_dict)
+            self.assertEqual((0, 1), (cache.hits, cache.misses))
+        cache = ResultCache(directory=directory, namespace="app1")
+        cache.parse(path, self.config_dict)
+        self.assertEqual((1, 1, 0), (cache.hits, cache.disk_hits, cache.misses))
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint(ConfigValidator.compile(self.config_dict)), fingerprint(ConfigValidator.compile(dict(self.config_dict))))
+        self.assertEqual(fingerprint({"a": 1, "b": (1, 2)}), fingerprint({"b": (1, 2), "a": 1}))
+        self.assertNotEqual(fingerprint({"a": 1}), fingerprint({"a": "1"}))
+        self.assertNotEqual(fingerprint((1, 2)), fingerprint([1, 2]))
+        with self.assertRaises(TypeError):
+            fingerprint({"a": lambda x: x})
+
+    def test_no_fingerprint(self):
+        cache = ResultCache()
+        path = self.write("host.ini", "[SectionA]\noption_A1 = 10\n")
+        data = {"fn": lambda x: x}
+        res = cache.parse(path, self.config_dict, data=data)
+        self.assertFalse(cache.parse(path, self.config_dict, data=data) is res)
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,16 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual("world", res.b)
         self.assertEqual("world", res["b"])
 
+    def test_nested(self):
+        section = AttributeDict(option="1")
+        res = AttributeDict(section=section, plain=dict(option="2"))
+        # no copy for nested results
+        self.assertTrue(res.section is section)
+        self.assertTrue(res.section is res.section)
+        self.assertEqual("1", res.section.option)
+        self.assertTrue(isinstance(res.plain, AttributeDict))
+        self.assertEqual("2", res.plain.option)
+
     def test_error(self):
         res = AttributeDict()
         with self.assertRaises(KeyError) as e:
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import os
+import pickle
+import shutil
+import tempfile
+import testutils
+from configvalidator import ConfigValidator, ResultCache
+from configvalidator import ParserException
+from configvalidator.tools.basics import DATA_VALIDATOR, DATA_OPTION_FEATURE, OptionFeature
+from configvalidator.tools.parser import IniKey
+from configvalidator.validators import IntValidator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.validated = []
+        validated = self.validated
+
+        def validate(inst, value):
+            validated.append(value)
+            return IntValidator.validate(inst, value)
+        self.counting = type("COUNTING_INT", (IntValidator,), {"validate": validate})
+        self.counting_blocking = type("COUNTING_BLOCKING", (IntValidator,), {"validate": validate, "blocking": True})
+        self.config_dict = {
+            "SectionA": {
+                "a1": "COUNTING_INT",
+                "a2": "COUNTING_INT",
+                "a3": {"validator": {"type": "COUNTING_INT", "max": ("SectionA", "a1")}, "depends": ["max"]},
+                "a4": {"validator": "COUNTING_INT", "default": "0"},
+            },
+            "SectionB": {
+                "__feature__": "raw_section_input",
+                "validator": "COUNTING_INT",
+            },
+        }
+        self.data = {"SectionA": {"a1": "10", "a2": "20", "a3": "5"}, "SectionB": {"b1": "1"}}
+
+    def tearDown(self):
+        del DATA_VALIDATOR["COUNTING_INT"]
+        del DATA_VALIDATOR["COUNTING_BLOCKING"]
+
+    def revalidate(self, previous, data, cv=None):
+        if cv is None:
+            cv = testutils.get_cp()
+        del self.validated[:]
+        return cv.revalidate(previous, testutils.get_valid_stub(data))
+
+    def test_unchanged(self):
+        res = testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)
+        self.assertEqual(5, len(self.validated))
+        new_res, changed = self.revalidate(res, self.data)
+        self.assertEqual(res, new_res)
+        self.assertEqual(set(), changed)
+        self.assertEqual([], self.validated)
+
+    def test_changed_option(self):
+        res = testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)
+        self.data["SectionA"]["a2"] = "21"
+        self.data["SectionB"]["b2"] = "2"
+        new_res, changed = self.revalidate(res, self.data)
+        self.assertEqual(set([IniKey("SectionA", "a2"), IniKey("SectionB", "b2")]), changed)
+        self.assertEqual(["21", "2"], self.validated)
+        self.assertEqual(21, new_res.SectionA.a2)
+        self.assertEqual({"b1": 1, "b2": 2}, new_res.SectionB)
+        # the new result can be revalidated again
+        self.data["SectionA"]["a4"] = "4"
+        res, changed = self.revalidate(new_res, self.data)
+        self.assertEqual(set([IniKey("SectionA", "a4")]), changed)
+        self.assertEqual(["4"], self.validated)
+
+    def test_dependencies(self):
+        res = testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)
+        self.data["SectionA"]["a1"] = "11"
+        new_res, changed = self.revalidate(res, self.data)
+        self.assertEqual(set([IniKey("SectionA", "a1")]), changed)
+        self.assertEqual(["11", "5"], self.validated)
+        self.data["SectionA"]["a1"] = "4"
+        with self.assertRaises(ParserException) as e:
+            self.revalidate(new_res, self.data)
+        self.assertEqual("error validating [SectionA]a3: maximum: 4", str(e.exception))
+
+    def test_blocking_and_data(self):
+        self.config_dict["SectionA"]["a2"] = "COUNTING_BLOCKING"
+        res = testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)
+        _, changed = self.revalidate(res, self.data)
+        self.assertEqual(set(), changed)
+        self.assertEqual(["20"], self.validated)
+        # other data -> everything is validated again
+        cv = testutils.get_cp()
+        cv.add_data("foo", "bar")
+        self.revalidate(res, self.data, cv)
+        self.assertEqual(5, len(self.validated))
+
+    def test_custom_validate_fn(self):
+        def parse_option(inst, parse_obj, option_dict):
+            def double(section, option, validator, raw_value):
+                parse_obj.add(section, option, validator.validate(raw_value) * 2)
+            parse_obj.add_value(validator_class=self.counting, validator_init_dict={}, custom_validate_fn=double)
+        type("DOUBLE", (OptionFeature,), {"name": "DOUBLE", "parse_option": parse_option})
+        try:
+            self.config_dict["SectionA"]["a2"] = {"feature": "DOUBLE"}
+            res = testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)
+            self.assertEqual(40, res.SectionA.a2)
+            for _ in range(2):
+                res, changed = self.revalidate(res, self.data)
+                self.assertEqual(40, res.SectionA.a2)
+                self.assertEqual(set(), changed)
+                # the custom function gets the real validator
+                self.assertEqual(["20"], self.validated)
+        finally:
+            del DATA_OPTION_FEATURE["DOUBLE"]
+
+    def test_no_state(self):
+        with self.assertRaises(ParserException) as e:
+            testutils.get_cp().revalidate({}, testutils.get_valid_stub())
+        self.assertEqual("the previous result has no parse state, parse it with keep_state=True", str(e.exception))
+
+
+    def test_state_opt_in(self):
+        message = "the previous result has no parse state, parse it with keep_state=True"
+        res = testutils.get_cp(self.data).parse(self.config_dict)
+        self.assertFalse("_parse_state" in res.__dict__)
+        with self.assertRaises(ParserException) as e1:
+            self.revalidate(res, self.data)
+        self.assertEqual(message, str(e1.exception))
+        # the state is not pickled
+        res = pickle.loads(pickle.dumps(testutils.get_cp(self.data).parse(self.config_dict, keep_state=True)))
+        self.assertEqual(10, res.SectionA.a1)
+        with self.assertRaises(ParserException) as e2:
+            self.revalidate(res, self.data)
+        self.assertEqual(message, str(e2.exception))
+        # results of a ResultCache have no state
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "host.ini")
+            with open(path, "w") as f:
+                f.write("[SectionA]\na1 = 10\na2 = 20\na3 = 5\n[SectionB]\nb1 = 1\n")
+            res = ResultCache().parse(path, self.config_dict)
+            with self.assertRaises(ParserException) as e3:
+                self.revalidate(res, self.data)
+            self.assertEqual(message, str(e3.exception))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_lazy_state(self):
+        res = testutils.get_cp(self.data).parse(self.config_dict, lazy=True, keep_state=True).validate_all()
+        new_res, changed = self.revalidate(res, self.data)
+        self.assertEqual(res, new_res)
+        self.assertEqual(set(), changed)
+        self.assertFalse("_parse_state" in testutils.get_cp(self.data).parse(self.config_dict, lazy=True).validate_all().__dict__)
+
+
+if __name__ == '__main__':
+    unittest.main()
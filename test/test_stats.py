@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import json
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator, ParseStats, IniReader, ParserException
+from configvalidator.tools.cache import LRUCache
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.sub_ini = os.path.join(testutils.get_test_utils_base(), "data", "exist", "default.ini")
+        self.config_dict = {
+            "SectionA": {
+                "a1": {"validator": {"type": "int", "min": ("SectionA", "a2")}, "depends": ["min"]},
+                "a2": {"validator": {"type": "int", "min": ("SectionA", "a3")}, "depends": ["min"]},
+                "a3": "int",
+                "a4": "bool",
+                "a5": {"feature": "sub_ini", "config": {"A": {"b": {}}}},
+            },
+        }
+        self.data = {"SectionA": {"a1": "10", "a2": "5", "a3": "1", "a4": "true", "a5": self.sub_ini}}
+
+    def test_stats(self):
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data), validator_cache=LRUCache(maxsize=10))
+        res, stats = cv.parse(self.config_dict, with_stats=True)
+        self.assertEqual(10, res.SectionA.a1)
+        self.assertEqual("Hallo Welt", res.SectionA.a5.A.b)
+        self.assertTrue(isinstance(stats, ParseStats))
+        # the option of the sub_ini file is counted with the validator name "default"
+        self.assertEqual({"int": 3, "bool": 1, "default": 1, "SubIniValidator": 1}, stats.options)
+        self.assertEqual(2, stats.deferred)
+        self.assertEqual(2, stats.max_depth)
+        self.assertEqual(1, stats.sub_ini_files)
+        self.assertEqual(os.path.getsize(self.sub_ini), stats.sub_ini_bytes_read)
+        self.assertIsNone(stats.bytes_read)
+        self.assertEqual(6, stats.validators_created + stats.validators_reused)
+        self.assertEqual(stats.validators_reused, stats.cache_hits)
+        for phase in ["prepare", "read", "validate", "resolve", "result"]:
+            self.assertTrue(stats.wall[phase] >= 0)
+            self.assertTrue(stats.cpu[phase] >= 0)
+        self.assertTrue(stats.wall["validate"] > 0)
+        data = json.loads(json.dumps(stats.as_dict()))
+        self.assertEqual(2, data["max_depth"])
+        # the second run reuses the cached validators
+        res, stats = cv.parse(self.config_dict, with_stats=True)
+        self.assertTrue(stats.validators_reused > 0)
+
+    def test_default(self):
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        self.assertEqual(cv.parse(self.config_dict), cv.parse(self.config_dict, with_stats=True)[0])
+
+    def test_bytes_read(self):
+        cp = IniReader()
+        cp.read_string(u"[SectionA]\na1 = 1\n")
+        res, stats = ConfigValidator(cp=cp).parse({"SectionA": {"a1": "int"}}, with_stats=True)
+        self.assertEqual(1, res.SectionA.a1)
+        self.assertEqual(len(b"[SectionA]\na1 = 1\n"), stats.bytes_read)
+
+    def test_circle(self):
+        self.config_dict["SectionA"]["a3"] = {"validator": {"type": "int", "min": ("SectionA", "a1")}, "depends": ["min"]}
+        cv = ConfigValidator(cp=testutils.CPStub2(self.data))
+        with self.assertRaises(ParserException):
+            cv.parse(self.config_dict, with_stats=True)
+        res, stats = cv.parse(self.config_dict, lazy=True, with_stats=True)
+        self.assertEqual({}, stats.options)
+        with self.assertRaises(ParserException):
+            res.validate_all()
+        self.assertEqual(3, stats.options["int"])
+        self.assertEqual(3, stats.max_depth)
+
+
+if __name__ == '__main__':
+    unittest.main()
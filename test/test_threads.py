@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import time
+import threading
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator import ParserException
+from configvalidator.tools.basics import DATA_VALIDATOR
+from configvalidator.validators import DefaultValidator
+
+
+class Barrier(object):
+
+    """threading.Barrier (python >= 3.2) for one use: wait returns if all parties are waiting"""
+
+    def __init__(self, parties, timeout):
+        self.parties = parties
+        self.timeout = timeout
+        self.waiting = 0
+        self.condition = threading.Condition()
+
+    def wait(self):
+        deadline = time.time() + self.timeout
+        with self.condition:
+            self.waiting += 1
+            self.condition.notify_all()
+            while self.waiting < self.parties:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise RuntimeError("barrier timeout")
+                self.condition.wait(remaining)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base = os.path.join(testutils.get_test_utils_base(), "data", "exist")
+        barrier = Barrier(3, timeout=10)
+
+        def validate(inst, value):
+            barrier.wait()
+            return value
+        self.waiting = type("WAITING", (DefaultValidator,), {"validate": validate, "blocking": True})
+
+    def tearDown(self):
+        del DATA_VALIDATOR["WAITING"]
+
+    def parse(self, config_dict, data, threads):
+        cp = testutils.CPStub2(data)
+        return ConfigValidator(cp=cp).parse(config_dict, threads=threads)
+
+    def test_same_result(self):
+        config_dict = testutils.get_dict()
+        config_dict["SectionA"] = testutils.get_dict()
+        config_dict["SectionA"]["a1"] = "file"
+        config_dict["SectionA"]["a2"] = "int"
+        config_dict["SectionA"]["a3"] = "dir"
+        config_dict["SectionA"]["a4"] = {"validator": {"type": "int", "max": ("SectionA", "a2")}, "depends": ["max"]}
+        config_dict["SectionB"] = testutils.get_dict()
+        config_dict["SectionB"]["b1"] = {"feature": "sub_ini", "config": {"A": {"b": {}}}}
+        config_dict["SectionB"]["b2"] = {"feature": "sub_ini", "config": {"A": {"b": "int"}}}
+        config_dict["SectionB"]["b3"] = "path"
+        config_dict["SectionB"]["b4"] = {"validator": "strip_file", "default": "'{path}'".format(path=os.path.join(self.base, "default.ini"))}
+        data = {
+            "SectionA": {"a1": os.path.join(self.base, "default.ini"), "a2": "5", "a3": os.path.join(self.base, "a"), "a4": "4"},
+            "SectionB": {"b1": os.path.join(self.base, "default.ini"), "b2": os.path.join(self.base, "default.ini")},
+        }
+        with self.assertRaises(ParserException) as serial:
+            self.parse(config_dict, data, None)
+        with self.assertRaises(ParserException) as threaded:
+            self.parse(config_dict, data, 4)
+        self.assertEqual(str(serial.exception), str(threaded.exception))
+        self.assertEqual(2, len(str(threaded.exception).split("\n")))
+        # without errors
+        del config_dict["SectionB"]["b2"]
+        data["SectionB"]["b3"] = self.base
+        res = self.parse(config_dict, data, 4)
+        self.assertEqual(self.parse(config_dict, data, None), res)
+        self.assertEqual("Hallo Welt", res.SectionB.b1.A.b)
+        self.assertEqual(4, res.SectionA.a4)
+
+    def test_concurrent(self):
+        config_dict = {"SectionA": dict(("option_{idx}".format(idx=idx), "WAITING") for idx in range(3))}
+        data = {"SectionA": dict(("option_{idx}".format(idx=idx), str(idx)) for idx in range(3))}
+        # the barrier is only passed if all three options are validated at the same time
+        res = self.parse(config_dict, data, 3)
+        self.assertEqual({"option_0": "0", "option_1": "1", "option_2": "2"}, res.SectionA)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator.tools.basics import Validator, DATA_VALIDATOR
+from configvalidator.tools.cache import LRUCache, make_key
+from configvalidator.validators import IntValidator, OrValidator, DefaultValidator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+        created = self.created
+
+        def _init(inst, **kwargs):
+            created.append(kwargs)
+        self.counting = type("COUNTING_CACHEABLE", (DefaultValidator,), {"__init__": _init, "cacheable": True})
+        self.counting_not_cacheable = type("COUNTING", (DefaultValidator,), {"__init__": _init})
+
+    def tearDown(self):
+        del DATA_VALIDATOR["COUNTING_CACHEABLE"]
+        del DATA_VALIDATOR["COUNTING"]
+
+    def test_lru(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.set("c", 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(None, cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(3, cache.hits)
+        self.assertEqual(1, cache.misses)
+        disabled = LRUCache(maxsize=0)
+        disabled.set("a", 1)
+        self.assertEqual(0, len(disabled))
+
+    def test_make_key(self):
+        self.assertEqual(make_key({"a": [1, {"b": "c"}]}), make_key({"a": [1, {"b": "c"}]}))
+        self.assertNotEqual(make_key({"max": 1}), make_key({"max": 1.0}))
+        self.assertNotEqual(make_key({"max": 1}), make_key({"max": True}))
+        self.assertNotEqual(make_key({"max": [1, 2]}), make_key({"max": (1, 2)}))
+        with self.assertRaises(TypeError):
+            make_key({"max": bytearray()})
+
+    def test_declaration(self):
+        self.assertTrue(IntValidator.cacheable)
+        self.assertFalse(Validator.cacheable)
+        self.assertFalse(self.counting_not_cacheable.cacheable)
+        # new constructor without declaration
+        sub_class = type("SUB", (IntValidator,), {"__init__": lambda inst: None, "inactive": True})
+        self.assertFalse(sub_class.cacheable)
+        # new validate or try_validate without declaration
+        for method in ("validate", "try_validate"):
+            sub_class = type("SUB", (IntValidator,), {method: lambda inst, value: value, "inactive": True})
+            self.assertFalse(sub_class.cacheable)
+        self.assertTrue(type("SUB", (IntValidator,), {"validate": lambda inst, value: value, "cacheable": True, "inactive": True}).cacheable)
+        for name in ("bool", "json", "port", "and", "one-off"):
+            self.assertTrue(DATA_VALIDATOR[name].cacheable)
+        # sub validators that are not cacheable
+        v = OrValidator(validators=["int", "COUNTING"])
+        self.assertFalse(v.cacheable)
+        self.assertTrue(OrValidator(validators=["int", "COUNTING_CACHEABLE"]).cacheable)
+
+    def _parse(self, cache, validator, size=50, **data):
+        config_dict = {"SectionA": dict(("option_{idx}".format(idx=idx), {"validator": validator}) for idx in range(size))}
+        input_dict = {"SectionA": dict(("option_{idx}".format(idx=idx), "10") for idx in range(size))}
+        cv = ConfigValidator(testutils.get_valid_stub(input_dict), validator_cache=cache)
+        for key, value in data.items():
+            cv.add_data(key, value)
+        return cv.parse(config_dict)
+
+    def test_shared_instances(self):
+        cache = LRUCache()
+        res = self._parse(cache, {"type": "COUNTING_CACHEABLE", "max": 100})
+        self.assertEqual(50, len(res.SectionA))
+        self.assertEqual(1, len(self.created))
+        self._parse(cache, {"type": "COUNTING_CACHEABLE", "max": 100})
+        self.assertEqual(1, len(self.created))
+        self.assertEqual(99, cache.hits)
+        # other parameter, other data
+        self._parse(cache, {"type": "COUNTING_CACHEABLE", "max": 10})
+        self.assertEqual(2, len(self.created))
+        self._parse(cache, {"type": "COUNTING_CACHEABLE", "max": 10}, VAL=1)
+        self.assertEqual(3, len(self.created))
+        self.assertEqual(3, len(cache))
+
+    def test_not_cacheable(self):
+        cache = LRUCache()
+        self._parse(cache, {"type": "COUNTING", "max": 100})
+        self.assertEqual(50, len(self.created))
+        self.assertEqual(0, len(cache))
+        # disabled cache
+        del self.created[:]
+        self._parse(None, {"type": "COUNTING_CACHEABLE", "max": 100})
+        self.assertEqual(50, len(self.created))
+
+    def test_not_hashable_data(self):
+        cache = LRUCache()
+        self._parse(cache, {"type": "COUNTING_CACHEABLE", "max": 100}, VAL=bytearray())
+        self.assertEqual(50, len(self.created))
+        self.assertEqual(0, len(cache))
+
+    def test_dependencies(self):
+        cache = LRUCache()
+        config_dict = {
+            "SectionA": {
+                "option_A1": {"validator": "int"},
+                "option_A2": {
+                    "validator": {"type": "int", "max": ("SectionA", "option_A1")},
+                    "depends": ["max"],
+                },
+            },
+        }
+        for max_value in ["5", "10"]:
+            cv = ConfigValidator(testutils.get_valid_stub({"SectionA": {"option_A1": max_value, "option_A2": "5"}}), validator_cache=cache)
+            self.assertEqual(5, cv.parse(config_dict).SectionA.option_A2)
+        cv = ConfigValidator(testutils.get_valid_stub({"SectionA": {"option_A1": "4", "option_A2": "5"}}), validator_cache=cache)
+        with self.assertRaises(Exception) as e:
+            cv.parse(config_dict)
+        self.assertEqual("error validating [SectionA]option_A2: maximum: 4", str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
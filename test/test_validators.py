@@ -541,6 +541,41 @@ class Test(unittest.TestCase):
             v.validate("11")
         self.assertListEqual(sorted(["allowed values: yes, no, y, n, true, false, t, f, 1, 0", "maximum: 10"]), sorted(str(e.exception).split("\n")))
 
+    def test_or_short_circuit(self):
+        from configvalidator.validators import OrValidator
+        v = OrValidator(validators=["email", {"type": "int", "max": 10}, "bool"], short_circuit=True)
+        email, int_validator, bool_validator = v._validators
+        # the validators after the first valid one are not used
+        with mock.patch.object(bool_validator, "try_validate", side_effect=Exception("bool used")):
+            self.assertEqual("3", v.validate("3"))
+        # the errors are in the order of the validators
+        with self.assertRaises(ValidatorException) as e:
+            v.validate("11")
+        self.assertEqual(["invalid email format", "maximum: 10", "allowed values: yes, no, y, n, true, false, t, f, 1, 0"], e.exception.info)
+        # the validators which are often valid are tried first
+        for _ in range(OrValidator.REORDER_RATE):
+            self.assertEqual("true", v.validate("true"))
+        self.assertEqual(2, v._order[0])
+        with mock.patch.object(email, "try_validate", side_effect=Exception("email used")):
+            self.assertEqual("yes", v.validate("yes"))
+        self.assertEqual("a@b.de", v.validate("a@b.de"))
+        with self.assertRaises(ValidatorException) as e:
+            v.validate("11")
+        self.assertEqual(["invalid email format", "maximum: 10", "allowed values: yes, no, y, n, true, false, t, f, 1, 0"], e.exception.info)
+
+    def test_and_short_circuit(self):
+        # and reports all errors, with and without short_circuit
+        from configvalidator.validators import AndValidator
+        for short_circuit in (False, True):
+            v = AndValidator(validators=[{"type": "int", "max": 10}, "bool"], short_circuit=short_circuit)
+            self.assertEqual("1", v.validate("1"))
+            with self.assertRaises(ValidatorException) as e:
+                v.validate("x")
+            self.assertEqual(["Input is no int", "allowed values: yes, no, y, n, true, false, t, f, 1, 0"], e.exception.info)
+            with self.assertRaises(ValidatorException) as e:
+                v.validate("5")
+            self.assertEqual(["allowed values: yes, no, y, n, true, false, t, f, 1, 0"], e.exception.info)
+
     def test_and(self):
         from configvalidator.validators import AndValidator
         v = AndValidator(validators=[
@@ -661,6 +696,36 @@ class Test(unittest.TestCase):
             IPv4Validator(cidr="123.g/12")
         self.assertEqual("IP format: [0-255].[0-255].[0-255].[0-255]", str(e4.exception))
 
+    def test_ipv4_int(self):
+        from configvalidator.validators import IPv4Validator
+        self.assertEqual(0xC0A80001, IPv4Validator.ip_to_int("192.168.0.1"))
+        self.assertEqual(0, IPv4Validator.ip_to_int("0.0.0.0"))
+        self.assertEqual(0xFFFFFFFF, IPv4Validator.ip_to_int("255.255.255.255"))
+        self.assertEqual("11000000.10101000.00000000.00000001", IPv4Validator.ip_to_bit_str("192.168.0.1"))
+        self.assertEqual((192, 168, 0, 1), IPv4Validator._split_ip_adress("192.168.0.1"))
+        self.assertEqual(0, IPv4Validator.subnet_mask_int(0))
+        self.assertEqual(0xFFF00000, IPv4Validator.subnet_mask_int(12))
+        self.assertEqual(0xFFFFFFFF, IPv4Validator.subnet_mask_int(32))
+        for value in ["01.1.1.1", "1.1.1.256", "1.1.1.-0", " 1.1.1.1", "1.1.1.+1", "1.1.1.", "1.1.1.1 "]:
+            with self.assertRaises(ValidatorException) as e:
+                IPv4Validator().validate(value)
+            self.assertEqual("invalid ipv4 format: [0-255] | no leading zeros", str(e.exception))
+        for value in ["1.1.1", "1.1.1.1.1", ""]:
+            with self.assertRaises(ValidatorException) as e:
+                IPv4Validator().validate(value)
+            self.assertEqual("IP format: [0-255].[0-255].[0-255].[0-255]", str(e.exception))
+        # the host bits of the cidr network are ignored
+        network = IPv4Validator(cidr="10.1.2.3/8")
+        self.assertEqual("10.200.0.1", network.validate("10.200.0.1"))
+        self.assertEqual((False, "IP outsite of subnet mask"), (network.try_validate("11.0.0.1")[0], str(network.try_validate("11.0.0.1")[1])))
+        host = IPv4Validator(cidr="10.1.2.3/32")
+        self.assertEqual("10.1.2.3", host.validate("10.1.2.3"))
+        self.assertFalse(host.try_validate("10.1.2.4")[0])
+        private = IPv4Validator(private=True, cidr="172.0.0.0/8")
+        self.assertEqual("172.31.255.255", private.validate("172.31.255.255"))
+        self.assertFalse(private.try_validate("172.32.0.0")[0])
+        self.assertFalse(private.try_validate("172.15.255.255")[0])
+
     def test_ipv6(self):
         from configvalidator.validators import Ipv6Validator
         no_limits = Ipv6Validator(cidr="/0")
@@ -743,6 +808,49 @@ class Test(unittest.TestCase):
             v1.validate("2001:db8:0:8d3:0:8a2e:70:7344:2001:db8:0:8d3:0:8a2e:70:7344")
         self.assertEqual("invalid IPv6 address - just 8 blocks", str(e4.exception))
 
+    def test_ipv6_int(self):
+        from configvalidator.validators import Ipv6Validator
+        self.assertEqual(0, Ipv6Validator.ip_to_int("::"))
+        self.assertEqual(1, Ipv6Validator.ip_to_int("::1"))
+        self.assertEqual(0x20010db8 << 96 | 0x1428 << 16 | 0x57ab, Ipv6Validator.ip_to_int("2001:db8::1428:57ab"))
+        self.assertEqual(Ipv6Validator.ip_to_int("2001:db8::1428:57ab"), Ipv6Validator.ip_to_int("2001:0db8:0:0:0:0:1428:57ab"))
+        self.assertEqual(0xfe80 << 112, Ipv6Validator.ip_to_int("fe80::"))
+        self.assertEqual(0xffff7f000001, Ipv6Validator.ip_to_int("::ffff:127.0.0.1"))
+        self.assertEqual(0x10002000300040005000601020304, Ipv6Validator.ip_to_int("1:2:3:4:5:6:1.2.3.4"))
+        self.assertEqual(1, Ipv6Validator.ip_to_int("::1/128", host_subnet_mask=True))
+        self.assertEqual(
+            "0010000000000001.0000110110111000.0000000000000000.0000000000000000."
+            "0000000000000000.0000000000000000.0001010000101000.0101011110101011",
+            Ipv6Validator.ip_to_bit_str("2001:db8::1428:57ab"))
+        self.assertEqual(0, Ipv6Validator.subnet_mask_int(0))
+        self.assertEqual(0xfe00 << 112, Ipv6Validator.subnet_mask_int(7))
+        self.assertEqual((1 << 128) - 1, Ipv6Validator.subnet_mask_int(128))
+        # a reduction at the start or the end can stand for no block
+        self.assertEqual(0x10002000300040005000600070008, Ipv6Validator.ip_to_int("1:2:3:4:5:6:7:8::"))
+        self.assertEqual(0x10002000300040005000600070008, Ipv6Validator.ip_to_int("::1:2:3:4:5:6:7:8"))
+        for value, msg in [
+                ("1::1.2.3.4", "invalid ipv4 format: [0-255] | no leading zeros"),
+                ("::1.2.3", "IP format: [0-255].[0-255].[0-255].[0-255]"),
+                ("1:2:3:4:5:6:7:1.2.3.4", "invalid IPv6 address - just 8 blocks"),
+                ("1:2:3:4:5:6:7:8:9::", "invalid IPv6 address - just 8 blocks"),
+                ("1:2:3:4:5:6:7", "invalid IPv6 address - just 8 blocks"),
+                ("1::2::3", "invalid ipv6 syntax: only one reduction via ::"),
+                ("1:2:3:4:5:6:7:10000", "invalid ipv6 syntax: each ipv6 block has maximum 16 bits"),
+                ("1:2:3:4:5:6:7:g", "invalid ipv6 syntax: invalid literal for int() with base 16: 'g'")]:
+            with self.assertRaises(ValidatorException) as e:
+                Ipv6Validator().validate(value)
+            self.assertEqual(msg, str(e.exception))
+        # the host bits of the cidr network are ignored
+        network = Ipv6Validator(cidr="2001:db8::1/32")
+        self.assertEqual("2001:db8:ffff::1", network.validate("2001:db8:ffff::1"))
+        ok, error = network.try_validate("2001:db9::1")
+        self.assertFalse(ok)
+        self.assertEqual("IP outsite of subnet mask", str(error))
+        private = Ipv6Validator(private=True)
+        self.assertFalse(private.try_validate("::2")[0])
+        self.assertFalse(private.try_validate("fec0::1")[0])
+        self.assertTrue(private.try_validate("fcff::1")[0])
+
     def test_ip(self):
         from configvalidator.validators import IpValidator
         v = IpValidator()
@@ -755,6 +863,23 @@ class Test(unittest.TestCase):
             sorted(["invalid ipv4 format: [0-255] | no leading zeros", "invalid ipv6 format"])
         )
 
+    def test_ip_dispatch(self):
+        from configvalidator.validators import IpValidator
+        v = IpValidator(private=True)
+        ipv4, ipv6 = v._validators
+        # a valid input is only validated by its address family
+        with mock.patch.object(ipv6, "try_validate", side_effect=Exception("ipv6 used")):
+            self.assertEqual("10.0.0.1", v.validate("10.0.0.1"))
+        with mock.patch.object(ipv4, "try_validate", side_effect=Exception("ipv4 used")):
+            self.assertEqual("fe80::1", v.validate("fe80::1"))
+        # the errors of both validators, ipv4 first
+        for value, info in [
+                ("1.1.1.1", ["IP is not en private Network", "invalid ipv6 format"]),
+                ("2001:db8::1", ["IP format: [0-255].[0-255].[0-255].[0-255]", "IP is not en private Network"])]:
+            with self.assertRaises(ValidatorException) as e:
+                v.validate(value)
+            self.assertEqual(info, e.exception.info)
+
     def test_generalizedTime(self):
         from configvalidator.validators import GeneralizedTimeValidator
         v = GeneralizedTimeValidator()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+import copy
+import pickle
+import testutils
+from configvalidator import ConfigValidator
+from configvalidator.tools.basics import load_validator_form_dict
+from configvalidator.tools.view import DictView
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_view(self):
+        data = {"type": "int", "min": 0, "max": 10}
+        view = DictView(data, exclude=("type", "NOT-IN-DICT"))
+        self.assertEqual({"min": 0, "max": 10}, dict(view))
+        self.assertEqual(2, len(view))
+        self.assertFalse("type" in view)
+        self.assertTrue("min" in view)
+        with self.assertRaises(KeyError):
+            view["type"]
+        with self.assertRaises(TypeError):
+            view["min"] = 1
+        with self.assertRaises(AttributeError):
+            view.pop("min")
+        # the view shows changes of the dict
+        data["default"] = "1"
+        self.assertEqual("1", view["default"])
+        # nested views
+        self.assertEqual({"max": 10, "default": "1"}, dict(DictView(view, exclude=("min",))))
+        self.assertEqual(dict(view), dict(pickle.loads(pickle.dumps(view))))
+
+    def test_load_validator_form_dict(self):
+        option_dict = {"validator": {"type": "int", "max": 10}}
+        validator_class, validator_class_dict = load_validator_form_dict(option_dict)
+        self.assertEqual("int", validator_class.name)
+        self.assertEqual({"max": 10}, dict(validator_class_dict))
+        self.assertEqual({"validator": {"type": "int", "max": 10}}, option_dict)
+
+    def test_config_dict_not_changed(self):
+        config_dict = {
+            "SectionA": {
+                "option_A1": {"validator": "int"},
+                "option_A2": {
+                    "feature": "default",
+                    "validator": {"type": "int", "max": ("SectionA", "option_A1")},
+                    "depends": ("max",),
+                },
+                "option_A3": {
+                    "validator": {"type": "or", "validators": [{"type": "int", "max": 5}, "email"]},
+                },
+            },
+            "SectionB": {
+                "__feature__": "raw_section_input",
+                "validator": {"type": "int", "max": ("SectionA", "option_A1")},
+                "depends": {"max": ("SectionA", "option_A1")},
+            },
+        }
+        expected = copy.deepcopy(config_dict)
+        for _ in range(2):
+            cv = testutils.get_cp({"SectionA": {"option_A1": "10", "option_A2": "5", "option_A3": "3"}, "SectionB": {"b1": "1", "b2": "2"}})
+            res = cv.parse(config_dict)
+            self.assertEqual(5, res.SectionA.option_A2)
+            self.assertEqual({"b1": 1, "b2": 2}, res.SectionB)
+        self.assertEqual(expected, config_dict)
+
+    def test_non_json_values(self):
+        marker = object()
+        config_dict = {
+            "SectionA": {
+                "option_A1": {"validator": {"type": "item", "values": ["a", "b"]}, "marker": marker},
+            },
+        }
+        plan = ConfigValidator.compile(config_dict)
+        cv = testutils.get_cp({"SectionA": {"option_A1": "a"}})
+        self.assertEqual("a", cv.parse(plan).SectionA.option_A1)
+
+    def test_tuple_values(self):
+        config_dict = {
+            "SectionA": {
+                "a": {"validator": {"type": "or", "validators": ("url", "int")}},
+                "b": {"validator": {"type": "url", "scheme": ("http", "https"), "hostname": ("example.com",)}},
+                "c": {"validator": {"type": "email", "hostname": ("a.de",)}},
+                "d": {"validator": {"type": "item", "values": ("x", "y")}},
+                "e": {"validator": {"type": "items", "values": ("x", "y")}},
+                "f": {"validator": {"type": "str", "characters": ("a", "b"), "first": ("a",)}},
+            },
+        }
+        data = {"SectionA": {"a": "3", "b": "https://example.com/", "c": "me@a.de", "d": "y", "e": "x,y", "f": "ab"}}
+        res = testutils.get_cp(data).parse(config_dict)
+        self.assertEqual("y", res.SectionA.d)
+        self.assertEqual("ab", res.SectionA.f)
+
+    def test_or_kwargs_not_changed(self):
+        kwargs = {}
+        config_dict = {
+            "SectionA": {
+                "a": {"validator": "int"},
+                "b": {
+                    "validator": {"type": "or", "validators": ["int", "float"], "kwargs": kwargs, "max": ("SectionA", "a")},
+                    "depends": ["max"],
+                },
+            },
+        }
+        plan = ConfigValidator.compile(config_dict)
+        self.assertEqual("4", testutils.get_cp({"SectionA": {"a": "5", "b": "4"}}).parse(plan).SectionA.b)
+        self.assertEqual({}, kwargs)
+        with self.assertRaises(Exception):
+            testutils.get_cp({"SectionA": {"a": "3", "b": "4"}}).parse(plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
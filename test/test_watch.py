@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+from six.moves import configparser
+from configvalidator import ConfigValidator
+from configvalidator import ParserException
+from configvalidator.tools.parser import IniKey
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.main = os.path.join(self.tmp_dir, "main.ini")
+        self.sub = os.path.join(self.tmp_dir, "sub.ini")
+        self.mtime = 1000000000
+        self.write(self.sub, "[A]\nb = 1\n")
+        self.write(self.main, "[SectionA]\nvalue = 10\nsub = {sub}\n".format(sub=self.sub))
+        self.config_dict = {
+            "SectionA": {
+                "value": {"validator": {"type": "int", "max": 100}},
+                "sub": {"feature": "sub_ini", "config": {"A": {"b": "int"}}},
+            },
+        }
+        self.changes = []
+        self.errors = []
+        self.cv = ConfigValidator(configparser.RawConfigParser())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, path, content):
+        with open(path, "w") as f:
+            f.write(content)
+        # mtime resolution of the file system doesn't matter
+        self.mtime += 10
+        os.utime(path, (self.mtime, self.mtime))
+
+    def watch(self, **kwargs):
+        return self.cv.watch(
+            self.main,
+            self.config_dict,
+            on_change=lambda res, changed: self.changes.append((res, changed)),
+            on_error=self.errors.append,
+            **kwargs)
+
+    def test_reload(self):
+        watcher = self.watch(start=False, debounce=0)
+        first = watcher.result
+        self.assertEqual(10, first.SectionA.value)
+        self.assertEqual([self.main, self.sub], watcher.watched_files())
+        self.assertFalse(watcher.check())
+        self.write(self.main, "[SectionA]\nvalue = 20\nsub = {sub}\n".format(sub=self.sub))
+        self.assertTrue(watcher.check())
+        self.assertEqual(20, watcher.result.SectionA.value)
+        self.assertEqual(set([IniKey("SectionA", "value")]), self.changes[-1][1])
+        # the old result is not changed
+        self.assertEqual(10, first.SectionA.value)
+        # sub ini file
+        self.write(self.sub, "[A]\nb = 2\n")
+        self.assertTrue(watcher.check())
+        self.assertEqual(2, watcher.result.SectionA.sub.A.b)
+        self.assertEqual(set([IniKey("SectionA", "sub")]), self.changes[-1][1])
+
+    def test_keep_last_valid_result(self):
+        watcher = self.watch(start=False, debounce=0)
+        self.write(self.main, "[SectionA]\nvalue = 200\nsub = {sub}\n".format(sub=self.sub))
+        self.assertFalse(watcher.check())
+        self.assertEqual(10, watcher.result.SectionA.value)
+        self.assertEqual("error validating [SectionA]value: maximum: 100", str(watcher.error))
+        self.assertEqual([watcher.error], self.errors)
+        # no new parse until the file changes again
+        self.assertFalse(watcher.check())
+        self.assertEqual(1, len(self.errors))
+        self.write(self.main, "[SectionA]\nvalue = 30\nsub = {sub}\n".format(sub=self.sub))
+        self.assertTrue(watcher.check())
+        self.assertEqual(None, watcher.error)
+
+    def test_invalid_ini_file(self):
+        watcher = self.watch(start=False, debounce=0)
+        self.write(self.main, "[SectionA]\nvalue = 20\nvalue = 30\n")
+        self.assertFalse(watcher.check())
+        self.assertEqual(10, watcher.result.SectionA.value)
+        self.assertTrue(isinstance(watcher.error, configparser.Error))
+        self.assertEqual([watcher.error], self.errors)
+        self.assertFalse(watcher.check())
+        self.assertEqual(1, len(self.errors))
+        self.write(self.main, "[SectionA]\nvalue = 30\nsub = {sub}\n".format(sub=self.sub))
+        self.assertTrue(watcher.check())
+        self.assertEqual(30, watcher.result.SectionA.value)
+        self.assertEqual(None, watcher.error)
+
+    def test_invalid_ini_file_thread(self):
+        failed = threading.Event()
+        with self.cv.watch(self.main, self.config_dict, on_error=lambda e: failed.set(), interval=0.01, debounce=0) as watcher:
+            self.write(self.main, "value = 20\n")
+            self.assertTrue(failed.wait(5))
+            self.assertTrue(isinstance(watcher.error, configparser.MissingSectionHeaderError))
+            self.assertEqual(10, watcher.result.SectionA.value)
+
+    def test_debounce(self):
+        watcher = self.watch(start=False, debounce=60)
+        self.write(self.main, "[SectionA]\nvalue = 20\nsub = {sub}\n".format(sub=self.sub))
+        self.assertFalse(watcher.check())
+        watcher._pending_since -= 60
+        self.assertTrue(watcher.check())
+        self.assertEqual(20, watcher.result.SectionA.value)
+
+    def test_invalid_start(self):
+        self.write(self.main, "[SectionA]\nvalue = 200\n")
+        with self.assertRaises(ParserException):
+            self.watch()
+
+    def test_thread(self):
+        changed = threading.Event()
+
+        def on_change(res, keys):
+            if keys is not None:
+                changed.set()
+        with self.cv.watch(self.main, self.config_dict, on_change=on_change, interval=0.01, debounce=0) as watcher:
+            self.write(self.main, "[SectionA]\nvalue = 20\nsub = {sub}\n".format(sub=self.sub))
+            self.assertTrue(changed.wait(5))
+            self.assertEqual(20, watcher.result.SectionA.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
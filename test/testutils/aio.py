@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2015 by Jan-Hendrik Dolling.
+:license: Apache 2.0, see LICENSE for more details.
+
+async helpers (Python 3.5+ syntax), only imported by the tests if available
+"""
+
+import asyncio
+from configvalidator.validators import DefaultValidator, IntValidator
+
+
+def create_validators():
+    """register the validators ASYNC_WAITING and ASYNC_INT
+
+    ASYNC_WAITING only returns if *count* validations are running at the same time
+    """
+
+    class AsyncWaitingValidator(DefaultValidator):
+        name = "ASYNC_WAITING"
+        count = 3
+        timeout = 5
+        started = []
+        event = None
+
+        def validate(self, value):
+            raise AssertionError("sync validate must not be used")
+
+        async def avalidate(self, value):
+            cls = self.__class__
+            if cls.event is None:
+                cls.event = asyncio.Event()
+            cls.started.append(value)
+            if len(cls.started) >= cls.count:
+                cls.event.set()
+            await asyncio.wait_for(cls.event.wait(), cls.timeout)
+            return "async " + value
+
+    class AsyncIntValidator(IntValidator):
+        name = "ASYNC_INT"
+
+        async def avalidate(self, value):
+            await asyncio.sleep(0)
+            return self.validate(value)
+
+    return AsyncWaitingValidator, AsyncIntValidator
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()